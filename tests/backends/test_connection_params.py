@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import asyncpg
 
@@ -92,6 +92,24 @@ class TestConnectionParams(test.SimpleTestCase):
         except ImportError:
             self.skipTest("asyncpg not installed")
 
+    async def test_asyncpg_statement_cache_disabled(self):
+        with patch(
+            "tortoise.backends.asyncpg.client.asyncpg.create_pool", new=AsyncMock()
+        ) as asyncpg_connect:
+            await connections._init(
+                {
+                    "models": {
+                        "engine": "tortoise.backends.asyncpg",
+                        "credentials": {"database": "test", "statement_cache_size": 0},
+                    }
+                },
+                False,
+            )
+            client = connections.get("models")
+            await client.create_connection(with_db=True)
+            self.assertFalse(client.statement_cache.enabled)
+            self.assertEqual(asyncpg_connect.await_args.kwargs["statement_cache_size"], 0)
+
     async def test_psycopg_connection_params(self):
         try:
             with patch(
@@ -124,3 +142,55 @@ class TestConnectionParams(test.SimpleTestCase):
                 )
         except ImportError:
             self.skipTest("psycopg not installed")
+
+    async def test_psycopg_statement_cache_disabled(self):
+        try:
+            with patch(
+                "tortoise.backends.psycopg.client.PsycopgClient.create_pool", new=AsyncMock()
+            ) as patched_create_pool:
+                await connections._init(
+                    {
+                        "models": {
+                            "engine": "tortoise.backends.psycopg",
+                            "credentials": {
+                                "database": "test",
+                                "host": "127.0.0.1",
+                                "password": "foomip",
+                                "port": 5432,
+                                "user": "root",
+                                "statement_cache_size": 0,
+                            },
+                        }
+                    },
+                    False,
+                )
+                client = connections.get("models")
+                await client.create_connection(with_db=True)
+                self.assertFalse(client.statement_cache.enabled)
+                kwargs = patched_create_pool.await_args.kwargs
+                self.assertIsNone(kwargs["kwargs"]["prepare_threshold"])
+                self.assertNotIn("statement_cache_size", kwargs)
+                self.assertNotIn("configure", kwargs)
+        except ImportError:
+            self.skipTest("psycopg not installed")
+
+    async def test_psycopg_prepared_max(self):
+        try:
+            with patch(
+                "tortoise.backends.psycopg.client.PsycopgClient.create_pool", new=AsyncMock()
+            ) as patched_create_pool:
+                await connections._init(
+                    {
+                        "models": {
+                            "engine": "tortoise.backends.psycopg",
+                            "credentials": {"database": "test", "statement_cache_size": 20},
+                        }
+                    },
+                    False,
+                )
+                await connections.get("models").create_connection(with_db=True)
+                connection = Mock()
+                await patched_create_pool.await_args.kwargs["configure"](connection)
+                self.assertEqual(connection.prepared_max, 20)
+        except ImportError:
+            self.skipTest("psycopg not installed")
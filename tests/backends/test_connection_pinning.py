@@ -0,0 +1,123 @@
+from unittest.mock import patch
+
+from tortoise import connections
+from tortoise.backends.asyncpg import AsyncpgDBClient
+from tortoise.backends.base.client import PinnedPool
+from tortoise.contrib import test
+from tortoise.contrib.starlette import PinnedConnectionsMiddleware
+
+
+class FakeConnection:
+    async def fetch(self, query, *values):
+        return [{"query": query}]
+
+
+class FakePool:
+    """Stands in for an asyncpg pool, which counts the connections it hands out"""
+
+    def __init__(self) -> None:
+        self.acquired: list[FakeConnection] = []
+        self.released: list[FakeConnection] = []
+
+    async def acquire(self):
+        connection = FakeConnection()
+        self.acquired.append(connection)
+        return connection
+
+    async def release(self, connection):
+        self.released.append(connection)
+
+    def get_size(self):
+        return len(self.acquired)
+
+    def get_idle_size(self):
+        return len(self.released)
+
+
+async def create_pool(self, **kwargs):
+    return FakePool()
+
+
+class TestConnectionPinning(test.SimpleTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await connections._init(
+            {
+                "models": {
+                    "engine": "tortoise.backends.asyncpg",
+                    "credentials": {"database": "test", "statement_cache_size": 0},
+                }
+            },
+            False,
+        )
+        self.client = connections.get("models")
+
+    @patch.object(AsyncpgDBClient, "create_pool", create_pool)
+    async def test_pinned(self):
+        async with connections.pinned():
+            pinned = connections.get("models")
+            self.assertIsInstance(pinned._pool, PinnedPool)
+            # Nested blocks keep the outer pin
+            async with connections.pinned():
+                self.assertIs(connections.get("models"), pinned)
+            for _ in range(3):
+                await pinned.execute_query_dict("SELECT 1")
+            pool = self.client._pool
+            self.assertEqual(len(pool.acquired), 1)
+            self.assertEqual(pinned.pool_stats()["size"], 1)
+
+            # A query issued while the pinned connection is busy takes another one
+            async with pinned.acquire_connection() as connection:
+                self.assertIs(connection, pool.acquired[0])
+                await pinned.execute_query_dict("SELECT 2")
+            self.assertEqual(len(pool.acquired), 2)
+            self.assertEqual(pool.released, [pool.acquired[1]])
+        self.assertIs(connections.get("models"), self.client)
+        self.assertEqual(pool.released, pool.acquired[::-1])
+
+    @patch.object(AsyncpgDBClient, "create_pool", create_pool)
+    async def test_unpin_busy(self):
+        # A task spawned in the block may still use the connection when the block exits
+        async with connections.pinned():
+            pinned = connections.get("models")
+            busy = pinned.acquire_connection()
+            connection = await busy.__aenter__()
+        pool = self.client._pool
+        self.assertEqual(pool.released, [])
+        # The task keeps the pinned client, but no longer shares its connection
+        await pinned.execute_query_dict("SELECT 1")
+        self.assertEqual(len(pool.acquired), 2)
+        self.assertEqual(pool.released, [pool.acquired[1]])
+        await busy.__aexit__(None, None, None)
+        self.assertEqual(pool.released, [pool.acquired[1], connection])
+        await pinned.execute_query_dict("SELECT 2")
+        self.assertEqual(len(pool.acquired), 3)
+        self.assertEqual(pool.released[-1], pool.acquired[2])
+
+    async def test_lazy(self):
+        async with connections.pinned():
+            pass
+        self.assertIsNone(self.client._pool)
+
+    @patch.object(AsyncpgDBClient, "create_pool", create_pool)
+    async def test_middleware(self):
+        scopes: dict[str, object] = {}
+
+        async def app(scope, receive, send):
+            scopes[scope["type"]] = connections.get("models")
+
+        middleware = PinnedConnectionsMiddleware(app)
+        await middleware({"type": "http"}, None, None)
+        await middleware({"type": "websocket"}, None, None)
+        self.assertIsInstance(scopes["http"]._pool, PinnedPool)
+        self.assertIs(scopes["websocket"], self.client)
+
+
+class TestConnectionPinningSqlite(test.TestCase):
+    async def test_not_pooled(self):
+        # Transactions and clients without a pool keep their connection
+        client = connections.get("models")
+        async with connections.pinned():
+            self.assertIs(connections.get("models"), client)
+        self.assertIsNone(client._pinned())
+        self.assertIsNone(client._parent._pinned())
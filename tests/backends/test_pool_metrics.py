@@ -0,0 +1,142 @@
+import asyncio
+from unittest import TestCase
+
+from tortoise import connections
+from tortoise.backends.base.client import (
+    PoolListener,
+    PoolMetrics,
+    add_pool_listener,
+    remove_pool_listener,
+)
+from tortoise.backends.sqlite import SqliteClient
+from tortoise.contrib import test
+
+
+class Client:
+    """Stands in for a DB client, which the metrics only check the timeout errors of"""
+
+    _pool_timeout_errors = (asyncio.TimeoutError,)
+
+
+class Listener(PoolListener):
+    def __init__(self) -> None:
+        self.events: list[tuple[str, str]] = []
+
+    def on_acquire(self, client, wait):
+        self.events.append(("acquire", client.connection_name))
+
+    def on_release(self, client, held):
+        self.events.append(("release", client.connection_name))
+
+    def on_timeout(self, client, wait):
+        self.events.append(("timeout", client.connection_name))
+
+
+class TestPoolMetrics(TestCase):
+    def test_acquire_release(self):
+        metrics = PoolMetrics()
+        client = Client()
+        started = metrics.start_acquire()
+        self.assertEqual((metrics.waiting, metrics.in_use), (1, 0))
+        acquired_at = metrics.end_acquire(client, started)
+        self.assertEqual((metrics.waiting, metrics.in_use), (0, 1))
+        metrics.release(client, acquired_at)
+        stats = metrics.stats()
+        self.assertEqual(stats["in_use"], 0)
+        self.assertEqual(stats["acquired"], 1)
+        self.assertEqual(sum(stats["acquire_latency"].values()), 1)
+        self.assertEqual(list(stats["acquire_latency"])[-1], float("inf"))
+
+    def test_failures(self):
+        metrics = PoolMetrics()
+        client = Client()
+        metrics.end_acquire(client, metrics.start_acquire(), asyncio.TimeoutError())
+        metrics.end_acquire(client, metrics.start_acquire(), ConnectionError())
+        self.assertEqual(metrics.timeouts, 1)
+        self.assertEqual(metrics.acquired, 0)
+        self.assertEqual((metrics.waiting, metrics.in_use), (0, 0))
+
+    def test_histogram(self):
+        metrics = PoolMetrics()
+        client = Client()
+        metrics.end_acquire(client, metrics.start_acquire() - 0.02)
+        metrics.end_acquire(client, metrics.start_acquire() - 10)
+        latency = metrics.stats()["acquire_latency"]
+        self.assertEqual(latency[0.05], 1)
+        self.assertEqual(latency[float("inf")], 1)
+        metrics.reset_stats()
+        self.assertEqual(metrics.stats()["acquired"], 0)
+        self.assertEqual(metrics.in_use, 2)
+
+
+class TestClientPoolStats(test.SimpleTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.client = SqliteClient(file_path=":memory:", connection_name="metrics")
+        self.listener = Listener()
+        add_pool_listener(self.listener)
+
+    async def asyncTearDown(self):
+        remove_pool_listener(self.listener)
+        await self.client.close()
+        await super().asyncTearDown()
+
+    async def test_single_connection(self):
+        self.assertEqual(self.client.pool_stats()["size"], 0)
+        await self.client.execute_query("SELECT 1")
+        stats = self.client.pool_stats()
+        self.assertEqual((stats["size"], stats["idle"], stats["max_size"]), (1, 1, 1))
+        self.assertEqual(stats["acquired"], 1)
+        self.assertEqual(self.listener.events, [("acquire", "metrics"), ("release", "metrics")])
+
+    async def test_waiting(self):
+        async with self.client.acquire_connection():
+            task = asyncio.create_task(self.client.execute_query("SELECT 1"))
+            await asyncio.sleep(0)
+            stats = self.client.pool_stats()
+            self.assertEqual((stats["in_use"], stats["idle"], stats["waiting"]), (1, 0, 1))
+            self.assertEqual(self.client.outstanding, 2)
+        await task
+        self.assertEqual(self.client.outstanding, 0)
+        self.assertEqual(self.client.pool_stats()["acquired"], 2)
+
+    async def test_transaction(self):
+        async with self.client._in_transaction() as conn:
+            self.assertIsNone(conn.pool_metrics)
+            await conn.execute_query("SELECT 1")
+            self.assertEqual(conn.pool_stats(), self.client.pool_stats())
+        self.assertEqual(self.client.pool_stats()["in_use"], 0)
+
+    async def test_remove_listener(self):
+        remove_pool_listener(self.listener)
+        await self.client.execute_query("SELECT 1")
+        self.assertEqual(self.listener.events, [])
+
+    async def test_failing_listener(self):
+        class Failing(PoolListener):
+            def on_acquire(self, client, wait):
+                raise RuntimeError("acquire")
+
+            def on_release(self, client, held):
+                raise RuntimeError("release")
+
+        failing = Failing()
+        add_pool_listener(failing)
+        try:
+            with self.assertLogs("tortoise.db_client", "ERROR") as logs:
+                self.assertEqual(await self.client.execute_query_dict("SELECT 1"), [{"1": 1}])
+        finally:
+            remove_pool_listener(failing)
+        self.assertEqual(len(logs.records), 2)
+        self.assertEqual(self.client.pool_stats()["in_use"], 0)
+        # The other listeners are still notified
+        self.assertEqual(self.listener.events, [("acquire", "metrics"), ("release", "metrics")])
+
+
+class TestPooledClientStats(test.TestCase):
+    @test.requireCapability(dialect="postgres")
+    async def test_postgres_pool(self):
+        stats = connections.get("models").pool_stats()
+        self.assertGreaterEqual(stats["size"], 1)
+        self.assertGreaterEqual(stats["in_use"], 1)
+        self.assertLessEqual(stats["size"], stats["max_size"])
@@ -0,0 +1,154 @@
+from unittest.mock import Mock
+
+from tortoise.backends.base.client import (
+    QueryListener,
+    SlowQueryLogger,
+    add_query_listener,
+    instrument_copy,
+    remove_query_listener,
+)
+from tortoise.backends.sqlite import SqliteClient
+from tortoise.contrib import test
+from tortoise.exceptions import OperationalError
+
+
+class Listener(QueryListener):
+    def __init__(self) -> None:
+        self.before: list = []
+        self.after: list = []
+
+    def before_query(self, event):
+        self.before.append((event.method, event.duration))
+
+    def after_query(self, event):
+        self.after.append(event)
+
+
+class TestQueryEvents(test.SimpleTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.client = SqliteClient(file_path=":memory:", connection_name="events")
+        await self.client.execute_script("CREATE TABLE t (id INTEGER PRIMARY KEY, v INT)")
+        self.listener = Listener()
+        add_query_listener(self.listener)
+
+    async def asyncTearDown(self):
+        remove_query_listener(self.listener)
+        await self.client.close()
+        await super().asyncTearDown()
+
+    async def test_events(self):
+        await self.client.execute_insert("INSERT INTO t (v) VALUES (?)", [1])
+        await self.client.execute_many("INSERT INTO t (v) VALUES (?)", [[2], [3]])
+        await self.client.execute_query("SELECT * FROM t WHERE v > ?", [1])
+        await self.client.execute_query_dict("SELECT * FROM t")
+        self.assertEqual(
+            self.listener.before,
+            [
+                ("execute_insert", None),
+                ("execute_many", None),
+                ("execute_query", None),
+                ("execute_query_dict", None),
+            ],
+        )
+        self.assertEqual(
+            [(e.method, e.params, e.rowcount) for e in self.listener.after],
+            [
+                ("execute_insert", 1, 1),
+                ("execute_many", 2, 2),
+                ("execute_query", 1, 2),
+                ("execute_query_dict", 0, 3),
+            ],
+        )
+        event = self.listener.after[2]
+        self.assertEqual(event.sql, "SELECT * FROM t WHERE v > ?")
+        self.assertEqual(event.connection_name, "events")
+        self.assertFalse(event.in_transaction)
+        self.assertGreaterEqual(event.duration, 0)
+        self.assertIsNone(event.error)
+
+    async def test_error(self):
+        with self.assertRaises(OperationalError):
+            await self.client.execute_query("SELECT * FROM missing")
+        event = self.listener.after[0]
+        self.assertIsInstance(event.error, OperationalError)
+        self.assertIsNone(event.rowcount)
+        self.assertIsNotNone(event.duration)
+
+    async def test_transaction(self):
+        async with self.client._in_transaction() as conn:
+            await conn.execute_query("SELECT 1")
+            await conn.execute_many("INSERT INTO t (v) VALUES (?)", [[1]])
+        self.assertEqual(
+            [(e.method, e.in_transaction) for e in self.listener.after],
+            [("execute_query", True), ("execute_many", True)],
+        )
+
+    async def test_stream(self):
+        await self.client.execute_many("INSERT INTO t (v) VALUES (?)", [[1], [2], [3]])
+        batches = self.client.execute_query_stream("SELECT * FROM t WHERE v > ?", [0], 2)
+        self.assertEqual([len(rows) async for rows in batches], [2, 1])
+        event = self.listener.after[-1]
+        self.assertEqual(
+            (event.method, event.params, event.rowcount), ("execute_query_stream", 1, 3)
+        )
+        self.assertIsNone(event.error)
+
+    async def test_stream_closed_early(self):
+        await self.client.execute_many("INSERT INTO t (v) VALUES (?)", [[1], [2], [3]])
+        batches = self.client.execute_query_stream("SELECT * FROM t", None, 1)
+        await batches.__anext__()
+        await batches.aclose()
+        event = self.listener.after[-1]
+        self.assertEqual(event.method, "execute_query_stream")
+        self.assertIsNone(event.rowcount)
+        self.assertIsNone(event.error)
+
+    async def test_copy(self):
+        class CopyClient(SqliteClient):
+            @instrument_copy
+            async def execute_copy(self, table, columns, values):
+                return len(values)
+
+        client = CopyClient(file_path=":memory:", connection_name="copy")
+        self.assertEqual(await client.execute_copy("t", ["id", "v"], [[1, 2], [2, 3]]), 2)
+        event = self.listener.after[0]
+        self.assertEqual(
+            (event.method, event.sql, event.params, event.rowcount),
+            ("execute_copy", "COPY t (id, v)", 4, 2),
+        )
+
+    async def test_remove_listener(self):
+        remove_query_listener(self.listener)
+        await self.client.execute_query("SELECT 1")
+        self.assertEqual(self.listener.after, [])
+
+
+class TestSlowQueryLogger(test.SimpleTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.client = SqliteClient(file_path=":memory:", connection_name="slow")
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await super().asyncTearDown()
+
+    async def run_query(self, listener: SlowQueryLogger) -> None:
+        add_query_listener(listener)
+        try:
+            await self.client.execute_query("SELECT 1")
+        finally:
+            remove_query_listener(listener)
+
+    async def test_logs_slow_queries(self):
+        with self.assertLogs("tortoise.slow_query", "WARNING") as logs:
+            await self.run_query(SlowQueryLogger(threshold=0))
+        self.assertIn("1 rows, slow: SELECT 1", logs.output[0])
+
+    async def test_threshold_and_sampling(self):
+        logger = Mock()
+        await self.run_query(SlowQueryLogger(threshold=60, logger=logger))
+        await self.run_query(SlowQueryLogger(threshold=0, sample_rate=0, logger=logger))
+        logger.warning.assert_not_called()
+        await self.run_query(SlowQueryLogger(threshold=0, sample_rate=1, logger=logger))
+        logger.warning.assert_called_once()
@@ -0,0 +1,62 @@
+import asyncio
+import os
+import sqlite3
+import tempfile
+
+from tortoise.backends.base.config_generator import expand_db_url
+from tortoise.backends.sqlite import SqliteClient
+from tortoise.contrib import test
+
+
+class TestSqliteReadPool(test.SimpleTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.client = SqliteClient(
+            file_path=os.path.join(self.tmpdir.name, "db.sqlite3"),
+            connection_name="read_pool",
+            read_pool_size=2,
+        )
+        await self.client.execute_script("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        self.tmpdir.cleanup()
+        await super().asyncTearDown()
+
+    def test_config(self):
+        self.assertEqual(
+            expand_db_url("sqlite://db.sqlite3?read_pool_size=4")["credentials"]["read_pool_size"],
+            4,
+        )
+        # The connections of an in-memory DB can't share it
+        self.assertEqual(
+            SqliteClient(":memory:", connection_name="m", read_pool_size=4).read_pool_size, 0
+        )
+
+    async def test_reads(self):
+        await self.client.execute_insert("INSERT INTO t (v) VALUES (?)", ["a"])
+        self.assertEqual(self.client.pool_stats()["size"], 3)
+        self.assertEqual(await self.client.execute_query_dict("SELECT v FROM t"), [{"v": "a"}])
+        # The read connections can't write
+        with self.assertRaises(sqlite3.OperationalError):
+            async with self.client._acquire_read_connection("SELECT 1") as connection:
+                await connection.execute("INSERT INTO t (v) VALUES ('b')")
+
+        async with self.client._in_transaction() as connection:
+            await connection.execute_insert("INSERT INTO t (v) VALUES (?)", ["b"])
+            # The transaction reads its own writes, the others read the last commit
+            # without waiting for the transaction
+            self.assertEqual(len(await connection.execute_query_dict("SELECT v FROM t")), 2)
+            self.assertEqual(
+                await asyncio.wait_for(self.client.execute_query_dict("SELECT v FROM t"), 1),
+                [{"v": "a"}],
+            )
+        self.assertEqual(len(await self.client.execute_query_dict("SELECT v FROM t")), 2)
+
+    async def test_concurrent_reads(self):
+        results = await asyncio.gather(
+            *(self.client.execute_query("SELECT ? AS v", [i]) for i in range(5))
+        )
+        self.assertEqual([rows[0]["v"] for _, rows in results], list(range(5)))
+        self.assertEqual(self.client.pool_stats()["in_use"], 0)
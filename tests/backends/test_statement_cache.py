@@ -0,0 +1,114 @@
+from unittest import TestCase
+from unittest.mock import AsyncMock, Mock
+
+from tortoise import connections
+from tortoise.backends.asyncpg import AsyncpgDBClient
+from tortoise.backends.base.client import StatementCache
+from tortoise.contrib import test
+
+
+class Conn:
+    """Stands in for a driver connection, which the cache only holds weak references to"""
+
+
+class TestStatementCache(TestCase):
+    def test_disabled(self):
+        self.assertFalse(StatementCache().enabled)
+        self.assertTrue(StatementCache(10).enabled)
+
+    def test_hit_miss(self):
+        cache = StatementCache(10)
+        conn = Conn()
+        self.assertIsNone(cache.get(conn, "SELECT 1"))
+        cache.put(conn, "SELECT 1", "stmt1")
+        self.assertEqual(cache.get(conn, "SELECT 1"), "stmt1")
+        # Statements are per connection
+        self.assertIsNone(cache.get(Conn(), "SELECT 1"))
+        self.assertEqual(
+            cache.stats(),
+            {
+                "size": 1,
+                "max_size": 10,
+                "hits": 1,
+                "misses": 2,
+                "evictions": 0,
+                "invalidations": 0,
+            },
+        )
+
+    def test_lru_eviction(self):
+        cache = StatementCache(2)
+        conn = Conn()
+        self.assertIsNone(cache.put(conn, "a", 1))
+        self.assertIsNone(cache.put(conn, "b", 2))
+        cache.get(conn, "a")
+        self.assertEqual(cache.put(conn, "c", 3), 2)
+        self.assertIsNone(cache.get(conn, "b"))
+        self.assertEqual(cache.get(conn, "a"), 1)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_invalidate(self):
+        cache = StatementCache(10)
+        conn1, conn2 = Conn(), Conn()
+        cache.put(conn1, "a", 1)
+        cache.put(conn1, "b", 2)
+        cache.put(conn2, "a", 3)
+
+        cache.invalidate(conn1, "a")
+        self.assertIsNone(cache.get(conn1, "a"))
+        self.assertEqual(cache.get(conn2, "a"), 3)
+        cache.invalidate(conn1, "missing")
+        self.assertEqual(cache.invalidations, 1)
+
+        cache.invalidate()
+        self.assertEqual(cache.stats()["size"], 0)
+        self.assertEqual(cache.invalidations, 3)
+
+    def test_closed_connection_is_dropped(self):
+        cache = StatementCache(10)
+        conn = Conn()
+        cache.put(conn, "a", 1)
+        del conn
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_reset_stats(self):
+        cache = StatementCache(1)
+        conn = Conn()
+        cache.get(conn, "a")
+        cache.put(conn, "a", 1)
+        cache.put(conn, "b", 2)
+        cache.reset_stats()
+        self.assertEqual(cache.stats()["misses"], 0)
+        self.assertEqual(cache.stats()["evictions"], 0)
+        self.assertEqual(cache.stats()["size"], 1)
+
+
+class TestClientStatementCache(test.TestCase):
+    async def test_shared_with_transaction(self):
+        client = connections.get("models")
+        async with client._in_transaction() as conn:
+            self.assertIs(conn.statement_cache, client.statement_cache)
+
+    @test.requireCapability(dialect="postgres")
+    async def test_postgres_counts_hits(self):
+        client = connections.get("models")
+        client.statement_cache.reset_stats()
+        for _ in range(3):
+            await client.execute_query("SELECT 1 AS one")
+        stats = client.statement_cache.stats()
+        self.assertGreaterEqual(stats["hits"], 1)
+        self.assertGreaterEqual(stats["misses"], 1)
+
+
+class TestAsyncpgStatementCache(test.SimpleTestCase):
+    async def test_evicted_statements_closed(self):
+        client = AsyncpgDBClient(connection_name="evictions", statement_cache_size=1)
+        connection = Mock()
+        connection.prepare = AsyncMock(
+            side_effect=lambda query: Mock(get_name=Mock(return_value=f"stmt_{query}"))
+        )
+        connection.execute = AsyncMock()
+        await client._prepare(connection, connection, "a")
+        connection.execute.assert_not_awaited()
+        await client._prepare(connection, connection, "b")
+        connection.execute.assert_awaited_once_with('DEALLOCATE "stmt_a"')
@@ -36,3 +36,14 @@ def test_filter_many_filters(benchmark, many_fields_benchmark_dataset):
             ).limit(5)
 
         loop.run_until_complete(_bench())
+
+
+def test_filter_all_many_fields(benchmark, many_fields_benchmark_dataset):
+    loop = asyncio.get_event_loop()
+
+    @benchmark
+    def bench():
+        async def _bench():
+            await BenchmarkManyFields.all()
+
+        loop.run_until_complete(_bench())
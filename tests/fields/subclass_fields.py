@@ -74,3 +74,24 @@ class IntEnumField(IntField):
             return self.enum_type(value)
         except ValueError:
             raise ValueError(f"Database value {value} does not exist on Enum {self.enum_type}.")
+
+
+class CommaSeparatedField(CharField):
+    """
+    An example extension to CharField that stores lists of strings
+    comma separated in the DB, which can be changed in place.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(255, **kwargs)
+
+    def to_db_value(self, value, instance):
+        if value is not None:
+            value = ",".join(value)
+        self.validate(value)
+        return value
+
+    def to_python_value(self, value):
+        if value is None or isinstance(value, list):
+            return value
+        return value.split(",") if value else []
@@ -1,6 +1,6 @@
 from enum import Enum, IntEnum
 
-from tests.fields.subclass_fields import EnumField, IntEnumField
+from tests.fields.subclass_fields import CommaSeparatedField, EnumField, IntEnumField
 from tortoise import fields
 from tortoise.models import Model
 
@@ -18,6 +18,7 @@ class RaceParticipant(Model):
     first_name = fields.CharField(max_length=64)
     place = EnumField(RacePlacingEnum, default=RacePlacingEnum.DNF)
     predicted_place = EnumField(RacePlacingEnum, null=True)
+    sponsors = CommaSeparatedField(null=True)
 
 
 class ContactTypeEnum(IntEnum):
@@ -76,6 +76,18 @@ class TestEnumField(test.IsolatedTestCase):
         self.assertIn(test3, no_predictions)
         self.assertIn(test4, no_predictions)
 
+    async def test_changed_in_place(self):
+        """Asserts that values changed in place are saved."""
+        test1, _, _, _ = await create_participants()
+        test1.sponsors = ["a"]
+        await test1.save()
+        participant = await RaceParticipant.get(id=test1.id)
+        self.assertEqual(participant.changed_fields, set())
+        participant.sponsors.append("b")
+        self.assertEqual(participant.changed_fields, {"sponsors"})
+        await participant.save()
+        self.assertEqual((await RaceParticipant.get(id=test1.id)).sponsors, ["a", "b"])
+
     async def test_update_with_int_enum_value(self):
         contact = await Contact.create()
         contact.type = ContactTypeEnum.home
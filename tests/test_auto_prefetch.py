@@ -0,0 +1,123 @@
+import gc
+import pickle
+from unittest.mock import patch
+
+from tests.testmodels import Address, Event, Team, Tournament
+from tests.utils.query_counter import QueryCounter
+from tortoise.auto_prefetch import AUTO_PREFETCH
+from tortoise.backends.base.client import add_query_listener, remove_query_listener
+from tortoise.contrib import test
+from tortoise.exceptions import NoValuesFetched, TransactionManagementError
+from tortoise.transactions import in_transaction
+
+
+class TestAutoPrefetch(test.TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        tournaments = [await Tournament.create(name=str(i)) for i in range(2)]
+        teams = [await Team.create(name=str(i)) for i in range(2)]
+        for i in range(4):
+            event = await Event.create(name=f"event{i}", tournament=tournaments[i % 2])
+            await event.participants.add(*teams[: i % 2 + 1])
+            if i % 2:
+                await Address.create(city="city", street=str(i), event=event)
+        AUTO_PREFETCH.reset_stats()
+        self.counter = QueryCounter()
+        add_query_listener(self.counter)
+
+    async def asyncTearDown(self):
+        remove_query_listener(self.counter)
+        AUTO_PREFETCH.enabled = False
+        await super().asyncTearDown()
+
+    async def test_fk(self):
+        events = await Event.all().auto_prefetch()
+        names = [(await event.tournament).name for event in events]
+        self.assertEqual(names, ["0", "1", "0", "1"])
+        self.assertEqual(len(self.counter.queries), 2)
+        self.assertEqual(AUTO_PREFETCH.stats(), {"enabled": False, "prefetches": 1, "absorbed": 3})
+
+    async def test_absorbed_reads(self):
+        events = await Event.all().auto_prefetch()
+        await events[0].tournament
+        await events[0].tournament
+        self.assertEqual(AUTO_PREFETCH.stats(), {"enabled": False, "prefetches": 1, "absorbed": 0})
+        await events[2].tournament
+        await events[2].tournament
+        self.assertEqual(AUTO_PREFETCH.absorbed, 1)
+        events[3].tournament
+        self.assertEqual(AUTO_PREFETCH.absorbed, 2)
+
+    async def test_weak_siblings(self):
+        events = await Event.all().auto_prefetch()
+        group = events[0]._siblings
+        event = events[1]
+        del events
+        gc.collect()
+        self.assertEqual(group.instances, [event])
+        self.assertEqual((await event.tournament).name, "1")
+        self.assertEqual(len(self.counter.queries), 2)
+
+    async def test_reverse_fk_and_m2m(self):
+        tournaments = await Tournament.all().order_by("name").auto_prefetch()
+        events = [[e.name async for e in tournament.events] for tournament in tournaments]
+        self.assertEqual(events, [["event0", "event2"], ["event1", "event3"]])
+        self.assertEqual(len(tournaments[1].events), 2)
+        self.assertEqual(len(self.counter.queries), 2)
+
+        events = await Event.all().auto_prefetch()
+        participants = [len(await event.participants) for event in events]
+        self.assertEqual(participants, [1, 2, 1, 2])
+        self.assertEqual(len(self.counter.queries), 4)
+
+    async def test_reverse_o2o(self):
+        events = await Event.all().auto_prefetch()
+        addresses = [await event.address for event in events[:2]]
+        self.assertIsNone(addresses[0])
+        self.assertEqual(addresses[1].street, "1")
+        self.assertEqual(events[3].address.street, "3")
+        self.assertEqual(len(self.counter.queries), 2)
+
+    async def test_global_setting(self):
+        AUTO_PREFETCH.enabled = True
+        for event in await Event.all():
+            await event.tournament
+        self.assertEqual(len(self.counter.queries), 2)
+        for event in await Event.all().auto_prefetch(False):
+            await event.tournament
+        self.assertEqual(len(self.counter.queries), 7)
+
+    async def test_disabled(self):
+        events = await Event.all()
+        for event in events:
+            await event.tournament
+        self.assertEqual(len(self.counter.queries), 5)
+        with self.assertRaises(NoValuesFetched):
+            len((await Tournament.first()).events)
+        self.assertEqual(AUTO_PREFETCH.prefetches, 0)
+
+    async def test_single_object(self):
+        event = await Event.first().auto_prefetch()
+        self.assertIsNone(event._siblings)
+        await event.tournament
+        self.assertEqual(len(self.counter.queries), 2)
+
+    async def test_pickle(self):
+        events = await Event.all().auto_prefetch()
+        event = pickle.loads(pickle.dumps(events[0]))
+        self.assertIsNone(event._siblings)
+        self.assertEqual(event.name, "event0")
+
+
+class TestAutoPrefetchTransaction(test.TruncationTestCase):
+    async def test_after_transaction(self):
+        tournament = await Tournament.create(name="t")
+        for i in range(2):
+            await Event.create(name=str(i), tournament=tournament)
+        async with in_transaction() as connection:
+            events = await Event.all().auto_prefetch()
+        # The transaction is over, the prefetch runs on the client of the model
+        error = TransactionManagementError("Transaction already finalised")
+        with patch.object(connection, "execute_query", side_effect=error):
+            names = [(await event.tournament).name for event in events]
+        self.assertEqual(names, ["t", "t"])
@@ -1,9 +1,12 @@
 from uuid import UUID, uuid4
 
-from tests.testmodels import UniqueName, UUIDPkModel
+from tests.testmodels import Event, Tournament, UniqueName, UUIDPkModel
+from tests.utils.query_counter import QueryCounter
+from tortoise import connections
+from tortoise.backends.base.client import add_query_listener, remove_query_listener
 from tortoise.contrib import test
 from tortoise.contrib.test.condition import NotEQ
-from tortoise.exceptions import IntegrityError
+from tortoise.exceptions import IntegrityError, UnSupportedError
 from tortoise.transactions import in_transaction
 
 
@@ -163,3 +166,103 @@ class TestBulk(test.TruncationTestCase):
         await UniqueName.bulk_create([name1, name2], ignore_conflicts=True)
         with self.assertRaises(IntegrityError):
             await UniqueName.bulk_create([name1, name2])
+
+    @test.requireCapability(support_returning=True, dialect=NotEQ("mssql"))
+    async def test_bulk_create_return_pks(self):
+        objs = [UniqueName(name=f"name{i}") for i in range(10)]
+        await UniqueName.bulk_create(objs + [UniqueName(id=10**6, name="custom")])
+        self.assertEqual(
+            [(obj.id, obj.name) for obj in objs],
+            await UniqueName.exclude(name="custom").order_by("id").values_list("id", "name"),
+        )
+        self.assertTrue(all(obj._saved_in_db for obj in objs))
+
+    @test.requireCapability(support_returning=True, dialect=NotEQ("mssql"))
+    async def test_bulk_create_return_pks_multi_row(self):
+        objs = [UniqueName(name=f"name{i}") for i in range(10)]
+        counter = QueryCounter()
+        add_query_listener(counter)
+        try:
+            await UniqueName.bulk_create(objs)
+        finally:
+            remove_query_listener(counter)
+        self.assertEqual(len(counter.queries), 1)
+        self.assertEqual(
+            [(obj.id, obj.name) for obj in objs],
+            await UniqueName.all().order_by("id").values_list("id", "name"),
+        )
+
+    @test.requireCapability(support_returning=True, dialect=NotEQ("mssql"))
+    async def test_bulk_create_return_pks_fk(self):
+        tournaments = [Tournament(name=f"tournament{i}") for i in range(3)]
+        await Tournament.bulk_create(tournaments)
+        await Event.bulk_create(
+            [Event(name=f"event{i}", tournament=t) for i, t in enumerate(tournaments)]
+        )
+        events = await Event.all().order_by("name").values_list("tournament__name", flat=True)
+        self.assertEqual(events, [f"tournament{i}" for i in range(3)])
+
+    async def test_bulk_create_split_by_max_query_params(self):
+        db = connections.get("models")
+        executor = db.executor_class(model=UniqueName, db=db)
+        rows = executor._bulk_insert_rows(len(executor.regular_columns))
+        objs = [UniqueName(name=str(i)) for i in range(rows + 1)]
+        await UniqueName.bulk_create(objs)
+        self.assertEqual(await UniqueName.all().count(), rows + 1)
+        if db.capabilities.support_returning:
+            self.assertEqual(len({obj.id for obj in objs}), rows + 1)
+
+    @test.requireCapability(dialect=NotEQ("mssql"))
+    async def test_bulk_create_split_by_max_query_params_fail(self):
+        db = connections.get("models")
+        executor = db.executor_class(model=UniqueName, db=db)
+        rows = executor._bulk_insert_rows(len(executor.regular_columns))
+        with self.assertRaises(IntegrityError):
+            # The duplicate is in the second statement, the first one has to be rolled back
+            await UniqueName.bulk_create(
+                [UniqueName(name=str(i)) for i in range(rows)] + [UniqueName(name="0")]
+            )
+        self.assertEqual(await UniqueName.all().count(), 0)
+
+    @test.requireCapability(dialect="postgres")
+    async def test_bulk_create_copy(self):
+        await UniqueName.bulk_create(
+            [UniqueName(name=f"name{i}") for i in range(100)], method="copy", batch_size=30
+        )
+        all_ = await UniqueName.all().order_by("id").values_list("name", flat=True)
+        self.assertEqual(all_, [f"name{i}" for i in range(100)])
+
+    @test.requireCapability(dialect="postgres")
+    async def test_bulk_create_copy_return_pks(self):
+        objs = [UniqueName(name=f"name{i}") for i in range(10)]
+        await UniqueName.bulk_create(objs, method="copy", return_pks=True)
+        self.assertEqual(
+            [(obj.id, obj.name) for obj in objs],
+            await UniqueName.all().order_by("id").values_list("id", "name"),
+        )
+
+    @test.requireCapability(dialect="postgres", supports_transactions=True)
+    async def test_bulk_create_copy_in_transaction(self):
+        async with in_transaction():
+            objs = [UniqueName(name=f"name{i}") for i in range(10)]
+            await UniqueName.bulk_create(objs, method="copy", return_pks=True)
+            await UniqueName.bulk_create(
+                [UniqueName(name="other"), UniqueName(id=1000)], method="copy"
+            )
+        self.assertEqual(await UniqueName.all().count(), 12)
+
+    @test.requireCapability(dialect="postgres")
+    async def test_bulk_create_copy_uuidpk(self):
+        await UUIDPkModel.bulk_create([UUIDPkModel() for _ in range(10)], method="copy")
+        self.assertEqual(await UUIDPkModel.all().count(), 10)
+
+    @test.requireCapability(dialect=NotEQ("postgres"))
+    async def test_bulk_create_copy_unsupported(self):
+        with self.assertRaises(UnSupportedError):
+            await UniqueName.bulk_create([UniqueName()], method="copy")
+
+    async def test_bulk_create_copy_params(self):
+        with self.assertRaisesRegex(ValueError, "method copy can't be used"):
+            await UniqueName.bulk_create([UniqueName()], ignore_conflicts=True, method="copy")
+        with self.assertRaisesRegex(ValueError, "Unknown bulk create method"):
+            await UniqueName.bulk_create([UniqueName()], method="upsert")
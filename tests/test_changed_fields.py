@@ -0,0 +1,77 @@
+from tests.testmodels import Event, JSONFields, Tournament
+from tests.utils.query_counter import QueryCounter
+from tortoise.backends.base.client import add_query_listener, remove_query_listener
+from tortoise.contrib import test
+from tortoise.expressions import F
+
+
+class TestChangedFields(test.TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.tournament = await Tournament.create(name="t", desc="d")
+        self.counter = QueryCounter()
+        add_query_listener(self.counter)
+
+    async def asyncTearDown(self):
+        remove_query_listener(self.counter)
+        await super().asyncTearDown()
+
+    async def test_save(self):
+        self.assertEqual(Tournament(name="new").changed_fields, {"name", "desc", "created"})
+        self.assertEqual(self.tournament.changed_fields, set())
+        tournament = await Tournament.get(pk=self.tournament.pk)
+        self.counter.queries.clear()
+        await tournament.save()
+        self.assertEqual(self.counter.queries, [])
+
+        tournament.name = "changed"
+        self.assertEqual(tournament.changed_fields, {"name"})
+        await tournament.save()
+        self.assertEqual(len(self.counter.queries), 1)
+        self.assertNotIn('"desc"', self.counter.queries[0])
+        self.assertEqual(tournament.changed_fields, set())
+        self.assertEqual((await Tournament.get(pk=tournament.pk)).name, "changed")
+
+        # Explicit update_fields leave the other changes to be saved
+        tournament.name = "name"
+        tournament.desc = "desc"
+        await tournament.save(update_fields=["desc"])
+        self.assertEqual(tournament.changed_fields, {"name"})
+        await tournament.refresh_from_db()
+        self.assertEqual((tournament.name, tournament.changed_fields), ("changed", set()))
+
+    async def test_relations_and_expressions(self):
+        other = await Tournament.create(name="other")
+        event = await Event.create(name="e", tournament=self.tournament)
+        event = await Event.get(pk=event.pk)
+        event.tournament = other
+        self.assertEqual(event.changed_fields, {"tournament_id"})
+        await event.save()
+        self.assertEqual((await Event.get(pk=event.pk)).tournament_id, other.pk)
+
+        tournament = await Tournament.get(pk=self.tournament.pk)
+        tournament.desc = F("name")
+        await tournament.save()
+        await tournament.refresh_from_db()
+        self.assertEqual(tournament.desc, "t")
+        clone = tournament.clone(pk=100)
+        self.assertEqual(tournament.changed_fields, set())
+        await clone.save()
+        self.assertEqual(clone.changed_fields, set())
+
+    async def test_mutable(self):
+        obj = await JSONFields.create(data={"a": [1]})
+        self.assertEqual(obj.changed_fields, set())
+        obj.data["a"].append(2)
+        self.assertEqual(obj.changed_fields, {"data"})
+        await obj.save()
+        self.assertEqual(obj.changed_fields, set())
+
+        obj = await JSONFields.get(pk=obj.pk)
+        self.assertEqual(obj.changed_fields, set())
+        obj.data_null = {"b": 1}
+        obj.data["a"].append(3)
+        self.assertEqual(obj.changed_fields, {"data", "data_null"})
+        await obj.save()
+        obj = await JSONFields.get(pk=obj.pk)
+        self.assertEqual((obj.data, obj.data_null), ({"a": [1, 2, 3]}, {"b": 1}))
@@ -0,0 +1,81 @@
+import gc
+
+import tortoise
+from tests.testmodels import Event, Team, Tournament
+from tortoise.contrib import test
+from tortoise.identity import current_session
+
+
+class TestSession(test.TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.tournament = await Tournament.create(name="t")
+        self.teams = [await Team.create(name=f"team{i}") for i in range(2)]
+        for i in range(3):
+            event = await Event.create(name=f"e{i}", tournament=self.tournament)
+            await event.participants.add(*self.teams)
+
+    async def test_queries(self):
+        self.assertIsNone(current_session())
+        with tortoise.session() as session:
+            self.assertIs(current_session(), session)
+            first = await Tournament.get(pk=self.tournament.pk)
+            second = await Tournament.filter(name="t").first()
+            events = await Event.all().select_related("tournament")
+            self.assertIs(first, second)
+            self.assertTrue(all(event.tournament is first for event in events))
+            self.assertEqual(session.reused, 4)
+            # Instances in the session are not refreshed by queries
+            first.name = "changed"
+            self.assertEqual((await Tournament.get(pk=self.tournament.pk)).name, "changed")
+            await first.refresh_from_db()
+            self.assertEqual(first.name, "t")
+        self.assertIsNone(current_session())
+        self.assertIsNot(await Tournament.first(), await Tournament.first())
+
+    async def test_prefetch(self):
+        events = await Event.all().prefetch_related("participants", "tournament")
+        # Objects related to many instances of one prefetch are built once
+        self.assertIs(events[0].participants[0], events[1].participants[0])
+        self.assertIsNot(events[0].tournament, await Tournament.first())
+        with tortoise.session():
+            events = await Event.all().prefetch_related("participants", "tournament")
+            teams = await Team.all().prefetch_related("events")
+            self.assertIs(events[0].tournament, await Tournament.first())
+            self.assertIs(teams[0].events[0], events[0])
+            self.assertIs(events[0].participants[0], teams[0])
+
+    async def test_weak_references(self):
+        with tortoise.session() as session:
+            tournament = await Tournament.create(name="new")
+            self.assertIs(await Tournament.get(pk=tournament.pk), tournament)
+            partial = await Tournament.get(pk=tournament.pk).only("id", "name")
+            self.assertIsNot(partial, tournament)
+            await Event.all()
+            del partial
+            gc.collect()
+            self.assertEqual(len(session), 1)
+            await tournament.delete()
+            self.assertEqual(len(session), 0)
+
+    async def test_populate_existing(self):
+        with tortoise.session():
+            tournament = await Tournament.get(pk=self.tournament.pk)
+            event = await Event.filter(tournament=tournament).first()
+            tournament.name = "changed"
+            await Tournament.filter(pk=tournament.pk).update(desc="updated")
+            await Event.filter(pk=event.pk).update(tournament=await Tournament.create(name="u"))
+            self.assertIs(await Tournament.get(pk=tournament.pk).populate_existing(), tournament)
+            self.assertEqual((tournament.name, tournament.desc), ("t", "updated"))
+            self.assertEqual(tournament.changed_fields, set())
+            self.assertIs(await event.tournament, tournament)
+            self.assertIs(await Event.get(pk=event.pk).populate_existing(), event)
+            self.assertEqual((await event.tournament).name, "u")
+
+    @test.requireCapability(support_for_update=True)
+    async def test_select_for_update(self):
+        with tortoise.session():
+            tournament = await Tournament.get(pk=self.tournament.pk)
+            tournament.name = "changed"
+            self.assertIs(await Tournament.select_for_update().get(pk=tournament.pk), tournament)
+            self.assertEqual(tournament.name, "t")
@@ -0,0 +1,117 @@
+from unittest.mock import patch
+
+from tests.testmodels import (
+    Event,
+    Team,
+    Tournament,
+    UUIDFkRelatedModel,
+    UUIDPkModel,
+)
+from tests.utils.query_counter import QueryCounter
+from tortoise.backends.base.client import add_query_listener, remove_query_listener
+from tortoise.contrib import test
+from tortoise.filters import LARGE_IN_LIST
+from tortoise.query_utils import Prefetch
+from tortoise.utils import chunk, chunk_in_list
+
+
+def chunk_by_two(values, db):
+    return chunk(values, 2)
+
+
+class TestLargeInList(test.TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.counter = QueryCounter()
+        add_query_listener(self.counter)
+
+    async def asyncTearDown(self):
+        remove_query_listener(self.counter)
+        await super().asyncTearDown()
+
+    async def test_filter(self):
+        tournaments = [await Tournament.create(name=str(i)) for i in range(3)]
+        pks = [tournaments[0].pk, tournaments[2].pk, *range(1000, 1000 + LARGE_IN_LIST)]
+        self.counter.queries.clear()
+        self.assertEqual(await Tournament.filter(pk__in=pks).order_by("id"), tournaments[::2])
+        self.assertEqual(await Tournament.filter(pk__not_in=pks), [tournaments[1]])
+        names = [str(i) for i in range(1, LARGE_IN_LIST + 2)]
+        self.assertEqual(await Tournament.filter(name__in=names).order_by("id"), tournaments[1:])
+        # Short lists keep a parameter per value
+        self.assertEqual(await Tournament.filter(pk__in=pks[:2]).count(), 2)
+
+        dialect = Tournament._meta.db.capabilities.dialect
+        if dialect in ("sqlite", "postgres"):
+            # Long lists are bound as a single parameter
+            self.assertEqual(self.counter.params[-4:], [1, 1, 1, 2])
+
+    async def test_prefetch_in_chunks(self):
+        tournaments = [await Tournament.create(name=str(i)) for i in range(3)]
+        events = [await Event.create(name=str(i), tournament=t) for i, t in enumerate(tournaments)]
+        team = await Team.create(name="team")
+        for event in events:
+            await event.participants.add(team)
+
+        self.counter.queries.clear()
+        with patch("tortoise.backends.base.executor.chunk_in_list", chunk_by_two):
+            fetched = await Tournament.filter(pk__in=[t.pk for t in tournaments]).prefetch_related(
+                "events__participants"
+            )
+            self.assertEqual(len(self.counter.queries), 5)
+            self.assertEqual([list(t.events) for t in fetched], [[e] for e in events])
+            self.assertEqual([list(t.events[0].participants) for t in fetched], [[team]] * 3)
+
+            self.counter.queries.clear()
+            fetched_events = await Event.filter(pk__in=[e.pk for e in events]).prefetch_related(
+                "tournament"
+            )
+            self.assertEqual(len(self.counter.queries), 3)
+            self.assertEqual([e.tournament for e in fetched_events], tournaments)
+
+        with patch("tortoise.queryset.chunk_in_list", chunk_by_two):
+            self.counter.queries.clear()
+            in_bulk = await Tournament.in_bulk([t.pk for t in tournaments], "pk")
+            self.assertEqual(in_bulk, {t.pk: t for t in tournaments})
+            self.assertEqual(len(self.counter.queries), 2)
+
+    async def test_sliced_not_in_chunks(self):
+        tournaments = [await Tournament.create(name=str(i)) for i in range(3)]
+        pks = [t.pk for t in tournaments]
+        for tournament in tournaments:
+            await Event.create(name=tournament.name, tournament=tournament)
+
+        self.counter.queries.clear()
+        with patch("tortoise.backends.base.executor.chunk_in_list", chunk_by_two):
+            fetched = await Tournament.filter(pk__in=pks).prefetch_related(
+                Prefetch("events", Event.all().order_by("name").offset(1).limit(1))
+            )
+            self.assertEqual(len(self.counter.queries), 2)
+            self.assertEqual([len(t.events) for t in fetched], [0, 1, 0])
+
+        with patch("tortoise.queryset.chunk_in_list", chunk_by_two):
+            self.counter.queries.clear()
+            in_bulk = await Tournament.all().order_by("-id").limit(2).in_bulk(pks, "pk")
+            self.assertEqual(in_bulk, {t.pk: t for t in tournaments[1:]})
+            self.assertEqual(len(self.counter.queries), 1)
+
+    async def test_single_parameter_not_in_chunks(self):
+        tournament = await Tournament.create(name="t")
+        db = Tournament._meta.db
+        pks = [tournament.pk, *range(10**6, 10**6 + db.capabilities.max_query_params)]
+        self.counter.queries.clear()
+        self.assertEqual(await Tournament.in_bulk(pks, "pk"), {tournament.pk: tournament})
+        if Tournament._meta.db.executor_class.IN_LIST_PARAM_TYPES:
+            self.assertEqual(len(self.counter.queries), 1)
+        else:
+            self.assertEqual(len(self.counter.queries), len(list(chunk_in_list(pks, db))))
+        # Lists of other types are still split
+        self.assertEqual(len(list(chunk_in_list([float(pk) for pk in pks], db))), 3)
+
+    async def test_prefetch_many_parents(self):
+        # More parents than SQLite's limit of bind parameters in a query
+        parents = [UUIDPkModel() for _ in range(33000)]
+        await UUIDPkModel.bulk_create(parents)
+        await UUIDFkRelatedModel.create(model_id=parents[-1].pk, name="child")
+        fetched = await UUIDPkModel.all().prefetch_related("children")
+        self.assertEqual(len(fetched), 33000)
+        self.assertEqual(sum(len(parent.children) for parent in fetched), 1)
@@ -0,0 +1,108 @@
+import asyncio
+
+from tests.testmodels import Event, Reporter, Tournament
+from tests.utils.query_counter import QueryCounter
+from tortoise import batch_loading
+from tortoise.backends.base.client import add_query_listener, remove_query_listener
+from tortoise.contrib import test
+from tortoise.exceptions import DoesNotExist
+from tortoise.loader import current_loader
+
+
+class TestBatchLoading(test.TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.tournaments = [await Tournament.create(name=str(i)) for i in range(3)]
+        for i in range(6):
+            await Event.create(name=f"event{i}", tournament=self.tournaments[i % 3])
+        self.events = await Event.all().order_by("name")
+        self.counter = QueryCounter()
+        add_query_listener(self.counter)
+
+    async def asyncTearDown(self):
+        remove_query_listener(self.counter)
+        await super().asyncTearDown()
+
+    async def test_fk_lookups(self):
+        with batch_loading() as loader:
+            tournaments = await asyncio.gather(*(event.tournament for event in self.events))
+        self.assertEqual([t.name for t in tournaments], ["0", "1", "2", "0", "1", "2"])
+        self.assertEqual(len(self.counter.queries), 1)
+        self.assertEqual((loader.lookups, loader.queries), (6, 1))
+        # The loaded objects are set on the instances
+        self.assertIs(self.events[0].tournament, tournaments[0])
+        self.assertIs(self.events[3].tournament, tournaments[0])
+
+    async def test_get_pk(self):
+        pks = [t.pk for t in self.tournaments]
+        with batch_loading():
+            tournaments = await asyncio.gather(
+                Tournament.get(pk=pks[2]), Tournament.get(id=pks[0]), Tournament.get(pk=pks[2])
+            )
+            self.assertEqual([t.name for t in tournaments], ["2", "0", "2"])
+            with self.assertRaises(DoesNotExist):
+                await Tournament.get(pk=max(pks) + 1)
+            # Other lookups still return querysets
+            self.assertEqual((await Tournament.get(name="1").only("id")).pk, pks[1])
+        self.assertEqual(len(self.counter.queries), 3)
+
+    async def test_get_converted_pk(self):
+        pk = self.tournaments[1].pk
+        with batch_loading():
+            tournaments = await asyncio.gather(
+                Tournament.get(pk=str(pk)), Tournament.get_or_none(pk=pk)
+            )
+            self.assertIsNone(await Tournament.get_or_none(pk=pk + 100))
+        self.assertEqual([t.name for t in tournaments], ["1", "1"])
+        self.assertEqual(len(self.counter.queries), 2)
+
+    async def test_get_chained(self):
+        pk = self.tournaments[0].pk
+        with batch_loading():
+            tournament = await Tournament.get(pk=pk).prefetch_related("events")
+            self.assertEqual(len(tournament.events), 2)
+            self.assertEqual((await Tournament.get(pk=pk).only("id", "name")).name, "0")
+        self.assertEqual(len(self.counter.queries), 3)
+
+    async def test_cancel_one_waiter(self):
+        pk = self.tournaments[0].pk
+        with batch_loading():
+            first = asyncio.ensure_future(Tournament.get(pk=pk))
+            second = asyncio.ensure_future(Tournament.get(pk=pk))
+            await asyncio.sleep(0)
+            first.cancel()
+            self.assertEqual((await second).name, "0")
+            self.assertTrue(first.cancelled())
+
+    async def test_cache(self):
+        with batch_loading() as loader:
+            for event in await Event.all().order_by("name"):
+                await event.tournament
+        self.assertEqual(len(self.counter.queries), 4)
+        self.assertEqual((loader.queries, loader.cache_hits), (3, 3))
+
+        with batch_loading(cache=False) as loader:
+            for event in await Event.all().order_by("name"):
+                await event.tournament
+        self.assertEqual(loader.queries, 6)
+
+    async def test_nullable_fk(self):
+        event = await Event.create(name="no reporter", tournament=self.tournaments[0])
+        reporter = await Reporter.create(name="reporter")
+        event2 = await Event.create(name="reporter", tournament=self.tournaments[0])
+        event2.reporter_id = reporter.pk
+        with batch_loading():
+            self.assertIsNone(await event.reporter)
+            self.assertEqual((await event2.reporter).name, "reporter")
+
+    async def test_without_loader(self):
+        self.assertIsNone(current_loader())
+        await self.events[0].tournament
+        await self.events[0].tournament
+        self.assertEqual(len(self.counter.queries), 2)
+
+    async def test_error(self):
+        with batch_loading():
+            future = Tournament.get(pk=1)
+            with self.assertRaises(ValueError):
+                await asyncio.gather(future, Tournament.get(pk="not a number"))
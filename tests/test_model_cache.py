@@ -0,0 +1,169 @@
+from tests.testmodels import Event, JSONFields, Tournament
+from tests.utils.query_counter import QueryCounter
+from tortoise import Model, fields
+from tortoise.backends.base.client import (
+    QueryEvent,
+    QueryListener,
+    add_query_listener,
+    remove_query_listener,
+)
+from tortoise.cache import CacheConfig, MemoryCache, ModelCache
+from tortoise.contrib import test
+from tortoise.exceptions import ConfigurationError, DoesNotExist
+from tortoise.transactions import in_transaction
+
+
+class TestMemoryCache(test.SimpleTestCase):
+    async def test_lru_and_ttl(self):
+        cache = MemoryCache(max_entries=2)
+        await cache.set("a", 1, "one", None)
+        await cache.set("a", 2, "two", None)
+        self.assertEqual(await cache.get("a", 1), "one")
+        await cache.set("b", 1, "other", None)
+        # 2 was the least recently used
+        self.assertIsNone(await cache.get("a", 2))
+        self.assertEqual(cache.evictions, 1)
+        await cache.set("a", 3, "expired", -1)
+        self.assertIsNone(await cache.get("a", 3))
+        await cache.clear("a")
+        self.assertEqual(await cache.get_many("a", [1, 2]), {})
+        self.assertEqual(await cache.get("b", 1), "other")
+
+    def test_config(self):
+        with self.assertRaisesRegex(ConfigurationError, "CacheConfig"):
+
+            class Wrong(Model):
+                name = fields.CharField(max_length=10)
+
+                class Meta:
+                    cache = {"ttl": 10}
+
+        class Cached(Model):
+            name = fields.CharField(max_length=10)
+
+            class Meta:
+                cache = CacheConfig(ttl=10)
+
+        self.assertIsInstance(Cached._meta.cache, ModelCache)
+        self.assertEqual(Cached._meta.cache.ttl, 10)
+        self.assertIsNone(Tournament._meta.cache)
+
+
+class TestModelCache(test.TruncationTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.tournament = await Tournament.create(name="t")
+        self.event = await Event.create(name="e", tournament=self.tournament)
+        Tournament._meta.cache = ModelCache(Tournament._meta, CacheConfig())
+        self.counter = QueryCounter()
+        add_query_listener(self.counter)
+
+    async def asyncTearDown(self):
+        remove_query_listener(self.counter)
+        Tournament._meta.cache = None
+        await super().asyncTearDown()
+
+    async def test_get(self):
+        first = await Tournament.get(pk=self.tournament.pk)
+        second = await Tournament.get(id=self.tournament.pk)
+        third = await Tournament.get_or_none(pk=str(self.tournament.pk))
+        self.assertEqual(len(self.counter.queries), 1)
+        self.assertIsNot(first, second)
+        self.assertEqual((second.pk, second.name), (self.tournament.pk, "t"))
+        self.assertEqual(second.created, self.tournament.created)
+        self.assertEqual(third.name, "t")
+        self.assertEqual(
+            Tournament._meta.cache.stats(), {"hits": 2, "misses": 1, "hit_rate": 2 / 3}
+        )
+        # Other filters query the DB
+        await Tournament.get(pk=self.tournament.pk, name="t")
+        await Tournament.filter(pk=self.tournament.pk).only("id", "name").get()
+        self.assertEqual(len(self.counter.queries), 3)
+        with self.assertRaises(DoesNotExist):
+            await Tournament.get(pk=self.tournament.pk + 1)
+
+    async def test_fk_and_in_bulk(self):
+        other = await Tournament.create(name="other")
+        event = await Event.get(pk=self.event.pk)
+        await event.tournament
+        self.counter.queries.clear()
+        event = await Event.get(pk=self.event.pk)
+        self.assertEqual((await event.tournament).name, "t")
+        self.assertEqual(len(self.counter.queries), 1)
+        objs = await Tournament.in_bulk([self.tournament.pk, other.pk], "pk")
+        self.assertEqual(
+            {pk: obj.name for pk, obj in objs.items()}, {self.tournament.pk: "t", other.pk: "other"}
+        )
+        # Only the uncached object is fetched
+        self.assertIn('"id" IN (?)', self.counter.queries[-1])
+        await Tournament.in_bulk([self.tournament.pk, other.pk], "id")
+        self.assertEqual(len(self.counter.queries), 2)
+
+    async def test_invalidation(self):
+        await Tournament.get(pk=self.tournament.pk)
+        self.tournament.name = "saved"
+        await self.tournament.save()
+        self.assertEqual((await Tournament.get(pk=self.tournament.pk)).name, "saved")
+        await Tournament.filter(pk=self.tournament.pk).update(name="updated")
+        self.assertEqual((await Tournament.get(pk=self.tournament.pk)).name, "updated")
+        self.tournament.name = "bulk"
+        await Tournament.bulk_update([self.tournament], fields=["name"])
+        self.assertEqual((await Tournament.get(pk=self.tournament.pk)).name, "bulk")
+        await self.tournament.delete()
+        self.assertIsNone(await Tournament.get_or_none(pk=self.tournament.pk))
+
+    async def test_related_invalidation(self):
+        Event._meta.cache = ModelCache(Event._meta, CacheConfig())
+        try:
+            await Event.get(pk=self.event.pk)
+            await Tournament.filter(pk=self.tournament.pk).delete()
+            # The event was deleted by the DB cascade
+            self.assertIsNone(await Event.get_or_none(pk=self.event.pk))
+        finally:
+            Event._meta.cache = None
+
+    async def test_transaction(self):
+        await Tournament.get(pk=self.tournament.pk)
+        async with in_transaction():
+            await Tournament.get(pk=self.tournament.pk)
+        self.assertEqual(len(self.counter.queries), 2)
+
+    async def test_transaction_invalidation(self):
+        stale = await Tournament.get(pk=self.tournament.pk)
+        async with in_transaction():
+            self.tournament.name = "committed"
+            await self.tournament.save()
+            # A connection outside the transaction still reads the committed row
+            await Tournament._meta.cache.put(stale)
+        self.assertEqual((await Tournament.get(pk=self.tournament.pk)).name, "committed")
+
+    async def test_write_while_fetching(self):
+        cache = Tournament._meta.cache
+
+        class Writer(QueryListener):
+            def after_query(self, event: QueryEvent) -> None:
+                # A concurrent write of the row after it was read
+                cache.version += 1
+
+        writer = Writer()
+        add_query_listener(writer)
+        try:
+            await Tournament.get(pk=self.tournament.pk)
+            await Tournament.in_bulk([self.tournament.pk], "pk")
+        finally:
+            remove_query_listener(writer)
+        self.assertIsNone(await cache.get(self.tournament.pk))
+        self.assertEqual(len(self.counter.queries), 2)
+
+    async def test_mutable_fields(self):
+        JSONFields._meta.cache = ModelCache(JSONFields._meta, CacheConfig())
+        try:
+            obj = await JSONFields.create(data={"a": [1]})
+            await JSONFields.get(pk=obj.pk)
+            cached = await JSONFields.get(pk=obj.pk)
+            self.assertEqual(JSONFields._meta.cache.hits, 1)
+            self.assertEqual(cached.changed_fields, set())
+            cached.data["a"].append(2)
+            self.assertEqual(cached.changed_fields, {"data"})
+        finally:
+            JSONFields._meta.cache = None
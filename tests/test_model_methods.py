@@ -438,3 +438,36 @@ class TestModelConstructor(test.TestCase):
         self.assertIsNone(await NoneAwaitable)
         self.assertFalse(NoneAwaitable)
         self.assertIsNone(await NoneAwaitable)
+
+
+class TestModelHydrator(test.TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.tournament = await Tournament.create(name="Tournament")
+        self.event = await Event.create(name="Event", tournament=self.tournament)
+
+    async def test_matches_init_from_db(self):
+        db = Event._meta.db
+        _, rows = await db.execute_query(str(Event._meta.basequery_all_fields))
+        row = dict(rows[0])
+        hydrate = Event._meta.hydrator(tuple(row))
+        self.assertIs(hydrate, Event._meta.hydrator(tuple(row)))
+        obj = hydrate(tuple(row.values()))
+        self.assertEqual(obj.__dict__, Event._init_from_db(**row).__dict__)
+        self.assertFalse(obj._partial)
+        self.assertTrue(obj._saved_in_db)
+
+    async def test_partial(self):
+        obj = await Event.get(pk=self.event.pk).only("event_id", "name")
+        self.assertTrue(obj._partial)
+        self.assertEqual((obj.pk, obj.name), (self.event.pk, "Event"))
+
+    async def test_select_related(self):
+        obj = await Event.get(pk=self.event.pk).select_related("tournament", "reporter")
+        self.assertEqual(obj.tournament.name, "Tournament")
+        self.assertTrue(obj.tournament._saved_in_db)
+        self.assertIsNone(obj.reporter)
+
+    async def test_annotations(self):
+        obj = await Event.annotate(upper_name=F("name")).get(pk=self.event.pk)
+        self.assertEqual(obj.upper_name, "Event")
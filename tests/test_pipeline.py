@@ -0,0 +1,94 @@
+import asyncio
+from unittest.mock import patch
+
+from tests.testmodels import Event, Team, Tournament
+from tests.utils.query_counter import QueryCounter
+from tortoise import pipeline
+from tortoise.backends.base.client import add_query_listener, remove_query_listener
+from tortoise.backends.sqlite import SqliteClient
+from tortoise.contrib import test
+from tortoise.exceptions import OperationalError
+
+
+class TestPipelineUnit(test.SimpleTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.client = SqliteClient(file_path=":memory:", connection_name="pipeline")
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await super().asyncTearDown()
+
+    async def test_batch(self):
+        with pipeline() as current:
+            with pipeline() as nested:
+                self.assertIs(nested, current)
+            results = await asyncio.gather(
+                self.client.execute_query("SELECT ? AS a", [1]),
+                self.client.execute_query_dict("SELECT 2 AS a"),
+                self.client.execute_query("SELECT * FROM missing"),
+                return_exceptions=True,
+            )
+        self.assertEqual((current.batches, current.queries), (1, 3))
+        self.assertEqual(dict(results[0][1][0]), {"a": 1})
+        self.assertEqual(results[1], [{"a": 2}])
+        self.assertIsInstance(results[2], OperationalError)
+
+    async def test_failed_batch(self):
+        async def fail(*args):
+            raise OperationalError("failed")
+
+        # Outside of transactions the queries run again one by one
+        with patch.object(SqliteClient, "_execute_pipeline", fail), pipeline() as current:
+            results = await asyncio.gather(
+                self.client.execute_query_dict("SELECT 1 AS a"),
+                self.client.execute_query_dict("SELECT 2 AS a"),
+            )
+        self.assertEqual(results, [[{"a": 1}], [{"a": 2}]])
+        self.assertEqual(current.batches, 1)
+
+    async def test_writes(self):
+        await self.client.execute_script("CREATE TABLE t (id INTEGER PRIMARY KEY)")
+        with pipeline() as current:
+            await asyncio.gather(
+                self.client.execute_query("INSERT INTO t (id) VALUES (1)"),
+                self.client.execute_insert("INSERT INTO t (id) VALUES (?)", [2]),
+                self.client.execute_query_dict("SELECT id FROM t"),
+            )
+        self.assertEqual(current.batches, 0)
+
+
+class TestPipeline(test.TestCase):
+    async def test_prefetch(self):
+        tournament = await Tournament.create(name="t")
+        event = await Event.create(name="e", tournament=tournament)
+        team = await Team.create(name="team")
+        await event.participants.add(team)
+
+        counter = QueryCounter()
+        add_query_listener(counter)
+        try:
+            with patch.object(
+                SqliteClient,
+                "_execute_pipeline",
+                autospec=True,
+                side_effect=SqliteClient._execute_pipeline,
+            ) as execute_pipeline:
+                fetched = await Event.get(pk=event.pk).prefetch_related(
+                    "tournament", "participants", "reporter"
+                )
+        finally:
+            remove_query_listener(counter)
+        self.assertEqual(execute_pipeline.call_count, 1)
+        self.assertEqual(len(execute_pipeline.call_args.args[1]), 2)
+        self.assertEqual(len(counter.queries), 3)
+        self.assertEqual((fetched.tournament, list(fetched.participants)), (tournament, [team]))
+        self.assertIsNone(fetched.reporter)
+
+    async def test_transaction_error(self):
+        async def fail(*args):
+            raise OperationalError("failed")
+
+        with patch.object(SqliteClient, "_execute_pipeline", fail), pipeline():
+            results = await asyncio.gather(Tournament.all(), Event.all(), return_exceptions=True)
+        self.assertEqual([str(result) for result in results], ["failed", "failed"])
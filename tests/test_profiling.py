@@ -0,0 +1,85 @@
+import json
+
+import tortoise
+from tests.testmodels import Event, Tournament
+from tortoise.backends.sqlite import SqliteClient
+from tortoise.contrib import test
+from tortoise.profiling import phase, profiling
+
+
+def names(node: dict) -> list[str]:
+    return [child["name"] for child in node["children"]]
+
+
+class TestProfile(test.TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        tournament = await Tournament.create(name="t")
+        await Event.create(name="e1", tournament=tournament)
+        await Event.create(name="e2", tournament=tournament)
+
+    async def test_query(self):
+        with tortoise.profile("events") as prof:
+            events = await Event.all().prefetch_related("tournament")
+        self.assertEqual(len(events), 2)
+        tree = prof.to_dict()
+        self.assertEqual(tree["name"], "events")
+        self.assertEqual(tree["start"], 0)
+        (query,) = tree["children"]
+        self.assertEqual(query["name"], "Event query")
+        self.assertEqual(names(query), ["compile", "execute_query", "hydrate", "prefetch"])
+        self.assertEqual(names(query["children"][0]), ["make_query", "render_sql"])
+        (prefetch,) = query["children"][3]["children"]
+        self.assertEqual(prefetch["name"], "prefetch Event.tournament")
+        self.assertEqual(names(prefetch), ["Tournament query"])
+        for child in query["children"]:
+            self.assertGreaterEqual(child["start"], query["start"])
+            self.assertLessEqual(child["duration"], query["duration"])
+        self.assertEqual(json.loads(prof.to_json()), tree)
+
+    async def test_save_and_bulk(self):
+        with tortoise.profile() as prof:
+            tournament = await Tournament.create(name="new")
+            await Tournament.bulk_create([Tournament(name="a"), Tournament(name="b")])
+            tournament.name = "renamed"
+            await Tournament.bulk_update([tournament], fields=["name"])
+        self.assertEqual(
+            names(prof.to_dict()),
+            ["models.Tournament.save", "Tournament bulk_create", "Tournament bulk_update"],
+        )
+        save = prof.to_dict()["children"][0]
+        self.assertEqual(names(save), ["execute_insert"])
+
+    async def test_folded(self):
+        with tortoise.profile() as prof:
+            await Event.all()
+        lines = prof.folded().splitlines()
+        stacks = [line.rsplit(" ", 1)[0] for line in lines]
+        self.assertIn("profile;Event query;execute_query", stacks)
+        self.assertIn("profile;Event query;compile;render_sql", stacks)
+        self.assertTrue(all(int(line.rsplit(" ", 1)[1]) > 0 for line in lines))
+
+    async def test_not_profiling(self):
+        self.assertFalse(profiling())
+        with phase("noop"):
+            await Event.all()
+        with tortoise.profile() as prof:
+            self.assertTrue(profiling())
+            with phase("custom"):
+                await Tournament.first()
+        self.assertFalse(profiling())
+        self.assertEqual(names(prof.to_dict()), ["custom"])
+        self.assertEqual(names(prof.to_dict()["children"][0]), ["Tournament query"])
+
+
+class TestProfileClient(test.SimpleTestCase):
+    async def test_acquire(self):
+        client = SqliteClient(file_path=":memory:", connection_name="profiled")
+        try:
+            with tortoise.profile() as prof:
+                await client.execute_query("SELECT 1")
+        finally:
+            await client.close()
+        (query,) = prof.to_dict()["children"]
+        self.assertEqual(query["name"], "execute_query")
+        self.assertEqual(names(query), ["acquire"])
@@ -0,0 +1,141 @@
+from unittest import TestCase
+
+from tests.testmodels import Event, IntFields, Tournament
+from tortoise.contrib import test
+from tortoise.expressions import F, Q
+from tortoise.functions import Count
+from tortoise.query_cache import QUERY_CACHE, CompiledQuery, QueryCache
+
+
+class TestQueryCacheLRU(TestCase):
+    def test_lru_eviction(self):
+        cache = QueryCache(2)
+        cache.put("a", CompiledQuery("SELECT 1", []))
+        cache.put("b", CompiledQuery("SELECT 2", []))
+        cache.get("a")
+        cache.put("c", CompiledQuery("SELECT 3", []))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a").sql, "SELECT 1")
+        self.assertEqual(
+            cache.stats(),
+            {
+                "size": 2,
+                "max_size": 2,
+                "hits": 2,
+                "misses": 1,
+                "evictions": 1,
+                "uncacheable": 0,
+                "hit_rate": 2 / 3,
+            },
+        )
+
+    def test_uncacheable_marker(self):
+        cache = QueryCache(2)
+        cache.put("a", None)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.uncacheable, 1)
+        self.assertEqual(cache.misses, 0)
+
+    def test_clear_and_reset_stats(self):
+        cache = QueryCache(2)
+        cache.put("a", CompiledQuery("SELECT 1", []))
+        cache.get("a")
+        cache.reset_stats()
+        self.assertEqual(cache.stats()["hits"], 0)
+        self.assertEqual(cache.stats()["size"], 1)
+        cache.clear()
+        self.assertEqual(cache.stats()["size"], 0)
+        self.assertFalse(QueryCache(0).enabled)
+
+
+class TestQueryCache(test.TestCase):
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        QUERY_CACHE.clear()
+        QUERY_CACHE.reset_stats()
+        self.tournament1 = await Tournament.create(name="1")
+        self.tournament2 = await Tournament.create(name="2")
+        for i in range(3):
+            await Event.create(name=f"event1_{i}", tournament=self.tournament1)
+            await Event.create(name=f"event2_{i}", tournament=self.tournament2)
+
+    async def test_same_shape(self):
+        events1 = await Event.filter(tournament=self.tournament1).order_by("name")
+        events2 = await Event.filter(tournament=self.tournament2).order_by("name")
+        self.assertEqual([e.name for e in events1], [f"event1_{i}" for i in range(3)])
+        self.assertEqual([e.name for e in events2], [f"event2_{i}" for i in range(3)])
+        self.assertEqual(QUERY_CACHE.misses, 1)
+        self.assertEqual(QUERY_CACHE.hits, 1)
+
+    async def test_different_shapes(self):
+        await Event.filter(name="event1_0")
+        await Event.filter(name__gt="event1_0")
+        await Event.filter(name="event1_0").order_by("-name")
+        await Event.filter(name="event1_0").limit(1)
+        await Event.filter(name__in=["event1_0"])
+        await Event.filter(name__in=["event1_0", "event1_1"])
+        self.assertEqual(QUERY_CACHE.misses, 6)
+        self.assertEqual(QUERY_CACHE.hits, 0)
+
+    async def test_related_filter_and_select_related(self):
+        for tournament in (self.tournament1, self.tournament2):
+            events = (
+                await Event.filter(Q(tournament__name=tournament.name) | Q(name="missing"))
+                .select_related("tournament")
+                .order_by("name")
+                .limit(2)
+                .offset(1)
+            )
+            self.assertEqual(
+                [(e.name, e.tournament.name) for e in events],
+                [(f"event{tournament.name}_{i}", tournament.name) for i in (1, 2)],
+            )
+        self.assertEqual(QUERY_CACHE.hits, 1)
+
+    async def test_in_range_isnull(self):
+        await IntFields.create(intnum=1)
+        await IntFields.create(intnum=5, intnum_null=5)
+        for low, high in ((0, 2), (4, 6)):
+            objs = await IntFields.filter(
+                intnum__range=(low, high), intnum__not_in=[3, 7], intnum_null=None
+            )
+            self.assertEqual([obj.intnum for obj in objs], [1] if low == 0 else [])
+        self.assertEqual(QUERY_CACHE.hits, 1)
+        # The value of __isnull is part of the shape, as it changes the SQL
+        for isnull, intnum in ((True, 1), (False, 5), (True, 1)):
+            objs = await IntFields.filter(intnum__gt=0, intnum_null__isnull=isnull)
+            self.assertEqual([obj.intnum for obj in objs], [intnum])
+        self.assertEqual(QUERY_CACHE.hits, 2)
+        self.assertEqual(QUERY_CACHE.uncacheable, 0)
+
+    async def test_get_and_iterator(self):
+        for tournament in (self.tournament1, self.tournament2):
+            self.assertEqual((await Tournament.get(name=tournament.name)).pk, tournament.pk)
+        names = [t.name async for t in Tournament.filter(name__in=["2"])]
+        names += [t.name async for t in Tournament.filter(name__in=["1"])]
+        self.assertEqual(names, ["2", "1"])
+        self.assertEqual(QUERY_CACHE.hits, 2)
+
+    async def test_repeated_values_not_cached(self):
+        await Tournament.filter(id=1).limit(1)
+        await Tournament.filter(id=2).limit(1)
+        self.assertEqual(QUERY_CACHE.hits, 0)
+        self.assertEqual(
+            (await Tournament.filter(id=self.tournament1.id).limit(10**6))[0].name, "1"
+        )
+        self.assertEqual(QUERY_CACHE.hits, 1)
+
+    async def test_uncacheable(self):
+        await Tournament.annotate(events_count=Count("events")).filter(events_count=3)
+        await Tournament.filter(id=F("id"))
+        await Tournament.filter(name__icontains="1")
+        self.assertEqual(QUERY_CACHE.stats()["size"], 0)
+
+    async def test_disabled(self):
+        QUERY_CACHE.max_size = 0
+        try:
+            await Tournament.filter(id=1)
+            await Tournament.filter(id=2)
+        finally:
+            QUERY_CACHE.max_size = 1000
+        self.assertEqual(QUERY_CACHE.stats()["size"], 0)
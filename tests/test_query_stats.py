@@ -0,0 +1,91 @@
+from unittest import TestCase as UnitTestCase
+
+from tests.testmodels import Tournament
+from tortoise import Tortoise
+from tortoise.backends.base.client import QueryEvent
+from tortoise.backends.sqlite import SqliteClient
+from tortoise.contrib import test
+from tortoise.query_stats import QUERY_STATS, QueryStats, fingerprint
+
+
+class TestFingerprint(UnitTestCase):
+    def test_literals_and_params(self):
+        self.assertEqual(
+            fingerprint("SELECT \"a\" FROM t1 WHERE \"b\"='it''s' AND c=$1 AND d > -2.5 LIMIT 10"),
+            'SELECT "a" FROM t1 WHERE "b"=? AND c=? AND d > ? LIMIT ?',
+        )
+        self.assertEqual(fingerprint("SELECT a FROM t WHERE b=%s"), "SELECT a FROM t WHERE b=?")
+
+    def test_lists(self):
+        self.assertEqual(
+            fingerprint("SELECT * FROM t WHERE id IN (?,?,?)"),
+            fingerprint("SELECT * FROM t WHERE id IN (?)"),
+        )
+        self.assertEqual(
+            fingerprint('INSERT INTO "t" ("a","b") VALUES (?,?), (?,?),\n(?,?)'),
+            'INSERT INTO "t" ("a","b") VALUES (...), ...',
+        )
+
+
+class TestQueryStats(UnitTestCase):
+    def event(self, sql: str, duration: float, rowcount: int = 1) -> QueryEvent:
+        event = QueryEvent(SqliteClient(file_path=":memory:", connection_name="x"), "m", sql, 1)
+        event.duration = duration
+        event.rowcount = rowcount
+        return event
+
+    def test_aggregation(self):
+        stats = QueryStats(sample_size=10)
+        for i in range(100):
+            stats.after_query(self.event(f"SELECT * FROM t WHERE id={i}", i / 100))
+        stats.after_query(self.event("SELECT 1", 100, 0))
+        stats.record_hydrated("SELECT * FROM t WHERE id=1", 5)
+        slowest, shape = stats.stats()
+        self.assertEqual(slowest["query"], "SELECT ?")
+        self.assertEqual(shape["query"], "SELECT * FROM t WHERE id=?")
+        self.assertEqual(shape["calls"], 100)
+        self.assertEqual(shape["rows"], 100)
+        self.assertAlmostEqual(shape["total_time"], 49.5)
+        self.assertAlmostEqual(shape["mean_time"], 0.495)
+        self.assertLessEqual(shape["p95_time"], shape["p99_time"])
+        # Only enabled collectors count the hydrated objects
+        self.assertEqual(shape["hydrated"], 0)
+
+    def test_max_shapes(self):
+        stats = QueryStats(max_shapes=1)
+        stats.after_query(self.event("SELECT 1", 1))
+        stats.after_query(self.event("SELECT 2", 1))
+        stats.after_query(self.event("SELECT a FROM t", 1))
+        self.assertEqual(stats.stats()[0]["calls"], 2)
+        self.assertEqual(stats.dropped, 1)
+        stats.reset_stats()
+        self.assertEqual((stats.stats(), stats.dropped), ([], 0))
+
+
+class TestTortoiseStats(test.TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.tournaments = [await Tournament.create(name="1"), await Tournament.create(name="2")]
+        Tortoise.reset_stats()
+        QUERY_STATS.enable()
+
+    async def asyncTearDown(self):
+        QUERY_STATS.disable()
+        Tortoise.reset_stats()
+        await super().asyncTearDown()
+
+    async def test_stats(self):
+        await Tournament.filter(name="1")
+        await Tournament.filter(name="2")
+        await Tournament.filter(id__in=[t.pk for t in self.tournaments] + [0])
+        shapes = {shape["query"]: shape for shape in Tortoise.stats()}
+        self.assertEqual(len(shapes), 2)
+        by_name = next(shape for query, shape in shapes.items() if '"name"=?' in query)
+        self.assertEqual((by_name["calls"], by_name["rows"], by_name["hydrated"]), (2, 2, 2))
+        by_id = next(shape for query, shape in shapes.items() if "IN (...)" in query)
+        self.assertEqual(by_id["hydrated"], 2)
+
+    async def test_disabled(self):
+        QUERY_STATS.disable()
+        await Tournament.all()
+        self.assertEqual(Tortoise.stats(), [])
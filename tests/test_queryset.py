@@ -23,6 +23,7 @@ from tortoise.exceptions import (
 )
 from tortoise.expressions import F, RawSQL, Subquery
 from tortoise.functions import Avg
+from tortoise.transactions import in_transaction
 
 # TODO: Test the many exceptions in QuerySet
 # TODO: .filter(intnum_null=None) does not work as expected
@@ -484,6 +485,122 @@ class TestQueryset(test.TestCase):
 
         self.assertEqual(await IntFields.all().count(), counter)
 
+    async def test_iterator_fetch_size(self):
+        values = [obj.intnum async for obj in IntFields.all().order_by("intnum").iterator(7)]
+        self.assertEqual(values, list(range(10, 100, 3)))
+
+    async def test_iterator_empty(self):
+        self.assertEqual([obj async for obj in IntFields.filter(intnum=1).iterator(5)], [])
+
+    async def test_iterator_query_inside_loop(self):
+        counter = 0
+        async for obj in IntFields.filter(intnum__lt=40).order_by("intnum").iterator(2):
+            self.assertEqual(await IntFields.get(id=obj.id), obj)
+            counter += 1
+        self.assertEqual(counter, 10)
+
+    async def test_iterator_in_transaction(self):
+        async with in_transaction():
+            await IntFields.create(intnum=1)
+            values = [obj.intnum async for obj in IntFields.filter(intnum__lt=14).iterator(1)]
+            await IntFields.filter(intnum=1).delete()
+        self.assertEqual(sorted(values), [1, 10, 13])
+
+    async def test_aiter_save_in_transaction(self):
+        async with in_transaction():
+            async for obj in IntFields.filter(intnum__lt=20):
+                obj.intnum_null = obj.intnum
+                await obj.save()
+        self.assertEqual(await IntFields.filter(intnum_null__not_isnull=True).count(), 4)
+
+    async def test_iterator_values_list(self):
+        values = [
+            val
+            async for val in IntFields.all()
+            .order_by("intnum")
+            .values_list("intnum", flat=True)
+            .iterator(4)
+        ]
+        self.assertEqual(values, list(range(10, 100, 3)))
+        rows = [row async for row in IntFields.filter(intnum=10).values_list("id", "intnum")]
+        self.assertEqual(rows, [(self.intfields[0].id, 10)])
+
+    async def test_iterator_values(self):
+        rows = [
+            row async for row in IntFields.filter(intnum__lt=20).order_by("intnum").values("intnum")
+        ]
+        self.assertEqual(rows, [{"intnum": 10}, {"intnum": 13}, {"intnum": 16}, {"intnum": 19}])
+
+    async def test_iterator_prefetch_related(self):
+        tournament = await Tournament.create(name="T")
+        for i in range(5):
+            await Event.create(name=f"E{i}", tournament=tournament)
+        names = []
+        async for t in Tournament.all().prefetch_related("events").iterator(1):
+            names.extend(sorted(e.name for e in t.events))
+        self.assertEqual(names, ["E0", "E1", "E2", "E3", "E4"])
+
+    async def test_paginate_after(self):
+        page = await IntFields.all().order_by("intnum").paginate_after(40).limit(3)
+        self.assertEqual([obj.intnum for obj in page], [43, 46, 49])
+
+        page = await IntFields.all().order_by("-intnum").paginate_after([40]).limit(3)
+        self.assertEqual([obj.intnum for obj in page], [37, 34, 31])
+
+    async def test_paginate_after_composite(self):
+        await IntFields.filter(intnum__lt=40).update(intnum_null=1)
+        await IntFields.filter(intnum__gte=40).update(intnum_null=2)
+        qs = IntFields.all().order_by("-intnum_null", "intnum")
+        page = await qs.paginate_after((2, 91)).limit(4)
+        self.assertEqual(
+            [(o.intnum_null, o.intnum) for o in page], [(2, 94), (2, 97), (1, 10), (1, 13)]
+        )
+
+        page = await qs.paginate_after((1, 31)).values_list("intnum", flat=True)
+        self.assertEqual(page, [34, 37])
+
+    async def test_paginate_after_errors(self):
+        with self.assertRaisesRegex(ParamsError, "requires an ordering"):
+            IntFields.all().paginate_after(10)
+        with self.assertRaisesRegex(ParamsError, "Cursor has 1 values"):
+            IntFields.all().order_by("intnum", "id").paginate_after(10)
+
+    async def test_iterate_by_key(self):
+        batches = [batch async for batch in IntFields.filter(intnum__gt=20).iterate_by_key(7)]
+        self.assertEqual([len(batch) for batch in batches], [7, 7, 7, 5])
+        self.assertEqual(
+            [obj.id for batch in batches for obj in batch],
+            [obj.id for obj in self.intfields if obj.intnum > 20],
+        )
+
+    async def test_iterate_by_key_desc_composite(self):
+        await IntFields.filter(intnum__lt=50).update(intnum_null=0)
+        await IntFields.filter(intnum__gte=50).update(intnum_null=1)
+        values = [
+            obj.intnum
+            async for batch in IntFields.all().iterate_by_key(4, key=("intnum_null", "-intnum"))
+            for obj in batch
+        ]
+        self.assertEqual(values, list(range(49, 9, -3)) + list(range(97, 50, -3)))
+
+    async def test_iterate_by_key_exact_batches(self):
+        batches = [batch async for batch in IntFields.all().iterate_by_key(10, key="-pk")]
+        self.assertEqual([len(batch) for batch in batches], [10, 10, 10])
+        self.assertEqual(batches[0][0].intnum, 97)
+
+    async def test_iterate_by_key_offset_limit(self):
+        batches = [batch async for batch in IntFields.all().offset(3).limit(12).iterate_by_key(5)]
+        self.assertEqual([len(batch) for batch in batches], [5, 5, 2])
+        self.assertEqual([obj.intnum for batch in batches for obj in batch], list(range(19, 55, 3)))
+
+    async def test_iterate_by_key_errors(self):
+        with self.assertRaisesRegex(ParamsError, "Batch size should be a positive number"):
+            async for _ in IntFields.all().iterate_by_key(0):
+                pass
+        with self.assertRaisesRegex(ParamsError, "Can't iterate by related field"):
+            async for _ in Event.all().iterate_by_key(key="tournament__name"):
+                pass
+
     async def test_update_basic(self):
         obj0 = await IntFields.create(intnum=2147483647)
         await IntFields.filter(id=obj0.id).update(intnum=2147483646)
@@ -0,0 +1,171 @@
+from tests.testmodels import Event, Team, Tournament
+from tests.utils.query_counter import QueryCounter
+from tortoise.backends.base.client import (
+    QueryEvent,
+    QueryListener,
+    add_query_listener,
+    remove_query_listener,
+)
+from tortoise.cache import EMPTY, RESULT_CACHE, ResultCache, query_tables
+from tortoise.contrib import test
+from tortoise.functions import Count
+from tortoise.query_utils import Prefetch
+from tortoise.transactions import in_transaction
+
+
+class TestResultCacheUnit(test.SimpleTestCase):
+    def test_query_tables(self):
+        self.assertEqual(
+            query_tables(
+                'SELECT "a" FROM "event" LEFT OUTER JOIN "tournament" "t" ON "t"."id"="tid" '
+                "WHERE `id` IN (SELECT `id` FROM `db`.`team`)"
+            ),
+            {"event", "tournament", "team"},
+        )
+
+    async def test_versions(self):
+        cache = ResultCache(max_entries=10)
+        await cache.set("k", cache.versions(["event"]), [1, 2], None)
+        self.assertEqual(await cache.get("k"), [1, 2])
+        cache.invalidate("tournament")
+        self.assertEqual(await cache.get("k"), [1, 2])
+        cache.invalidate("event")
+        self.assertIs(await cache.get("k"), EMPTY)
+        self.assertEqual(
+            cache.stats(), {"hits": 2, "misses": 1, "hit_rate": 2 / 3, "invalidations": 2}
+        )
+
+    async def test_versions_before_query(self):
+        cache = ResultCache(max_entries=10)
+        versions = cache.versions(["event"])
+        # Written while the query runs, its result may predate the write
+        cache.invalidate("event")
+        await cache.set("k", versions, [1, 2], None)
+        self.assertIs(await cache.get("k"), EMPTY)
+
+
+class TestResultCache(test.TruncationTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.tournament = await Tournament.create(name="t")
+        self.event = await Event.create(name="e1", tournament=self.tournament)
+        await Event.create(name="e2", tournament=self.tournament)
+        await RESULT_CACHE.clear()
+        RESULT_CACHE.reset_stats()
+        self.counter = QueryCounter()
+        add_query_listener(self.counter)
+
+    async def asyncTearDown(self):
+        remove_query_listener(self.counter)
+        await RESULT_CACHE.clear()
+        await super().asyncTearDown()
+
+    async def test_queryset(self):
+        first = await Event.filter(name="e1").cache()
+        second = await Event.filter(name="e1").cache()
+        self.assertEqual(len(self.counter.queries), 1)
+        self.assertEqual([e.name for e in second], ["e1"])
+        self.assertIsNot(first[0], second[0])
+        # Other parameters and uncached querysets are executed
+        await Event.filter(name="e2").cache()
+        await Event.filter(name="e1")
+        self.assertEqual(len(self.counter.queries), 3)
+        self.assertEqual((await Event.filter(name="e1").cache().first()).pk, self.event.pk)
+        self.assertIsNone(await Event.filter(name="x").cache().get_or_none())
+        self.assertIsNone(await Event.filter(name="x").cache().get_or_none())
+        self.assertEqual(len(self.counter.queries), 5)
+        self.assertEqual(RESULT_CACHE.stats()["hits"], 2)
+
+    async def test_values_and_aggregates(self):
+        for _ in range(2):
+            rows = await (
+                Event.all()
+                .cache(ttl=10)
+                .annotate(count=Count("event_id"))
+                .group_by("tournament_id")
+                .values("tournament_id", "count")
+            )
+            names = await Event.all().cache().order_by("name").values_list("name", flat=True)
+            count = await Event.all().cache().count()
+            exists = await Event.filter(name="x").cache().exists()
+        self.assertEqual(rows, [{"tournament_id": self.tournament.pk, "count": 2}])
+        self.assertEqual((names, count, exists), (["e1", "e2"], 2, False))
+        self.assertEqual(len(self.counter.queries), 4)
+
+    async def test_invalidation(self):
+        async def count() -> int:
+            return len(await Event.all().cache())
+
+        async def tournament_name() -> str:
+            event = await Event.get(pk=self.event.pk).select_related("tournament").cache()
+            return event.tournament.name
+
+        self.assertEqual((await count(), await tournament_name()), (2, "t"))
+        await Event.create(name="e3", tournament=self.tournament)
+        self.assertEqual(await count(), 3)
+        await Event.bulk_create([Event(name="e4", tournament=self.tournament)])
+        self.assertEqual(await count(), 4)
+        await Event.filter(name="e4").delete()
+        self.assertEqual(await count(), 3)
+        # Joined tables invalidate the result as well
+        await Tournament.filter(pk=self.tournament.pk).update(name="updated")
+        self.assertEqual(await tournament_name(), "updated")
+        self.tournament.name = "saved"
+        await self.tournament.save()
+        self.assertEqual(await tournament_name(), "saved")
+        # Deletes cascade to the referencing tables
+        await self.tournament.delete()
+        self.assertEqual(await count(), 0)
+
+    async def test_prefetch(self):
+        team = await Team.create(name="team")
+
+        async def teams() -> list[str]:
+            event = await Event.get(pk=self.event.pk).prefetch_related("participants").cache()
+            return [team.name for team in event.participants]
+
+        async def filtered() -> int:
+            tournament = (
+                await Tournament.get(pk=self.tournament.pk)
+                .prefetch_related(Prefetch("events", Event.filter(name="e1")))
+                .cache()
+            )
+            return len(tournament.events)
+
+        self.assertEqual((await teams(), await filtered()), ([], 1))
+        await self.event.participants.add(team)
+        self.assertEqual(await teams(), ["team"])
+        await Event.filter(pk=self.event.pk).update(name="renamed")
+        self.assertEqual(await filtered(), 0)
+
+    async def test_write_while_executing(self):
+        class Writer(QueryListener):
+            def before_query(self, event: QueryEvent) -> None:
+                # A concurrent write to the prefetched table while the query is in flight
+                RESULT_CACHE.invalidate("event_team")
+
+        writer = Writer()
+        add_query_listener(writer)
+        try:
+            await Event.get(pk=self.event.pk).prefetch_related("participants").cache()
+        finally:
+            remove_query_listener(writer)
+        await Event.get(pk=self.event.pk).prefetch_related("participants").cache()
+        self.assertEqual(len(self.counter.queries), 4)
+        self.assertEqual(RESULT_CACHE.stats()["hits"], 0)
+
+    async def test_key_and_transaction(self):
+        await Event.filter(name="e1").cache(key="events")
+        self.assertEqual(len(await Event.filter(name="e2").cache(key="events")), 1)
+        self.assertEqual(len(self.counter.queries), 1)
+        async with in_transaction():
+            await Event.filter(name="e3").cache(key="events")
+        self.assertEqual(len(self.counter.queries), 2)
+
+    async def test_transaction_invalidation(self):
+        async with in_transaction():
+            await Event.filter(pk=self.event.pk).update(name="e3")
+            # A connection outside the transaction caches rows before the commit
+            versions = RESULT_CACHE.versions([Event._meta.db_table])
+            await RESULT_CACHE.set("events", versions, ["stale"], None)
+        self.assertEqual(len(await Event.filter(name="e1").cache(key="events")), 0)
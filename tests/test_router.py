@@ -0,0 +1,164 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+from tests.testmodels import Tournament
+from tortoise import Tortoise, connections
+from tortoise.contrib import test
+from tortoise.exceptions import ConfigurationError, OperationalError
+from tortoise.router import ReplicaSet, router
+from tortoise.transactions import in_transaction
+from tortoise.utils import get_schema_sql
+
+
+class TestReplicaSetConfig(test.SimpleTestCase):
+    def test_list_config(self):
+        replica_set = ReplicaSet.from_config("default", ["replica1", "replica2"])
+        self.assertEqual(replica_set.balancing, "round_robin")
+        self.assertEqual([r.alias for r in replica_set.replicas], ["replica1", "replica2"])
+
+    def test_invalid_config(self):
+        for config, message in (
+            ([], "must define replicas"),
+            ({"balancing": "latency"}, "must define replicas"),
+            (["default"], "can't be its own replica"),
+            ({"replicas": ["replica1"], "balancing": "random"}, "Unknown balancing"),
+            ({"replicas": ["replica1"], "weights": [1]}, "Invalid replica set"),
+        ):
+            with self.assertRaisesRegex(ConfigurationError, message):
+                ReplicaSet.from_config("default", config)
+
+    async def test_unknown_connection(self):
+        with self.assertRaisesRegex(ConfigurationError, "alias 'replica3'"):
+            await Tortoise.init(
+                {
+                    "connections": {"default": "sqlite://:memory:"},
+                    "apps": {"models": {"models": ["tests.testmodels"]}},
+                    "replicas": {"default": ["replica3"]},
+                }
+            )
+
+
+class TestReplicaRouting(test.SimpleTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        await Tortoise.init(
+            {
+                "connections": {
+                    "default": "sqlite://:memory:",
+                    "replica1": "sqlite://:memory:",
+                    "replica2": "sqlite://:memory:",
+                },
+                "apps": {"models": {"models": ["tests.testmodels"]}},
+            },
+            replicas={"default": {"replicas": ["replica1", "replica2"]}},
+        )
+        await Tortoise.generate_schemas()
+        schema = get_schema_sql(connections.get("default"), safe=False)
+        for alias in ("replica1", "replica2"):
+            await connections.get(alias).execute_script(schema)
+        self.replica_set = router.replica_sets["default"]
+        self.replica_set.health_check_interval = 0
+        await Tournament.create(name="default")
+        for alias in ("replica1", "replica2"):
+            await Tournament.create(name=alias, using_db=connections.get(alias))
+
+    async def asyncTearDown(self):
+        router.init_replicas(None)
+        await connections.close_all()
+        await super().asyncTearDown()
+
+    async def read(self) -> str:
+        return (await Tournament.all().limit(1))[0].name
+
+    async def reads(self, count: int = 4) -> list[str]:
+        return [await self.read() for _ in range(count)]
+
+    async def test_round_robin(self):
+        self.assertEqual(await self.reads(), ["replica1", "replica2", "replica1", "replica2"])
+        self.assertEqual(await Tournament.filter(name="default").count(), 0)
+        self.assertEqual(connections.get("default").outstanding, 0)
+
+    async def test_writes_go_to_primary(self):
+        tournament = await Tournament.first()
+        await Tournament.filter(id=tournament.id).update(name="updated")
+        self.assertEqual(
+            await Tournament.all().using_db(connections.get("default")).values_list("name"),
+            [("updated",)],
+        )
+
+    async def test_transaction_pins_primary(self):
+        async with in_transaction("default"):
+            self.assertEqual(await self.reads(2), ["default", "default"])
+        self.assertEqual(await self.reads(2), ["replica1", "replica2"])
+
+    async def test_read_after_write(self):
+        self.replica_set.read_after_write = 60
+        self.assertEqual(await self.read(), "replica1")
+        await Tournament.create(name="new")
+        self.assertEqual(await self.reads(2), ["default", "default"])
+        self.replica_set._last_write.set(time.monotonic() - 120)
+        self.assertEqual(await self.read(), "replica2")
+
+    async def test_least_outstanding(self):
+        self.replica_set.balancing = "least_outstanding"
+        self.assertEqual(await self.reads(2), ["replica1", "replica2"])
+        connections.get("replica1").pool_metrics.in_use += 1
+        try:
+            self.assertEqual(await self.reads(2), ["replica2", "replica2"])
+        finally:
+            connections.get("replica1").pool_metrics.in_use -= 1
+
+    async def test_latency(self):
+        self.replica_set.balancing = "latency"
+        self.replica_set.replicas[0].latency = 1.0
+        self.replica_set.replicas[1].latency = 1e-6
+        self.assertEqual(set(await self.reads(10)), {"replica2"})
+
+    async def test_health_check_failover(self):
+        replica1 = connections.get("replica1")
+        with patch.object(replica1, "execute_query", side_effect=OperationalError("gone")):
+            await self.replica_set.check()
+            self.assertEqual(await self.reads(2), ["replica2", "replica2"])
+            status = self.replica_set.status()
+            self.assertFalse(status["replica1"]["healthy"])
+            self.assertEqual(status["replica1"]["failures"], 1)
+            self.assertTrue(status["replica2"]["healthy"])
+            self.assertIsNotNone(status["replica2"]["latency"])
+
+            with patch.object(
+                connections.get("replica2"), "execute_query", side_effect=TimeoutError
+            ):
+                await self.replica_set.check()
+                self.assertEqual(await self.reads(2), ["default", "default"])
+
+        await self.replica_set.check()
+        self.assertEqual(set(await self.reads()), {"replica1", "replica2"})
+        self.assertEqual(self.replica_set.status()["replica1"]["failures"], 0)
+
+    async def test_scheduled_health_check(self):
+        self.replica_set.health_check_interval = 60
+        await self.read()
+        task = self.replica_set._check_task
+        self.assertIsNotNone(task)
+        await task
+        await self.read()
+        self.assertIs(self.replica_set._check_task, task)
+        self.assertIsNotNone(self.replica_set.replicas[0].latency)
+
+    async def test_close_cancels_health_check(self):
+        self.replica_set.health_check_interval = 60
+        await self.read()
+        task = self.replica_set._check_task
+        await Tortoise.close_connections()
+        self.assertIsNone(self.replica_set._check_task)
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+
+    async def test_ping_query(self):
+        replica1 = connections.get("replica1")
+        with patch.object(replica1, "ping_query", "SELECT 2"):
+            with patch.object(replica1, "execute_query", wraps=replica1.execute_query) as execute:
+                await self.replica_set.check()
+        execute.assert_called_once_with("SELECT 2")
+        self.assertTrue(self.replica_set.status()["replica1"]["healthy"])
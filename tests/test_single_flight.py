@@ -0,0 +1,127 @@
+import asyncio
+
+from tests.testmodels import Event, Tournament
+from tests.utils.query_counter import QueryCounter
+from tortoise.backends.base.client import (
+    SINGLE_FLIGHT,
+    SingleFlight,
+    add_query_listener,
+    remove_query_listener,
+)
+from tortoise.backends.sqlite import SqliteClient
+from tortoise.contrib import test
+from tortoise.transactions import in_transaction
+
+
+class TestSingleFlightUnit(test.SimpleTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.client = SqliteClient(file_path=":memory:", connection_name="single_flight")
+        self.flight = SingleFlight()
+        self.calls = 0
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await super().asyncTearDown()
+
+    async def slow_read(self, rows: list, delay: float = 0.01):
+        self.calls += 1
+        await asyncio.sleep(delay)
+        return rows
+
+    async def test_copies(self):
+        rows = [{"a": 1}]
+        results = await asyncio.gather(
+            *(
+                self.flight.run(
+                    self.client, "execute_query_dict", "SELECT", [1], lambda: self.slow_read(rows)
+                )
+                for _ in range(3)
+            )
+        )
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results, [rows] * 3)
+        results[0][0]["a"] = 2
+        self.assertEqual((results[1][0]["a"], rows[0]["a"]), (1, 1))
+        self.assertEqual((self.flight.queries, self.flight.shared), (1, 2))
+
+    async def test_errors(self):
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("failed")
+
+        def run(call):
+            return self.flight.run(self.client, "execute_query", "SELECT", None, call)
+
+        results = await asyncio.gather(run(failing), run(failing), return_exceptions=True)
+        self.assertEqual([str(exc) for exc in results], ["failed", "failed"])
+
+        # The reads waiting for a cancelled read run it themselves
+        leader = asyncio.ensure_future(run(lambda: self.slow_read([1])))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(run(lambda: self.slow_read([2])))
+        await asyncio.sleep(0)
+        leader.cancel()
+        self.assertEqual(await follower, [2])
+        self.assertTrue(leader.cancelled())
+
+    async def test_write_in_between(self):
+        def run(rows):
+            return self.flight.run(
+                self.client, "execute_query_dict", "SELECT", None, lambda: self.slow_read(rows)
+            )
+
+        first = asyncio.ensure_future(run([1]))
+        await asyncio.sleep(0)
+        # The running read may not see the write, the reads issued after it don't join it
+        await self.client.execute_query("CREATE TABLE t (a INT)")
+        self.assertEqual(await asyncio.gather(first, run([2]), run([2])), [[1], [2], [2]])
+        self.assertEqual(self.calls, 2)
+
+    async def test_transaction_writes(self):
+        writes = self.client._writes
+        async with self.client._in_transaction() as conn:
+            await conn.execute_query("CREATE TABLE t (a INT)")
+            await conn.execute_query("SELECT 1")
+            self.assertEqual(self.client._writes, writes)
+        # Visible to the other reads once committed
+        self.assertEqual(self.client._writes, writes + 1)
+
+
+class TestSingleFlight(test.TruncationTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        tournament = await Tournament.create(name="t")
+        await Event.create(name="e", tournament=tournament)
+        SINGLE_FLIGHT.reset_stats()
+        self.counter = QueryCounter()
+        add_query_listener(self.counter)
+
+    async def asyncTearDown(self):
+        remove_query_listener(self.counter)
+        SINGLE_FLIGHT.enabled = False
+        await super().asyncTearDown()
+
+    async def test_shared(self):
+        events = await asyncio.gather(
+            *(Event.filter(name="e").prefetch_related("tournament").shared() for _ in range(5))
+        )
+        self.assertEqual(len(self.counter.queries), 2)
+        self.assertEqual({e[0].tournament.name for e in events}, {"t"})
+        self.assertEqual(len({id(e[0]) for e in events}), 5)
+        self.assertEqual(SINGLE_FLIGHT.stats(), {"enabled": False, "queries": 2, "shared": 8})
+        await asyncio.gather(*(Event.filter(name="e") for _ in range(2)))
+        self.assertEqual(len(self.counter.queries), 4)
+
+    async def test_enabled(self):
+        SINGLE_FLIGHT.enabled = True
+        values = await asyncio.gather(
+            *(Event.filter(name="e").values("name", "modified") for _ in range(3)),
+            Event.filter(name="e").shared(False),
+        )
+        self.assertEqual(len(self.counter.queries), 2)
+        self.assertEqual(values[0], values[1])
+        self.assertEqual(values[0][0]["modified"], values[3][0].modified)
+        async with in_transaction():
+            await asyncio.gather(*(Event.filter(name="e") for _ in range(2)))
+        self.assertEqual(len(self.counter.queries), 4)
@@ -1,3 +1,5 @@
+import sqlite3
+
 from tests.testmodels import CharPkModel, IntFields
 from tortoise import connections
 from tortoise.backends.psycopg.client import PsycopgClient
@@ -156,44 +158,56 @@ class TestSQL(test.TestCase):
         sql = IntFields.bulk_update([obj1, obj2], fields=["intnum"]).sql()
 
         if self.dialect == "mysql":
-            expected = "UPDATE `intfields` SET `intnum`=CASE WHEN `id`=%s THEN %s WHEN `id`=%s THEN %s END WHERE `id` IN (%s,%s)"
+            expected = "UPDATE `intfields` JOIN (SELECT %s AS `column1`,%s AS `column2` UNION ALL SELECT %s,%s) `_v` ON `intfields`.`id`=`_v`.`column1` SET `intfields`.`intnum`=`_v`.`column2`"
         elif self.dialect == "postgres":
             if self.is_psycopg:
-                expected = 'UPDATE "intfields" SET "intnum"=CASE WHEN "id"=%s THEN CAST(%s AS INT) WHEN "id"=%s THEN CAST(%s AS INT) END WHERE "id" IN (%s,%s)'
+                expected = 'UPDATE "intfields" SET "intnum"="_v"."column2" FROM (VALUES (CAST(%s AS INT),CAST(%s AS INT)),(%s,%s)) "_v" WHERE "intfields"."id"="_v"."column1"'
             else:
-                expected = 'UPDATE "intfields" SET "intnum"=CASE WHEN "id"=$1 THEN CAST($2 AS INT) WHEN "id"=$3 THEN CAST($4 AS INT) END WHERE "id" IN ($5,$6)'
+                expected = 'UPDATE "intfields" SET "intnum"="_v"."column2" FROM (VALUES (CAST($1 AS INT),CAST($2 AS INT)),($3,$4)) "_v" WHERE "intfields"."id"="_v"."column1"'
+        elif self.dialect == "sqlite" and sqlite3.sqlite_version_info >= (3, 33):
+            expected = 'UPDATE "intfields" SET "intnum"="_v"."column2" FROM (VALUES (?,?),(?,?)) "_v" WHERE "intfields"."id"="_v"."column1"'
         else:
             expected = 'UPDATE "intfields" SET "intnum"=CASE WHEN "id"=? THEN ? WHEN "id"=? THEN ? END WHERE "id" IN (?,?)'
         self.assertEqual(sql, expected)
+        # Filtered querysets keep a CASE per field
+        sql = IntFields.filter(intnum__gt=0).bulk_update([obj1], fields=["intnum"]).sql()
+        self.assertIn("CASE WHEN", sql)
 
     async def test_bulk_create_autogenerated_pk(self):
         sql = IntFields.bulk_create(
             [IntFields(intnum=1, intnum_null=2), IntFields(intnum=3, intnum_null=4)]
         ).sql()
         if self.dialect == "mysql":
-            expected = "INSERT INTO `intfields` (`intnum`,`intnum_null`) VALUES (%s,%s)"
+            expected = "INSERT INTO `intfields` (`intnum`,`intnum_null`) VALUES (%s,%s),(%s,%s)"
         elif self.dialect == "postgres":
             if self.is_psycopg:
-                expected = (
-                    'INSERT INTO "intfields" ("intnum","intnum_null") VALUES (%s,%s) RETURNING "id"'
-                )
+                expected = 'INSERT INTO "intfields" ("intnum","intnum_null") VALUES (%s,%s),(%s,%s) RETURNING "id"'
             else:
-                expected = (
-                    'INSERT INTO "intfields" ("intnum","intnum_null") VALUES ($1,$2) RETURNING "id"'
-                )
+                expected = 'INSERT INTO "intfields" ("intnum","intnum_null") VALUES ($1,$2),($3,$4) RETURNING "id"'
+        elif self.dialect == "mssql" or (
+            self.dialect == "sqlite" and sqlite3.sqlite_version_info < (3, 35)
+        ):
+            # MSSQL doesn't output the keys in the order of the rows, so they aren't returned
+            expected = 'INSERT INTO "intfields" ("intnum","intnum_null") VALUES (?,?),(?,?)'
         else:
-            expected = 'INSERT INTO "intfields" ("intnum","intnum_null") VALUES (?,?)'
+            expected = (
+                'INSERT INTO "intfields" ("intnum","intnum_null") VALUES (?,?),(?,?) RETURNING "id"'
+            )
         self.assertEqual(sql, expected)
 
     async def test_bulk_create_specified_pk(self):
         sql = IntFields.bulk_create([IntFields(id=1, intnum=1), IntFields(id=2, intnum=2)]).sql()
         if self.dialect == "mysql":
-            expected = "INSERT INTO `intfields` (`id`,`intnum`,`intnum_null`) VALUES (%s,%s,%s)"
+            expected = (
+                "INSERT INTO `intfields` (`id`,`intnum`,`intnum_null`) VALUES (%s,%s,%s),(%s,%s,%s)"
+            )
         elif self.dialect == "postgres":
             if self.is_psycopg:
-                expected = 'INSERT INTO "intfields" ("id","intnum","intnum_null") VALUES (%s,%s,%s)'
+                expected = 'INSERT INTO "intfields" ("id","intnum","intnum_null") VALUES (%s,%s,%s),(%s,%s,%s)'
             else:
-                expected = 'INSERT INTO "intfields" ("id","intnum","intnum_null") VALUES ($1,$2,$3)'
+                expected = 'INSERT INTO "intfields" ("id","intnum","intnum_null") VALUES ($1,$2,$3),($4,$5,$6)'
         else:
-            expected = 'INSERT INTO "intfields" ("id","intnum","intnum_null") VALUES (?,?,?)'
+            expected = (
+                'INSERT INTO "intfields" ("id","intnum","intnum_null") VALUES (?,?,?),(?,?,?)'
+            )
         self.assertEqual(sql, expected)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import uuid
 from datetime import datetime, timedelta
 from typing import Any
+from unittest.mock import patch
 
 import pytz
 from pypika_tortoise.terms import Function as PupikaFunction
@@ -22,6 +23,7 @@ from tests.testmodels import (
     Tournament,
     UUIDFields,
 )
+from tortoise.backends.sqlite.executor import SqliteExecutor
 from tortoise.contrib import test
 from tortoise.contrib.test.condition import In, NotEQ
 from tortoise.expressions import Case, F, Q, Subquery, When
@@ -137,6 +139,37 @@ class TestUpdate(test.TestCase):
             (await EnumFields.get(pk=objs[1].pk)).service, Service.system_administration
         )
 
+    async def test_bulk_update_batches(self):
+        tournaments = [await Tournament.create(name="t1"), await Tournament.create(name="t2")]
+        events = [await Event.create(name=str(i), tournament=tournaments[0]) for i in range(5)]
+        for event in events:
+            event.name = f"renamed {event.name}"
+            event.tournament = tournaments[1]
+        rows_affected = await Event.bulk_update(events, fields=["name", "tournament"], batch_size=2)
+        self.assertEqual(rows_affected, 5)
+        self.assertEqual(
+            sorted(await Event.filter(tournament=tournaments[1]).values_list("name", flat=True)),
+            [f"renamed {i}" for i in range(5)],
+        )
+        # Filtered querysets only update the matching rows
+        events[0].name = events[1].name = "filtered"
+        rows_affected = await Event.filter(pk=events[0].pk).bulk_update(events, fields=["name"])
+        self.assertEqual(rows_affected, 1)
+        self.assertEqual((await Event.get(pk=events[1].pk)).name, "renamed 1")
+
+    @test.requireCapability(dialect="sqlite")
+    async def test_bulk_update_case_fallback(self):
+        objs = [await Tournament.create(name=str(i)) for i in range(3)]
+        for obj in objs:
+            obj.desc = obj.name
+        await objs[2].delete()
+        with patch.object(SqliteExecutor, "get_bulk_update_sql", return_value=None):
+            query = Tournament.bulk_update(objs, fields=["desc"])
+            self.assertIn("CASE WHEN", query.sql())
+            # The rows the DB updated, not the objects
+            self.assertEqual(await query, 2)
+        self.assertEqual((await Tournament.get(pk=objs[1].pk)).desc, "1")
+
     async def test_update_auto_now(self):
         obj = await DefaultUpdate.create()
 
@@ -0,0 +1,91 @@
+from unittest.mock import patch
+
+from tests.testmodels import Tournament, UniqueName, UniqueTogetherFieldsWithFK
+from tests.utils.query_counter import QueryCounter
+from tortoise.backends.base.client import add_query_listener, remove_query_listener
+from tortoise.contrib import test
+from tortoise.models import Model
+from tortoise.signals import Signals, post_save
+
+
+@test.requireCapability(support_upsert=True)
+class TestUpsert(test.TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.counter = QueryCounter()
+        add_query_listener(self.counter)
+
+    async def asyncTearDown(self):
+        remove_query_listener(self.counter)
+        await super().asyncTearDown()
+
+    def test_unique_keys(self):
+        self.assertIn(frozenset({"name"}), UniqueName._meta.unique_keys)
+        self.assertIn(frozenset({"id"}), UniqueName._meta.unique_keys)
+        self.assertIn(
+            frozenset({"text", "tournament_id"}), UniqueTogetherFieldsWithFK._meta.unique_keys
+        )
+
+    async def test_get_or_create(self):
+        obj, created = await UniqueName.get_or_create(name="a", defaults={"optional": "o"})
+        self.assertTrue(created)
+        self.assertEqual((obj.name, obj.optional), ("a", "o"))
+        self.assertEqual(len(self.counter.queries), 2)
+        self.assertIn("ON CONFLICT", self.counter.queries[1])
+        self.assertEqual(obj, await UniqueName.get(name="a"))
+        # A row created after the SELECT is skipped by the INSERT and selected again
+        self.counter.queries.clear()
+        obj, created = await UniqueName._create_or_get(UniqueName._meta.db, {}, name="a")
+        self.assertFalse(created)
+        self.assertEqual(len(self.counter.queries), 2)
+        self.assertEqual(await UniqueName.all().count(), 1)
+
+    async def test_update_or_create(self):
+        obj, created = await UniqueName.update_or_create(name="a", defaults={"optional": "o"})
+        self.assertTrue(created)
+        self.assertEqual(obj.optional, "o")
+        obj2, created = await UniqueName.update_or_create(name="a", defaults={"optional": "p"})
+        self.assertFalse(created)
+        self.assertEqual((obj2.pk, obj2.optional), (obj.pk, "p"))
+        self.assertEqual(len(self.counter.queries), 3)
+        self.assertEqual((await UniqueName.get(name="a")).optional, "p")
+        # Without fields to update the row is selected
+        obj3, created = await UniqueName.update_or_create(name="a")
+        self.assertFalse(created)
+        self.assertEqual(obj3.optional, "p")
+
+    async def test_relations(self):
+        tournament = await Tournament.create(name="t")
+        self.counter.queries.clear()
+        obj, created = await UniqueTogetherFieldsWithFK.get_or_create(
+            text="a", tournament=tournament
+        )
+        self.assertTrue(created)
+        self.assertEqual(obj.tournament_id, tournament.pk)
+        self.assertEqual(len(self.counter.queries), 2)
+
+    async def test_fallback(self):
+        # Not a unique key
+        await UniqueName.update_or_create(optional="a", defaults={"other_optional": "b"})
+        self.assertNotIn("ON CONFLICT", "".join(self.counter.queries))
+
+        async def listener(*args):
+            pass
+
+        post_save(UniqueName)(listener)
+        try:
+            await UniqueName.get_or_create(name="b")
+            self.assertNotIn("ON CONFLICT", "".join(self.counter.queries))
+        finally:
+            UniqueName._listeners[Signals.post_save][UniqueName].remove(listener)
+
+    async def test_overridden_save(self):
+        async def save(self, *args, **kwargs):
+            self.optional = "saved"
+            await Model.save(self, *args, **kwargs)
+
+        with patch.object(UniqueName, "save", save):
+            obj, created = await UniqueName.get_or_create(name="c")
+        self.assertTrue(created)
+        self.assertEqual(obj.optional, "saved")
+        self.assertNotIn("ON CONFLICT", "".join(self.counter.queries))
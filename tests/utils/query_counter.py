@@ -0,0 +1,13 @@
+from tortoise.backends.base.client import QueryEvent, QueryListener
+
+
+class QueryCounter(QueryListener):
+    """Records the queries run by the DB clients while added as a query listener"""
+
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+        self.params: list[int] = []
+
+    def after_query(self, event: QueryEvent) -> None:
+        self.queries.append(event.sql)
+        self.params.append(event.params)
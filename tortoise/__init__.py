@@ -15,7 +15,7 @@ from typing import Any, cast
 
 from pypika_tortoise import Query, Table
 
-from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.backends.base.client import BaseDBAsyncClient, pipeline
 from tortoise.backends.base.config_generator import expand_db_url, generate_config
 from tortoise.connection import connections
 from tortoise.exceptions import ConfigurationError
@@ -27,8 +27,13 @@ from tortoise.fields.relational import (
     OneToOneFieldInstance,
 )
 from tortoise.filters import get_m2m_filters
+from tortoise.identity import session
+from tortoise.loader import batch_loading
 from tortoise.log import logger
 from tortoise.models import Model, ModelMeta
+from tortoise.profiling import profile
+from tortoise.query_cache import QUERY_CACHE
+from tortoise.query_stats import QUERY_STATS
 from tortoise.timezone import _reset_timezone_cache
 from tortoise.utils import generate_schema_for_client
 
@@ -378,6 +383,7 @@ class Tortoise:
 
     @classmethod
     def _build_initial_querysets(cls) -> None:
+        QUERY_CACHE.clear()
         for app in cls.apps.values():
             for model in app.values():
                 model._meta.finalise_model()
@@ -400,6 +406,7 @@ class Tortoise:
         timezone: str = "UTC",
         routers: list[str | type] | None = None,
         table_name_generator: Callable[[type[Model]], str] | None = None,
+        replicas: dict[str, list[str] | dict[str, Any]] | None = None,
     ) -> None:
         """
         Sets up Tortoise-ORM: loads apps and models, configures database connections but does not
@@ -440,6 +447,13 @@ class Tortoise:
                             }
                         },
                         'routers': ['path.router1', 'path.router2'],
+                        # Reads of models on 'default' are spread over its replicas
+                        'replicas': {
+                            'default': {
+                                'replicas': ['replica1', 'replica2'],
+                                'balancing': 'round_robin',
+                            }
+                        },
                         'use_tz': False,
                         'timezone': 'UTC'
                     }
@@ -465,6 +479,9 @@ class Tortoise:
             A callable that generates table names. The model class will be passed as its argument.
             If not provided, Tortoise will use the lowercase model name as the table name.
             Example: ``lambda cls: f"prefix_{cls.__name__.lower()}"``
+        :param replicas:
+            Read replicas of connections, keyed by the alias of the primary connection.
+            See :ref:`replicas`
 
         :raises ConfigurationError: For any configuration error
         """
@@ -497,6 +514,7 @@ class Tortoise:
         use_tz = config.get("use_tz", use_tz)
         timezone = config.get("timezone", timezone)
         routers = config.get("routers", routers)
+        replicas = config.get("replicas", replicas)
 
         cls.table_name_generator = table_name_generator
 
@@ -511,7 +529,7 @@ class Tortoise:
         cls._init_timezone(use_tz, timezone)
         await connections._init(connections_config, _create_db)
         cls._init_apps(apps_config)
-        cls._init_routers(routers)
+        cls._init_routers(routers, replicas)
 
         cls._inited = True
 
@@ -535,7 +553,11 @@ class Tortoise:
         return str_connection_config
 
     @classmethod
-    def _init_routers(cls, routers: list[str | type] | None = None) -> None:
+    def _init_routers(
+        cls,
+        routers: list[str | type] | None = None,
+        replicas: dict[str, list[str] | dict[str, Any]] | None = None,
+    ) -> None:
         from tortoise.router import router
 
         routers = routers or []
@@ -552,6 +574,7 @@ class Tortoise:
             else:
                 raise ConfigurationError("Router must be either str or type")
         router.init_routers(router_cls)
+        router.init_replicas(replicas)
 
     @classmethod
     async def close_connections(cls) -> None:
@@ -569,6 +592,32 @@ class Tortoise:
         await connections.close_all()
         logger.info("Tortoise-ORM shutdown")
 
+    @classmethod
+    def stats(cls) -> list[dict[str, Any]]:
+        """
+        Returns the statistics of the queries run since they were enabled with
+        ``QUERY_STATS.enable()``, aggregated by query shape and sorted by decreasing total time.
+
+        .. code-block:: python3
+
+            from tortoise.query_stats import QUERY_STATS
+
+            QUERY_STATS.enable()
+            ...
+            for shape in Tortoise.stats()[:10]:
+                print(shape["total_time"], shape["calls"], shape["p99_time"], shape["query"])
+
+        See :class:`~tortoise.query_stats.QueryStats` for details.
+        """
+        return QUERY_STATS.stats()
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        """
+        Drops the query statistics collected so far.
+        """
+        QUERY_STATS.reset_stats()
+
     @classmethod
     async def _reset_apps(cls) -> None:
         for app in cls.apps.values():
@@ -652,5 +701,9 @@ __all__ = [
     "Tortoise",
     "BaseDBAsyncClient",
     "__version__",
+    "batch_loading",
     "connections",
+    "pipeline",
+    "profile",
+    "session",
 ]
@@ -0,0 +1,154 @@
+"""
+Automatic prefetching of the relations of sibling objects.
+
+The objects of a result set are often processed in a loop that awaits the same relation on
+each of them, running one query per object. With auto prefetch, the objects returned by a
+query remember their siblings, and the first lazy access to a relation of one of them
+prefetches that relation for all of them at once, like ``prefetch_related()`` would have.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from collections.abc import Generator
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.models import Model
+
+
+class AutoPrefetch:
+    """
+    Setting and counters of the automatic prefetch of sibling relations.
+
+    :param enabled: Prefetch the relations of the siblings for all querysets, not only for
+        the ones using ``.auto_prefetch()``.
+
+    .. attribute:: prefetches
+
+        Number of relations prefetched for a result set on first access
+
+    .. attribute:: absorbed
+
+        Number of reads of the prefetched relations by the other siblings, each a lazy load
+        made unnecessary by those prefetches
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.prefetches = 0
+        self.absorbed = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns the counters.
+        """
+        return {"enabled": self.enabled, "prefetches": self.prefetches, "absorbed": self.absorbed}
+
+    def reset_stats(self) -> None:
+        """
+        Resets the counters.
+        """
+        self.prefetches = 0
+        self.absorbed = 0
+
+
+#: The global auto prefetch setting and counters
+AUTO_PREFETCH = AutoPrefetch()
+
+
+class SiblingGroup:
+    """
+    The objects returned by the same query, which prefetches a relation for all of them the
+    first time it is lazily loaded for one of them.
+
+    Like other lazy loads, the prefetch runs on the client of the model at the time of the
+    access, as the transaction the objects were fetched in may have ended. The siblings are
+    referenced weakly, so that keeping one of them doesn't keep the whole result set alive.
+    """
+
+    __slots__ = ("_refs", "_prefetches", "_unread")
+
+    def __init__(self, instances: list[Model]) -> None:
+        self._refs = [weakref.ref(instance) for instance in instances]
+        self._prefetches: dict[str, asyncio.Future] = {}
+        # Ids of the siblings that didn't read the prefetched relations yet
+        self._unread: dict[str, set[int]] = {}
+
+    @property
+    def instances(self) -> list[Model]:
+        """
+        The siblings still alive.
+        """
+        return [instance for ref in self._refs if (instance := ref()) is not None]
+
+    @classmethod
+    def attach(cls, instances: list[Model]) -> None:
+        """
+        Makes the objects siblings of each other.
+        """
+        group = cls(instances)
+        for instance in instances:
+            instance._siblings = group
+
+    async def _prefetch(self, field: str, instance: Model) -> None:
+        instances = self.instances
+        model = type(instance)
+        db = model._choose_db()
+        try:
+            await db.executor_class(model=model, db=db).fetch_for_list(instances, field)
+        except BaseException:
+            # Let the next access try again
+            del self._prefetches[field]
+            raise
+        AUTO_PREFETCH.prefetches += 1
+        self._unread[field] = {id(sibling) for sibling in instances if sibling is not instance}
+
+    async def prefetch(self, field: str, instance: Model) -> None:
+        """
+        Prefetches the relation for all the siblings, once, on its read from ``instance``.
+        """
+        task = self._prefetches.get(field)
+        if task is None:
+            task = self._prefetches[field] = asyncio.ensure_future(self._prefetch(field, instance))
+        # The prefetch is shared, so it must not be cancelled with one of its waiters
+        await asyncio.shield(task)
+        self.read(instance, field)
+
+    def read(self, instance: Model, field: str) -> None:
+        """
+        Records a read of the relation from ``instance``, counted as absorbed the first time
+        a sibling reads a relation prefetched on the read of another one.
+        """
+        unread = self._unread.get(field)
+        if unread and id(instance) in unread:
+            unread.remove(id(instance))
+            AUTO_PREFETCH.absorbed += 1
+
+    def load(self, instance: Model, field: str) -> RelatedLoad:
+        """
+        Returns an awaitable of the related object of ``instance``, loaded with the siblings.
+        """
+        return RelatedLoad(self, instance, field)
+
+
+class RelatedLoad:
+    """
+    Lazy awaitable of a related object loaded by a :class:`SiblingGroup`, which only queries
+    the DB when awaited, like the queryset it replaces.
+    """
+
+    __slots__ = ("group", "instance", "field")
+
+    def __init__(self, group: SiblingGroup, instance: Model, field: str) -> None:
+        self.group = group
+        self.instance = instance
+        self.field = field
+
+    async def _load(self) -> Model | None:
+        await self.group.prefetch(self.field, self.instance)
+        return getattr(self.instance, f"_{self.field}", None)
+
+    def __await__(self) -> Generator[Any, None, Model | None]:
+        return self._load().__await__()
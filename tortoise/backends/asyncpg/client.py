@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any, TypeVar
 
 import asyncpg
@@ -15,6 +15,8 @@ from tortoise.backends.base.client import (
     TransactionalDBClient,
     TransactionContext,
     TransactionContextPooled,
+    instrument_copy,
+    instrument_query,
 )
 from tortoise.backends.base_postgres.client import (
     BasePostgresClient,
@@ -57,6 +59,9 @@ class AsyncpgDBClient(BasePostgresClient):
             "server_settings": self.server_settings,
             **self.extra,
         }
+        if not self.statement_cache.enabled:
+            # Nor does asyncpg for the queries that don't go through the statement cache
+            self._template["statement_cache_size"] = 0
         try:
             self._pool = await self.create_pool(password=self.password, **self._template)
             self.log.debug("Created connection pool %s with params: %s", self._pool, self._template)
@@ -75,6 +80,11 @@ class AsyncpgDBClient(BasePostgresClient):
         if self._pool:  # pragma: nobranch
             await self._pool.expire_connections()
 
+    def _pool_sizes(self) -> tuple[int, int, int]:
+        if not self._pool:
+            return 0, 0, self.pool_maxsize
+        return self._pool.get_size(), self._pool.get_idle_size(), self.pool_maxsize
+
     async def _close(self) -> None:
         if self._pool:  # pragma: nobranch
             try:
@@ -104,18 +114,21 @@ class AsyncpgDBClient(BasePostgresClient):
     def _in_transaction(self) -> TransactionContext:
         return TransactionContextPooled(TransactionWrapper(self), self._pool_init_lock)
 
+    @instrument_query
     @translate_exceptions
     async def execute_insert(self, query: str, values: list) -> asyncpg.Record | None:
         async with self.acquire_connection() as connection:
             self.log.debug("%s: %s", query, values)
-            # TODO: Cache prepared statement
+            if self.statement_cache.enabled:
+                rows, _ = await self._fetch_prepared(connection, query, values)
+                return rows[0] if rows else None
             return await connection.fetchrow(query, *values)
 
+    @instrument_query
     @translate_exceptions
     async def execute_many(self, query: str, values: list) -> None:
         async with self.acquire_connection() as connection:
             self.log.debug("%s: %s", query, values)
-            # TODO: Consider using copy_records_to_table instead
             transaction = connection.transaction()
             await transaction.start()
             try:
@@ -126,6 +139,38 @@ class AsyncpgDBClient(BasePostgresClient):
             else:
                 await transaction.commit()
 
+    @instrument_copy
+    @translate_exceptions
+    async def execute_copy(
+        self,
+        table: str,
+        columns: Sequence[str],
+        values: list[list],
+        returning: str | None = None,
+        schema: str | None = None,
+    ) -> list:
+        async with self.acquire_connection() as connection:
+            self.log.debug("COPY %s (%s): %s", table, ", ".join(columns), values)
+            if not returning:
+                await connection.copy_records_to_table(
+                    table, records=values, columns=columns, schema_name=schema
+                )
+                return []
+            temp_table, copy_columns, (create, insert, drop) = self._copy_returning_queries(
+                table, columns, returning, schema
+            )
+            async with connection.transaction():
+                await connection.execute(create)
+                await connection.copy_records_to_table(
+                    temp_table,
+                    records=[(*row, position) for position, row in enumerate(values)],
+                    columns=copy_columns,
+                )
+                rows = await connection.fetch(insert)
+                await connection.execute(drop)
+            return [row[0] for row in rows]
+
+    @instrument_query
     @translate_exceptions
     async def execute_query(self, query: str, values: list | None = None) -> tuple[int, list[dict]]:
         async with self.acquire_connection() as connection:
@@ -134,25 +179,96 @@ class AsyncpgDBClient(BasePostgresClient):
                 params = [query, *values]
             else:
                 params = [query]
-            if query.startswith("UPDATE") or query.startswith("DELETE"):
-                res = await connection.execute(*params)
+            is_update = query.startswith("UPDATE") or query.startswith("DELETE")
+            if self.statement_cache.enabled:
+                rows, res = await self._fetch_prepared(connection, query, values)
+            elif is_update:
+                rows, res = [], await connection.execute(*params)
+            else:
+                rows, res = await connection.fetch(*params), ""
+            if is_update:
                 try:
                     rows_affected = int(res.split(" ")[1])
                 except Exception:  # pragma: nocoverage
                     rows_affected = 0
                 return rows_affected, []
 
-            rows = await connection.fetch(*params)
             return len(rows), rows
 
+    @instrument_query
     @translate_exceptions
     async def execute_query_dict(self, query: str, values: list | None = None) -> list[dict]:
         async with self.acquire_connection() as connection:
             self.log.debug("%s: %s", query, values)
+            if self.statement_cache.enabled:
+                rows, _ = await self._fetch_prepared(connection, query, values)
+                return list(map(dict, rows))
             if values:
                 return list(map(dict, await connection.fetch(query, *values)))
             return list(map(dict, await connection.fetch(query)))
 
+    async def _fetch_prepared(
+        self, connection: asyncpg.Connection, query: str, values: list | None
+    ) -> tuple[list[asyncpg.Record], str]:
+        """
+        Runs the query through a prepared statement from the statement cache.
+
+        :return: The rows and the status message of the command, such as ``UPDATE 2``.
+        """
+        # The pool hands out a new proxy on every acquire, key the cache by the real connection
+        key = getattr(connection, "_con", connection)
+        statement = self.statement_cache.get(key, query)
+        if statement is None:
+            statement = await self._prepare(connection, key, query)
+        try:
+            rows = await statement.fetch(*(values or ()))
+        except asyncpg.InvalidCachedStatementError:
+            # The schema changed since the statement was prepared, it can only be prepared
+            # again if there is no transaction that got aborted by the error
+            self.statement_cache.invalidate(key, query)
+            if connection.is_in_transaction():
+                raise
+            statement = await self._prepare(connection, key, query)
+            rows = await statement.fetch(*(values or ()))
+        return rows, statement.get_statusmsg()
+
+    async def _prepare(
+        self, connection: asyncpg.Connection, key: Any, query: str
+    ) -> asyncpg.prepared_stmt.PreparedStatement:
+        statement = await connection.prepare(query)
+        evicted = self.statement_cache.put(key, query, statement)
+        if evicted is not None:
+            # Released on the server now, asyncpg would only close it once garbage collected
+            await connection.execute(f'DEALLOCATE "{evicted.get_name()}"')
+        return statement
+
+    @translate_exceptions
+    async def _stream_open(
+        self, connection: asyncpg.Connection, query: str, values: list | None
+    ) -> tuple[asyncpg.cursor.Cursor, Transaction | None]:
+        # Cursors can only exist inside a transaction
+        transaction = None
+        if not connection.is_in_transaction():
+            transaction = connection.transaction()
+            await transaction.start()
+        try:
+            cursor = await connection.cursor(query, *(values or []))
+        except Exception:
+            if transaction:
+                await transaction.rollback()
+            raise
+        return cursor, transaction
+
+    @translate_exceptions
+    async def _stream_fetch(
+        self, cursor: tuple[asyncpg.cursor.Cursor, Transaction | None], fetch_size: int
+    ) -> list[asyncpg.Record]:
+        return await cursor[0].fetch(fetch_size)
+
+    async def _stream_close(self, cursor: tuple[asyncpg.cursor.Cursor, Transaction | None]) -> None:
+        if transaction := cursor[1]:
+            await transaction.commit()
+
 
 class TransactionWrapper(AsyncpgDBClient, TransactionalDBClient):
     """A transactional connection wrapper for psycopg.
@@ -167,6 +283,7 @@ class TransactionWrapper(AsyncpgDBClient, TransactionalDBClient):
         self.connection_name = connection.connection_name
         self.transaction: Transaction | None = None
         self._finalized = False
+        self.statement_cache = connection.statement_cache
         self._parent: AsyncpgDBClient = connection
 
     def _in_transaction(self) -> TransactionContext:
@@ -177,11 +294,11 @@ class TransactionWrapper(AsyncpgDBClient, TransactionalDBClient):
     def acquire_connection(self) -> ConnectionWrapper[asyncpg.Connection]:
         return ConnectionWrapper(self._lock, self)
 
+    @instrument_query
     @translate_exceptions
     async def execute_many(self, query: str, values: list) -> None:
         async with self.acquire_connection() as connection:
             self.log.debug("%s: %s", query, values)
-            # TODO: Consider using copy_records_to_table instead
             await connection.executemany(query, values)
 
     @translate_exceptions
@@ -2,18 +2,37 @@ from __future__ import annotations
 
 import abc
 import asyncio
-from collections.abc import Sequence
+import logging
+import random
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    Sequence,
+)
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from copy import copy
+from functools import wraps
 from typing import Any, Generic, TypeVar, cast
+from weakref import WeakKeyDictionary
 
 from pypika_tortoise import Query
 
 from tortoise.backends.base.executor import BaseExecutor
 from tortoise.backends.base.schema_generator import BaseSchemaGenerator
 from tortoise.connection import connections
-from tortoise.exceptions import TransactionManagementError
-from tortoise.log import db_client_logger
+from tortoise.exceptions import TransactionManagementError, UnSupportedError
+from tortoise.log import db_client_logger, slow_query_logger
+from tortoise.profiling import phase, record_phase
 
 T_conn = TypeVar("T_conn")  # Instance of client connection, such as: asyncpg.Connection()
+F = TypeVar("F", bound=Callable[..., Any])
 
 
 class Capabilities:
@@ -37,6 +56,18 @@ class Capabilities:
     :param support_index_hint: Support force index or use index.
     :param support_update_limit_order_by: support update/delete with limit and order by.
     :param: support_for_posix_regex_queries: indicated if the db supports posix regex queries
+    :param support_returning: Indicates that INSERT can return the generated columns of all the
+        inserted rows, with ``RETURNING`` or ``OUTPUT``.
+    :param ordered_returning: Indicates that a multi-row INSERT returns the rows in the order
+        of its ``VALUES``, so that the generated columns can be matched to the rows by position.
+    :param ascending_generated_keys: Indicates that a multi-row INSERT generates ascending
+        primary keys in the order of its ``VALUES``, so that the returned keys can be sorted
+        to match the rows.
+    :param support_upsert: Indicates that INSERT can skip or update the rows conflicting on a
+        unique key with ``ON CONFLICT``, and that INSERT and UPDATE can return the rows.
+    :param max_query_params: Max number of bind parameters in a single query.
+    :param max_insert_rows: Max number of rows in a single INSERT, ``1`` if the DB doesn't
+        support multi-row inserts. ``None`` means only ``max_query_params`` applies.
     """
 
     def __init__(
@@ -55,6 +86,13 @@ class Capabilities:
         # support update/delete with limit and order by
         support_update_limit_order_by: bool = True,
         support_for_posix_regex_queries: bool = False,
+        support_returning: bool = False,
+        ordered_returning: bool = False,
+        ascending_generated_keys: bool = False,
+        support_upsert: bool = False,
+        # Limits of the DB or driver
+        max_query_params: int = 999,
+        max_insert_rows: int | None = None,
     ) -> None:
         super().__setattr__("_mutable", True)
 
@@ -67,6 +105,12 @@ class Capabilities:
         self.support_index_hint = support_index_hint
         self.support_update_limit_order_by = support_update_limit_order_by
         self.support_for_posix_regex_queries = support_for_posix_regex_queries
+        self.support_returning = support_returning
+        self.ordered_returning = ordered_returning
+        self.ascending_generated_keys = ascending_generated_keys
+        self.support_upsert = support_upsert
+        self.max_query_params = max_query_params
+        self.max_insert_rows = max_insert_rows
         super().__setattr__("_mutable", False)
 
     def __setattr__(self, attr: str, value: Any) -> None:
@@ -78,6 +122,801 @@ class Capabilities:
         return str(self.__dict__)
 
 
+class StatementCache:
+    """
+    LRU cache of server-side prepared statements, kept per driver connection
+    and keyed by the SQL text.
+
+    Every DB client has one, but only backends whose driver can prepare statements use it.
+    A ``max_size`` of ``0`` disables preparing statements altogether, which is required
+    behind poolers that don't pin server sessions, such as pgbouncer in transaction mode.
+
+    :param max_size: Max number of prepared statements kept per connection.
+
+    .. attribute:: hits
+
+        Number of lookups that found a prepared statement
+
+    .. attribute:: misses
+
+        Number of lookups that had to prepare the statement
+
+    .. attribute:: evictions
+
+        Number of statements dropped because the cache was full
+
+    .. attribute:: invalidations
+
+        Number of statements dropped because they became invalid, e.g. after a schema change
+    """
+
+    def __init__(self, max_size: int = 0) -> None:
+        self.max_size = max_size
+        self._statements: WeakKeyDictionary[Any, OrderedDict[str, Any]] = WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, connection: Any, query: str) -> Any:
+        """
+        Returns the prepared statement for the query on the given connection,
+        or ``None`` if it has to be prepared.
+        """
+        statements = self._statements.get(connection)
+        if statements is not None and query in statements:
+            statements.move_to_end(query)
+            self.hits += 1
+            return statements[query]
+        self.misses += 1
+        return None
+
+    def put(self, connection: Any, query: str, statement: Any) -> Any:
+        """
+        Stores a prepared statement for the query on the given connection.
+
+        :return: The least recently used statement if it was evicted to make room, else ``None``.
+        """
+        statements = self._statements.setdefault(connection, OrderedDict())
+        statements[query] = statement
+        if len(statements) > self.max_size:
+            self.evictions += 1
+            return statements.popitem(last=False)[1]
+        return None
+
+    def invalidate(self, connection: Any = None, query: str | None = None) -> None:
+        """
+        Drops cached statements, for the given connection and query if provided.
+        """
+        if connection is None:
+            caches = list(self._statements.values())
+        else:
+            caches = [self._statements.get(connection) or OrderedDict()]
+        for statements in caches:
+            if query is None:
+                self.invalidations += len(statements)
+                statements.clear()
+            elif statements.pop(query, None) is not None:
+                self.invalidations += 1
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the counters of the cache, along with the number of statements cached.
+        """
+        return {
+            "size": sum(len(statements) for statements in self._statements.values()),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def reset_stats(self) -> None:
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+
+class PoolListener:
+    """
+    Hooks called around the connection acquires of every DB client, e.g. to export
+    pool metrics to Prometheus or OpenTelemetry.
+
+    Subclass it, override the hooks you need and register it with :func:`add_pool_listener`.
+    The hooks are called synchronously on the acquiring task, so they must not block. Errors
+    they raise are logged to ``tortoise.db_client`` and don't fail the acquire or release.
+    """
+
+    def on_acquire(self, client: BaseDBAsyncClient, wait: float) -> None:
+        """
+        Called once a connection is acquired, after waiting ``wait`` seconds for it.
+        """
+
+    def on_release(self, client: BaseDBAsyncClient, held: float) -> None:
+        """
+        Called when a connection is released, after being held for ``held`` seconds.
+        """
+
+    def on_timeout(self, client: BaseDBAsyncClient, wait: float) -> None:
+        """
+        Called when acquiring a connection timed out after ``wait`` seconds.
+        """
+
+
+_pool_listeners: list[PoolListener] = []
+
+
+def add_pool_listener(listener: PoolListener) -> None:
+    """
+    Registers a listener of the connection acquires of all DB clients.
+    """
+    if listener not in _pool_listeners:
+        _pool_listeners.append(listener)
+
+
+def remove_pool_listener(listener: PoolListener) -> None:
+    """
+    Unregisters a listener added with :func:`add_pool_listener`.
+    """
+    if listener in _pool_listeners:
+        _pool_listeners.remove(listener)
+
+
+def _notify_pool_listeners(hook: str, client: BaseDBAsyncClient, duration: float) -> None:
+    # An error of a listener must not prevent the connection from being used or released
+    for listener in _pool_listeners:
+        try:
+            getattr(listener, hook)(client, duration)
+        except Exception:
+            db_client_logger.exception("Pool listener %r failed in %s", listener, hook)
+
+
+class PoolMetrics:
+    """
+    Counters of the connection acquires of a DB client, shared with its transactions.
+
+    .. attribute:: in_use
+
+        Number of connections currently acquired
+
+    .. attribute:: waiting
+
+        Number of tasks currently waiting for a connection
+
+    .. attribute:: acquired
+
+        Number of connections acquired
+
+    .. attribute:: timeouts
+
+        Number of acquires that timed out
+
+    .. attribute:: acquire_time
+
+        Total time spent waiting for connections, in seconds
+
+    .. attribute:: histogram
+
+        Number of acquires per wait time, with the upper bounds in ``buckets``
+        followed by one for longer waits
+    """
+
+    #: Upper bounds of the acquire wait time histogram, in seconds
+    buckets: tuple[float, ...] = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+    __slots__ = ("in_use", "waiting", "acquired", "timeouts", "acquire_time", "histogram")
+
+    def __init__(self) -> None:
+        self.in_use = 0
+        self.waiting = 0
+        self.reset_stats()
+
+    def start_acquire(self) -> float:
+        """
+        Records a task waiting for a connection, returns the time it started waiting.
+        """
+        self.waiting += 1
+        return time.perf_counter()
+
+    def end_acquire(
+        self, client: BaseDBAsyncClient, started: float, exc: BaseException | None = None
+    ) -> float:
+        """
+        Records the outcome of an acquire, ``exc`` being the error if it failed,
+        returns the time the connection was acquired.
+        """
+        now = time.perf_counter()
+        wait = now - started
+        self.waiting -= 1
+        record_phase("acquire", wait)
+        if exc is not None:
+            if isinstance(exc, client._pool_timeout_errors):
+                self.timeouts += 1
+                _notify_pool_listeners("on_timeout", client, wait)
+            return now
+        self.in_use += 1
+        self.acquired += 1
+        self.acquire_time += wait
+        self.histogram[bisect_left(self.buckets, wait)] += 1
+        _notify_pool_listeners("on_acquire", client, wait)
+        return now
+
+    def release(self, client: BaseDBAsyncClient, acquired_at: float) -> None:
+        """
+        Records the release of a connection acquired at ``acquired_at``.
+        """
+        self.in_use -= 1
+        if _pool_listeners:
+            _notify_pool_listeners("on_release", client, time.perf_counter() - acquired_at)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns the counters, with ``acquire_latency`` the histogram keyed by upper bound.
+        """
+        return {
+            "in_use": self.in_use,
+            "waiting": self.waiting,
+            "acquired": self.acquired,
+            "timeouts": self.timeouts,
+            "acquire_time": self.acquire_time,
+            "acquire_latency": dict(zip((*self.buckets, float("inf")), self.histogram)),
+        }
+
+    def reset_stats(self) -> None:
+        self.acquired = self.timeouts = 0
+        self.acquire_time = 0.0
+        self.histogram = [0] * (len(self.buckets) + 1)
+
+
+class QueryEvent:
+    """
+    A query run by a DB client, passed to the :class:`QueryListener` hooks.
+
+    .. attribute:: connection_name
+
+        Alias of the connection that ran the query
+
+    .. attribute:: method
+
+        Method of the client that ran the query, e.g. ``"execute_query"``
+
+    .. attribute:: sql
+
+        The SQL of the query
+
+    .. attribute:: params
+
+        Number of bound parameters, over all the rows for ``execute_many``
+
+    .. attribute:: in_transaction
+
+        If the query ran in a transaction
+
+    .. attribute:: duration
+
+        Time the query took in seconds, including waiting for a connection,
+        ``None`` before the query ran
+
+    .. attribute:: rowcount
+
+        Number of rows returned or affected, ``None`` before the query ran or if it failed
+
+    .. attribute:: error
+
+        The exception raised by the query, if any
+    """
+
+    __slots__ = (
+        "connection_name",
+        "method",
+        "sql",
+        "params",
+        "in_transaction",
+        "duration",
+        "rowcount",
+        "error",
+    )
+
+    def __init__(self, client: BaseDBAsyncClient, method: str, sql: str, params: int) -> None:
+        self.connection_name = client.connection_name
+        self.method = method
+        self.sql = sql
+        self.params = params
+        self.in_transaction = isinstance(client, TransactionalDBClient)
+        self.duration: float | None = None
+        self.rowcount: int | None = None
+        self.error: BaseException | None = None
+
+
+class QueryListener:
+    """
+    Hooks called around the queries of every DB client, e.g. to time them.
+
+    Subclass it, override the hooks you need and register it with :func:`add_query_listener`.
+    The hooks are called synchronously on the querying task, so they must not block.
+    """
+
+    def before_query(self, event: QueryEvent) -> None:
+        """
+        Called before the query runs.
+        """
+
+    def after_query(self, event: QueryEvent) -> None:
+        """
+        Called once the query ran or failed, with its ``duration``, ``rowcount`` and ``error``.
+        """
+
+
+_query_listeners: list[QueryListener] = []
+
+
+def add_query_listener(listener: QueryListener) -> None:
+    """
+    Registers a listener of the queries of all DB clients.
+    """
+    if listener not in _query_listeners:
+        _query_listeners.append(listener)
+
+
+def remove_query_listener(listener: QueryListener) -> None:
+    """
+    Unregisters a listener added with :func:`add_query_listener`.
+    """
+    if listener in _query_listeners:
+        _query_listeners.remove(listener)
+
+
+class SlowQueryLogger(QueryListener):
+    """
+    Logs the queries that took longer than ``threshold`` seconds as warnings of the
+    ``tortoise.slow_query`` logger, with their duration, row count and connection.
+
+    :param threshold: Seconds above which a query is logged.
+    :param sample_rate: Share of the slow queries that are logged, from ``0`` to ``1``.
+    :param logger: Logger to log to instead of ``tortoise.slow_query``.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 1.0,
+        sample_rate: float = 1.0,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self.threshold = threshold
+        self.sample_rate = sample_rate
+        self.logger = logger or slow_query_logger
+
+    def after_query(self, event: QueryEvent) -> None:
+        if event.duration is None or event.duration < self.threshold:
+            return
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:  # nosec
+            return
+        self.logger.warning(
+            "Slow query: %.3fs, %s rows, %s%s: %s",
+            event.duration,
+            event.rowcount,
+            event.connection_name,
+            " (transaction)" if event.in_transaction else "",
+            event.sql,
+        )
+
+
+def _count_params(method: str, values: Any) -> int:
+    if not values:
+        return 0
+    if method == "execute_many":
+        return sum(map(len, values))
+    return len(values)
+
+
+def _count_rows(method: str, result: Any, values: Any) -> int:
+    if method == "execute_query":
+        return result[0]
+    if method == "execute_query_dict":
+        return len(result)
+    if method == "execute_many":
+        return len(values)
+    return 1
+
+
+_shared_reads: ContextVar[bool | None] = ContextVar("_shared_reads", default=None)
+
+
+def _copy_rows(rows: Any) -> list:
+    # Rows may be dicts, which the callers convert in place
+    return [dict(row) if isinstance(row, dict) else row for row in rows]
+
+
+class SingleFlight:
+    """
+    Coalesces identical reads: a ``SELECT`` issued outside of transactions while the same query,
+    with the same parameters, is already running on the same connection waits for the result
+    of the running query instead of running again.
+
+    This cuts the load of many concurrent requests running the same queries, e.g. on a cold
+    endpoint. The shared result may have been read before the query joining it was issued,
+    but never before a write that the client ran or committed in between: a read only joins
+    the queries issued since the last write of its client.
+
+    .. attribute:: enabled
+
+        Shares the reads of all the querysets, ``QuerySet.shared()`` overrides it per queryset
+
+    .. attribute:: queries
+
+        Number of reads that ran while shared reads were enabled
+
+    .. attribute:: shared
+
+        Number of reads that got the result of a running query instead of running
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.queries = 0
+        self.shared = 0
+        self._running: dict[tuple[str, int, str, str, str], asyncio.Future] = {}
+
+    def active(self) -> bool:
+        """
+        Returns if the reads are shared in the current context.
+        """
+        override = _shared_reads.get()
+        return self.enabled if override is None else override
+
+    def override(self, enabled: bool | None) -> AbstractContextManager:
+        """
+        Returns a context manager enabling or disabling shared reads within its block,
+        which does nothing if ``enabled`` is ``None``.
+        """
+        if enabled is None:
+            return nullcontext()
+        return _SharedReads(enabled)
+
+    async def run(
+        self,
+        client: BaseDBAsyncClient,
+        method: str,
+        query: str,
+        values: Any,
+        call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Returns the result of ``call()``, which runs the read, or of the identical read that is
+        already running. Every caller gets its own copy of the rows.
+        """
+        key = (client.connection_name, client._writes, method, query, repr(values))
+        running = self._running.get(key)
+        if running is not None:
+            try:
+                result = await asyncio.shield(running)
+            except asyncio.CancelledError:
+                if not running.cancelled():
+                    raise
+                # The task running the query was cancelled, not this one
+                return await call()
+            self.shared += 1
+            return self._copy(method, result)
+        future = asyncio.get_running_loop().create_future()
+        self._running[key] = future
+        self.queries += 1
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Retrieved, as no other caller may be waiting for it
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return self._copy(method, result)
+        finally:
+            del self._running[key]
+
+    @staticmethod
+    def _copy(method: str, result: Any) -> Any:
+        if method == "execute_query_dict":
+            return _copy_rows(result)
+        rowcount, rows = result
+        return rowcount, _copy_rows(rows)
+
+    def stats(self) -> dict[str, Any]:
+        return {"enabled": self.enabled, "queries": self.queries, "shared": self.shared}
+
+    def reset_stats(self) -> None:
+        self.queries = 0
+        self.shared = 0
+
+
+class _SharedReads:
+    __slots__ = ("enabled", "token")
+
+    def __init__(self, enabled: bool) -> None:
+        self.enabled = enabled
+
+    def __enter__(self) -> None:
+        self.token = _shared_reads.set(self.enabled)
+
+    def __exit__(self, *args: Any) -> None:
+        _shared_reads.reset(self.token)
+
+
+#: The global shared reads coordinator
+SINGLE_FLIGHT = SingleFlight()
+
+
+def _is_select(query: str) -> bool:
+    return query.lstrip()[:6].upper() == "SELECT"
+
+
+def _is_shared_read(client: BaseDBAsyncClient, query: str) -> bool:
+    return (
+        SINGLE_FLIGHT.active()
+        and not isinstance(client, TransactionalDBClient)
+        and _is_select(query)
+    )
+
+
+_current_pipeline: ContextVar[Pipeline | None] = ContextVar("_current_pipeline", default=None)
+
+
+class _PipelinedQuery:
+    __slots__ = ("method", "query", "values", "call", "future")
+
+    def __init__(
+        self,
+        method: str,
+        query: str,
+        values: Any,
+        call: Callable[[], Awaitable[Any]],
+        future: asyncio.Future,
+    ) -> None:
+        self.method = method
+        self.query = query
+        self.values = values
+        self.call = call
+        self.future = future
+
+
+class Pipeline:
+    """
+    Batches the reads that concurrent tasks issue on a client in the same iteration of the
+    event loop, and sends every batch to the DB at once with the client's
+    ``_execute_pipeline()``, e.g. in psycopg's pipeline mode, so that it costs a single round
+    trip. The queries of a batch run in order, on one connection.
+
+    Only the ``SELECT`` queries of ``execute_query`` and ``execute_query_dict`` are batched,
+    on the clients that support it. When a batch fails as a whole outside of a transaction,
+    its queries run again one by one, so each one gets its own result or error.
+
+    .. attribute:: queries
+
+        Number of reads sent in batches
+
+    .. attribute:: batches
+
+        Number of batches sent
+    """
+
+    __slots__ = ("queries", "batches", "_pending", "_tasks")
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.batches = 0
+        self._pending: dict[BaseDBAsyncClient, list[_PipelinedQuery]] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def run(
+        self,
+        client: BaseDBAsyncClient,
+        method: str,
+        query: str,
+        values: Any,
+        call: Callable[[], Awaitable[Any]],
+    ) -> asyncio.Future:
+        """
+        Queues the query for the next batch of the client, returns the future of its result.
+        ``call()`` runs the query on its own.
+        """
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(client)
+        if pending is None:
+            pending = self._pending[client] = []
+            loop.call_soon(self._flush, client)
+        future = loop.create_future()
+        pending.append(_PipelinedQuery(method, query, values, call, future))
+        return future
+
+    def _flush(self, client: BaseDBAsyncClient) -> None:
+        task = asyncio.ensure_future(self._send(client, self._pending.pop(client)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, client: BaseDBAsyncClient, batch: list[_PipelinedQuery]) -> None:
+        try:
+            if len(batch) == 1:
+                results = [await _result_or_error(batch[0].call())]
+            else:
+                self.queries += len(batch)
+                self.batches += 1
+                try:
+                    results = await client._execute_pipeline(
+                        [(item.method, item.query, item.values) for item in batch]
+                    )
+                except Exception as exc:
+                    if isinstance(client, TransactionalDBClient):
+                        # The transaction failed, running the queries again can't tell why
+                        results = [exc] * len(batch)
+                    else:
+                        results = [await _result_or_error(item.call()) for item in batch]
+            for item, result in zip(batch, results):
+                if item.future.done():
+                    continue
+                if isinstance(result, BaseException):
+                    item.future.set_exception(result)
+                else:
+                    item.future.set_result(result)
+        finally:
+            for item in batch:
+                if not item.future.done():
+                    item.future.cancel()
+
+
+async def _result_or_error(call: Awaitable[Any]) -> Any:
+    try:
+        return await call
+    except Exception as exc:
+        return exc
+
+
+@contextmanager
+def pipeline() -> Iterator[Pipeline]:
+    """
+    Batches the reads that concurrent tasks issue within the block, see :class:`Pipeline`.
+
+    .. code-block:: python3
+
+        with tortoise.pipeline():
+            # Both queries are sent to the DB at once
+            user, orders = await asyncio.gather(
+                User.get(pk=user_id), Order.filter(user_id=user_id)
+            )
+
+    Prefetches of many relations use a pipeline on their own. A block nested in another
+    pipeline uses it.
+    """
+    current = _current_pipeline.get()
+    if current is not None:
+        yield current
+        return
+    current = Pipeline()
+    token = _current_pipeline.set(current)
+    try:
+        yield current
+    finally:
+        _current_pipeline.reset(token)
+
+
+def _pipelined_call(
+    client: BaseDBAsyncClient, method: str, func: Callable, query: str, args: tuple, kwargs: dict
+) -> Awaitable[Any]:
+    """
+    Returns the awaitable result of ``func``, run by the current pipeline if there is one
+    and it can batch the query.
+    """
+    current = _current_pipeline.get()
+    if (
+        current is None
+        or not client._supports_pipeline
+        or method not in ("execute_query", "execute_query_dict")
+        or len(args) > 1
+        or not kwargs.keys() <= {"values"}
+        or query.lstrip()[:6].upper() != "SELECT"
+    ):
+        return func(client, query, *args, **kwargs)
+    values = args[0] if args else kwargs.get("values")
+    return current.run(client, method, query, values, lambda: func(client, query, *args, **kwargs))
+
+
+@contextmanager
+def _query_event(
+    client: BaseDBAsyncClient, method: str, sql: str, params: int
+) -> Iterator[QueryEvent | None]:
+    """
+    Notifies the query listeners around the block, which sets the ``rowcount`` of the event.
+    The event is ``None`` if there are no listeners.
+    """
+    if not _query_listeners:
+        yield None
+        return
+    event = QueryEvent(client, method, sql, params)
+    for listener in _query_listeners:
+        listener.before_query(event)
+    started = time.perf_counter()
+    try:
+        yield event
+    except GeneratorExit:
+        # A stream closed before its end
+        raise
+    except BaseException as exc:
+        event.error = exc
+        raise
+    finally:
+        event.duration = time.perf_counter() - started
+        for listener in _query_listeners:
+            listener.after_query(event)
+
+
+def instrument_query(func: F) -> F:
+    """
+    Notifies the query listeners around the decorated ``execute_*`` method of a client,
+    shares the identical reads of ``execute_query`` and ``execute_query_dict`` when enabled,
+    see :class:`SingleFlight`, and batches them within :func:`pipeline`.
+    """
+    method = func.__name__
+
+    @wraps(func)
+    async def instrumented(self: BaseDBAsyncClient, query: str, *args: Any, **kwargs: Any):
+        if method not in ("execute_query", "execute_query_dict") or not _is_select(query):
+            self._count_write()
+        if not _query_listeners:
+            with phase(method):
+                return await _pipelined_call(self, method, func, query, args, kwargs)
+        values = args[0] if args else kwargs.get("values")
+        with _query_event(self, method, query, _count_params(method, values)) as event:
+            with phase(method):
+                result = await _pipelined_call(self, method, func, query, args, kwargs)
+            cast(QueryEvent, event).rowcount = _count_rows(method, result, values)
+        return result
+
+    if method not in ("execute_query", "execute_query_dict"):
+        return cast(F, instrumented)
+
+    @wraps(func)
+    async def shareable(self: BaseDBAsyncClient, query: str, *args: Any, **kwargs: Any):
+        if not _is_shared_read(self, query):
+            return await instrumented(self, query, *args, **kwargs)
+        values = args[0] if args else kwargs.get("values")
+        return await SINGLE_FLIGHT.run(
+            self, method, query, values, lambda: instrumented(self, query, *args, **kwargs)
+        )
+
+    return cast(F, shareable)
+
+
+def instrument_copy(func: F) -> F:
+    """
+    Notifies the query listeners around the decorated ``execute_copy`` method of a client,
+    with ``COPY <table> (<columns>)`` as the SQL of the event.
+    """
+
+    @wraps(func)
+    async def instrumented(
+        self: BaseDBAsyncClient,
+        table: str,
+        columns: Sequence[str],
+        values: list[list],
+        *args,
+        **kwargs,
+    ):
+        self._count_write()
+        sql = f"COPY {table} ({', '.join(columns)})"
+        params = _count_params("execute_many", values)
+        with _query_event(self, "execute_copy", sql, params) as event, phase("execute_copy"):
+            result = await func(self, table, columns, values, *args, **kwargs)
+            if event is not None:
+                event.rowcount = len(values)
+        return result
+
+    return cast(F, instrumented)
+
+
 class BaseDBAsyncClient(abc.ABC):
     """
     Base class for containing a DB connection.
@@ -103,21 +942,53 @@ class BaseDBAsyncClient(abc.ABC):
         :annotation: Capabilities
 
         Contains the connection capabilities
+
+    .. attribute:: stream_fetch_size
+        :annotation: int
+
+        Default number of rows fetched per batch by ``execute_query_stream()``
+
+    .. attribute:: statement_cache
+        :annotation: StatementCache
+
+        Prepared statements of the connection(s) and their hit/miss counters
+
+    .. attribute:: pool_metrics
+        :annotation: PoolMetrics | None
+
+        Connection acquire counters, ``None`` on transactions as they reuse one connection
     """
 
     _connection: Any
     _parent: BaseDBAsyncClient
     _pool: Any
+    _pool_init_lock: asyncio.Lock
     connection_name: str
     query_class: type[Query] = Query
     executor_class: type[BaseExecutor] = BaseExecutor
     schema_generator: type[BaseSchemaGenerator] = BaseSchemaGenerator
     capabilities: Capabilities = Capabilities("")
+    stream_fetch_size: int = 1000
+    pool_metrics: PoolMetrics | None
+    #: Errors raised by the driver when acquiring a connection timed out
+    _pool_timeout_errors: tuple[type[BaseException], ...] = (asyncio.TimeoutError,)
+    #: If the client implements ``_execute_pipeline()``
+    _supports_pipeline: bool = False
+    #: Cheapest query answered by the DB, e.g. to check that it is up
+    ping_query: str = "SELECT 1"
+    #: Number of writes run by the client, the reads shared by :class:`SingleFlight` ran
+    #: after the same one
+    _writes: int = 0
 
     def __init__(self, connection_name: str, fetch_inserted: bool = True, **kwargs: Any) -> None:
         self.log = db_client_logger
         self.connection_name = connection_name
         self.fetch_inserted = fetch_inserted
+        self.statement_cache = StatementCache()
+        self.pool_metrics = PoolMetrics()
+
+    def _count_write(self) -> None:
+        self._writes += 1
 
     async def create_connection(self, with_db: bool) -> None:
         """
@@ -134,6 +1005,40 @@ class BaseDBAsyncClient(abc.ABC):
         """
         raise NotImplementedError()  # pragma: nocoverage
 
+    @property
+    def outstanding(self) -> int:
+        """
+        Number of queries that currently hold or wait for a connection of the client.
+        """
+        metrics = self.pool_metrics
+        return metrics.in_use + metrics.waiting if metrics is not None else 0
+
+    def _pool_sizes(self) -> tuple[int, int, int]:
+        """
+        Returns the number of open connections, how many of them are idle and the max
+        number of connections.
+        """
+        size = 1 if getattr(self, "_connection", None) else 0
+        in_use = self.pool_metrics.in_use if self.pool_metrics is not None else 0
+        return size, max(size - in_use, 0), 1
+
+    def pool_stats(self) -> dict[str, Any]:
+        """
+        Returns the state of the connection pool and the counters of its acquires:
+
+        * ``size``, ``idle`` and ``max_size``: the open, idle and max number of connections
+        * ``in_use`` and ``waiting``: the acquired connections and the tasks waiting for one
+        * ``acquired`` and ``timeouts``: the number of acquires that succeeded or timed out
+        * ``acquire_time``: the total time spent waiting for connections, in seconds
+        * ``acquire_latency``: the number of acquires per wait time, keyed by upper bound
+
+        Clients without a pool report their single connection, and transactions report the
+        pool of their client.
+        """
+        size, idle, max_size = self._pool_sizes()
+        metrics = self.pool_metrics if self.pool_metrics is not None else PoolMetrics()
+        return {"size": size, "idle": idle, "max_size": max_size, **metrics.stats()}
+
     async def db_create(self) -> None:
         """
         Created the database in the server. Typically only called by the test runner.
@@ -164,6 +1069,21 @@ class BaseDBAsyncClient(abc.ABC):
     def _in_transaction(self) -> TransactionContext:
         raise NotImplementedError()  # pragma: nocoverage
 
+    def _pinned(self) -> BaseDBAsyncClient | None:
+        """
+        Returns a copy of the client that runs its queries on a single connection of the
+        pool, or ``None`` if the client has no pool or is a transaction.
+        """
+        if isinstance(self, TransactionalDBClient):
+            return None
+        if isinstance(getattr(self, "_pool", None), PinnedPool):
+            return None
+        if not isinstance(self.acquire_connection(), PoolConnectionWrapper):
+            return None
+        pinned = copy(self)
+        pinned._pool = PinnedPool(self)
+        return pinned
+
     async def execute_insert(self, query: str, values: list) -> Any:
         """
         Executes a RAW SQL insert statement, with provided parameters.
@@ -214,11 +1134,168 @@ class BaseDBAsyncClient(abc.ABC):
         """
         raise NotImplementedError()  # pragma: nocoverage
 
+    async def execute_copy(
+        self,
+        table: str,
+        columns: Sequence[str],
+        values: list[list],
+        returning: str | None = None,
+        schema: str | None = None,
+    ) -> list:
+        """
+        Loads rows into a table with the bulk load protocol of the DB (``COPY`` on PostgreSQL),
+        which is a lot faster than inserting them row by row.
+
+        :param table: The table to load the rows into.
+        :param columns: The columns the values are for.
+        :param values: A sequence of rows of DB values, in the order of ``columns``.
+        :param returning: A serial column, like the generated primary key, to return the
+            values of, for the loaded rows in order. The rows are then loaded into a temporary
+            table first, and inserted into ``table`` from there.
+        :param schema: The schema of the table, if not the default one.
+        :return: The values of the ``returning`` column, or an empty list.
+        :raises UnSupportedError: If the DB has no bulk load protocol.
+        """
+        raise UnSupportedError(f"Bulk load is not supported by {self.capabilities.dialect}")
+
+    async def execute_query_stream(
+        self, query: str, values: list | None = None, fetch_size: int | None = None
+    ) -> AsyncIterator[Sequence[dict]]:
+        """
+        Executes a RAW SQL query statement, and streams the resultset in batches.
+
+        Rows are read through a server-side (or unbuffered) cursor, so at most ``fetch_size``
+        rows are held in memory at a time.
+
+        When the client shares a single connection (SQLite, or inside a transaction) the
+        connection is only locked while a batch is being fetched, so other queries may be run
+        between batches. Note that MySQL can't run other queries on the same connection while
+        an unbuffered cursor is open.
+
+        The query listeners are notified when the stream starts and ends, so the duration of
+        the event includes the time spent consuming the batches.
+
+        :param query: The SQL string, pre-parametrized for the target DB dialect.
+        :param values: A sequence of positional DB parameters.
+        :param fetch_size: Number of rows to fetch per batch,
+            defaults to :attr:`stream_fetch_size`.
+        :return: An async iterator of row batches.
+        """
+        fetch_size = fetch_size or self.stream_fetch_size
+        params = _count_params("execute_query_stream", values)
+        with _query_event(self, "execute_query_stream", query, params) as event:
+            batches = self._stream_rows(query, values, fetch_size)
+            rowcount = 0
+            try:
+                async for rows in batches:
+                    rowcount += len(rows)
+                    yield rows
+            finally:
+                # The cursor is closed with the stream, even if it isn't consumed to the end
+                await batches.aclose()
+            if event is not None:
+                event.rowcount = rowcount
+
+    async def _stream_rows(
+        self, query: str, values: list | None, fetch_size: int
+    ) -> AsyncGenerator[Sequence[dict], None]:
+        wrapper = self.acquire_connection()
+        if isinstance(wrapper, ConnectionWrapper):
+            async with wrapper as connection:
+                self.log.debug("%s: %s", query, values)
+                cursor = await self._stream_open(connection, query, values)
+            try:
+                while True:
+                    async with self.acquire_connection():
+                        rows = await self._stream_fetch(cursor, fetch_size)
+                    if not rows:
+                        break
+                    yield rows
+            finally:
+                async with self.acquire_connection():
+                    await self._stream_close(cursor)
+        else:
+            async with wrapper as connection:
+                self.log.debug("%s: %s", query, values)
+                cursor = await self._stream_open(connection, query, values)
+                try:
+                    while rows := await self._stream_fetch(cursor, fetch_size):
+                        yield rows
+                finally:
+                    await self._stream_close(cursor)
+
+    async def _execute_pipeline(self, statements: list[tuple[str, str, Any]]) -> list[Any]:
+        """
+        Sends a batch of reads at once, for :class:`Pipeline`.
+
+        :param statements: The ``(method, query, values)`` of the reads, ``method`` being
+            ``"execute_query"`` or ``"execute_query_dict"``.
+        :return: The result of every read, as the method would return it, or its error.
+            An error of the whole batch is raised instead.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+    async def _stream_open(self, connection: Any, query: str, values: list | None) -> Any:
+        """
+        Opens a cursor for :meth:`execute_query_stream` on the given driver connection.
+
+        :return: A backend specific cursor handle.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+    async def _stream_fetch(self, cursor: Any, fetch_size: int) -> Sequence[dict]:
+        """
+        Fetches the next batch of at most ``fetch_size`` rows from a streaming cursor.
+        An empty batch signals that the resultset is exhausted.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+    async def _stream_close(self, cursor: Any) -> None:
+        """
+        Closes a streaming cursor, ending any transaction opened by :meth:`_stream_open`.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
 
 class TransactionalDBClient(BaseDBAsyncClient, abc.ABC):
     """An interface of the DB client that supports transactions."""
 
     _finalized: bool = False
+    pool_metrics: PoolMetrics | None = None
+    _end_callbacks: list[Callable[[], Awaitable[Any]]] | None = None
+    #: If the outermost transaction wrote, which the client sees once it ends
+    _wrote: bool = False
+
+    def pool_stats(self) -> dict[str, Any]:
+        # The connection of the transaction comes from the pool of the client
+        return self._parent.pool_stats()
+
+    def _count_write(self) -> None:
+        client = self
+        while isinstance(client._parent, TransactionalDBClient):
+            client = client._parent
+        client._wrote = True
+
+    def on_transaction_end(self, callback: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Calls ``callback`` once the outermost transaction has been committed or rolled back,
+        e.g. to invalidate cached rows that other connections could have read before the
+        commit.
+        """
+        client = self
+        while isinstance(client._parent, TransactionalDBClient):
+            client = client._parent
+        if client._end_callbacks is None:
+            client._end_callbacks = []
+        client._end_callbacks.append(callback)
+
+    async def _transaction_ended(self) -> None:
+        if self._wrote:
+            self._wrote = False
+            self._parent._count_write()
+        callbacks, self._end_callbacks = self._end_callbacks, None
+        for callback in callbacks or ():
+            await callback()
 
     @abc.abstractmethod
     async def begin(self) -> None: ...
@@ -243,7 +1320,7 @@ class ConnectionWrapper(Generic[T_conn]):
     """Wraps the connections with a lock to facilitate safe concurrent access when using
     asyncio.gather, TaskGroup, or similar."""
 
-    __slots__ = ("connection", "_lock", "client")
+    __slots__ = ("connection", "_lock", "client", "_acquired_at")
 
     def __init__(self, lock: asyncio.Lock, client: BaseDBAsyncClient) -> None:
         self._lock: asyncio.Lock = lock
@@ -256,11 +1333,27 @@ class ConnectionWrapper(Generic[T_conn]):
             self.connection = self.client._connection
 
     async def __aenter__(self) -> T_conn:
-        await self._lock.acquire()
-        await self.ensure_connection()
+        metrics = self.client.pool_metrics
+        if metrics is None:
+            await self._lock.acquire()
+        else:
+            started = metrics.start_acquire()
+            try:
+                await self._lock.acquire()
+            except BaseException as exc:
+                metrics.end_acquire(self.client, started, exc)
+                raise
+            self._acquired_at = metrics.end_acquire(self.client, started)
+        try:
+            await self.ensure_connection()
+        except BaseException:
+            await self.__aexit__(None, None, None)
+            raise
         return self.connection
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        if self.client.pool_metrics is not None:
+            self.client.pool_metrics.release(self.client, self._acquired_at)
         self._lock.release()
 
 
@@ -280,7 +1373,7 @@ class TransactionContext(Generic[T_conn]):
 class TransactionContextPooled(TransactionContext):
     "A version of TransactionContext that uses a pool to acquire connections."
 
-    __slots__ = ("client", "connection_name", "token", "_pool_init_lock")
+    __slots__ = ("client", "connection_name", "token", "_pool_init_lock", "_acquired_at")
 
     def __init__(self, client: TransactionalDBClient, pool_init_lock: asyncio.Lock) -> None:
         self.client = client
@@ -299,7 +1392,16 @@ class TransactionContextPooled(TransactionContext):
         # Set the context variable so the current task is always seeing a
         # TransactionWrapper conneciton.
         self.token = connections.set(self.connection_name, self.client)
-        self.client._connection = await self.client._parent._pool.acquire()
+        parent = self.client._parent
+        metrics = cast(PoolMetrics, parent.pool_metrics)
+        started = metrics.start_acquire()
+        try:
+            self.client._connection = await parent._pool.acquire()
+        except BaseException as exc:
+            metrics.end_acquire(parent, started, exc)
+            connections.reset(self.token)
+            raise
+        self._acquired_at = metrics.end_acquire(parent, started)
         await self.client.begin()
         return self.client
 
@@ -313,9 +1415,12 @@ class TransactionContextPooled(TransactionContext):
                 else:
                     await self.client.commit()
         finally:
-            if self.client._parent._pool:
-                await self.client._parent._pool.release(self.client._connection)
+            parent = self.client._parent
+            cast(PoolMetrics, parent.pool_metrics).release(parent, self._acquired_at)
+            if parent._pool:
+                await parent._pool.release(self.client._connection)
             connections.reset(self.token)
+            await self.client._transaction_ended()
 
 
 class NestedTransactionContext(TransactionContext):
@@ -339,10 +1444,61 @@ class NestedTransactionContext(TransactionContext):
                 await self.client.release_savepoint()
 
 
+class PinnedPool:
+    """
+    Stands in for the pool of a pinned client: hands out the same connection of the pool of
+    ``client`` until ``unpin()``. While that connection is busy, e.g. with a stream being
+    iterated, or once unpinned, connections are acquired from the pool as usual.
+    """
+
+    __slots__ = ("client", "connection", "_busy", "_closed")
+
+    def __init__(self, client: BaseDBAsyncClient) -> None:
+        self.client = client
+        self.connection: Any = None
+        self._busy = False
+        self._closed = False
+
+    async def acquire(self) -> Any:
+        await PoolConnectionWrapper(self.client, self.client._pool_init_lock).ensure_connection()
+        if self._busy or self._closed:
+            return await self.client._pool.acquire()
+        if self.connection is None:
+            self.connection = await self.client._pool.acquire()
+        self._busy = True
+        return self.connection
+
+    async def release(self, connection: Any) -> None:
+        if connection is not self.connection:
+            await self.client._pool.release(connection)
+            return
+        self._busy = False
+        if self._closed:
+            # Unpinned while a task spawned in the block was still using it
+            self.connection = None
+            await self.client._pool.release(connection)
+
+    async def unpin(self) -> None:
+        """
+        Returns the pinned connection to the pool, or lets ``release()`` return it if it is
+        still in use. Tasks that outlive the block then acquire from the pool as usual.
+        """
+        self._closed = True
+        if self._busy:
+            return
+        connection, self.connection = self.connection, None
+        if connection is not None and self.client._pool:
+            await self.client._pool.release(connection)
+
+    def __getattr__(self, name: str) -> Any:
+        # Size and stats of the pool
+        return getattr(self.client._pool, name)
+
+
 class PoolConnectionWrapper(Generic[T_conn]):
     """Class to manage acquiring from and releasing connections to a pool."""
 
-    __slots__ = ("client", "connection", "_pool_init_lock")
+    __slots__ = ("client", "connection", "_pool_init_lock", "_acquired_at")
 
     def __init__(self, client: BaseDBAsyncClient, pool_init_lock: asyncio.Lock) -> None:
         self.client = client
@@ -357,11 +1513,19 @@ class PoolConnectionWrapper(Generic[T_conn]):
                     await self.client.create_connection(with_db=True)
 
     async def __aenter__(self) -> T_conn:
-        await self.ensure_connection()
-        # get first available connection. If none available, wait until one is released
-        self.connection = await self.client._pool.acquire()
+        metrics = cast(PoolMetrics, self.client.pool_metrics)
+        started = metrics.start_acquire()
+        try:
+            await self.ensure_connection()
+            # get first available connection. If none available, wait until one is released
+            self.connection = await self.client._pool.acquire()
+        except BaseException as exc:
+            metrics.end_acquire(self.client, started, exc)
+            raise
+        self._acquired_at = metrics.end_acquire(self.client, started)
         return cast(T_conn, self.connection)
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        cast(PoolMetrics, self.client.pool_metrics).release(self.client, self._acquired_at)
         # release the connection back to the pool
         await self.client._pool.release(self.connection)
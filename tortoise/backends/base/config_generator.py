@@ -68,6 +68,7 @@ DB_LOOKUP: dict[str, dict[str, Any]] = {
         "cast": {
             "journal_size_limit": int,
             "install_regexp_functions": bool,
+            "read_pool_size": int,
         },
     },
     "mysql": {
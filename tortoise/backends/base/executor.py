@@ -3,13 +3,17 @@ from __future__ import annotations
 import asyncio
 import datetime
 import decimal
-from collections.abc import Callable, Iterable, Sequence
+import operator
+from collections.abc import AsyncIterator, Callable, Iterable, Sequence
 from copy import copy
+from functools import partial
 from typing import TYPE_CHECKING, Any, cast
 
 from pypika_tortoise import JoinType, Parameter, Table
 from pypika_tortoise.queries import QueryBuilder
+from pypika_tortoise.utils import format_quotes
 
+from tortoise.cache import RESULT_CACHE, related_tables
 from tortoise.exceptions import OperationalError
 from tortoise.expressions import Expression, ResolveContext
 from tortoise.fields.relational import (
@@ -18,8 +22,12 @@ from tortoise.fields.relational import (
     ManyToManyFieldInstance,
     RelationalField,
 )
+from tortoise.filters import is_in
+from tortoise.identity import Session, current_session
+from tortoise.profiling import phase
+from tortoise.query_stats import QUERY_STATS
 from tortoise.query_utils import QueryModifier
-from tortoise.utils import chunk
+from tortoise.utils import chunk, chunk_in_list
 
 if TYPE_CHECKING:  # pragma: nocoverage
     from tortoise.backends.base.client import BaseDBAsyncClient
@@ -35,6 +43,9 @@ EXECUTOR_CACHE: dict[
 
 class BaseExecutor:
     FILTER_FUNC_OVERRIDE: dict[Callable, Callable] = {}
+    #: Types of the elements of the long ``__in`` lists that the ``is_in`` override of the
+    #: dialect binds as a single parameter, so that they don't need to be split in chunks
+    IN_LIST_PARAM_TYPES: tuple[type, ...] = ()
     EXPLAIN_PREFIX: str = "EXPLAIN"
     DB_NATIVE = {bytes, str, int, float, decimal.Decimal, datetime.datetime, datetime.date}
 
@@ -47,12 +58,14 @@ class BaseExecutor:
         select_related_idx: (
             list[tuple[type[Model], int, str, type[Model], Iterable[str | None]]] | None
         ) = None,
+        populate_existing: bool = False,
     ) -> None:
         self.model = model
         self.db: BaseDBAsyncClient = db
         self.prefetch_map = prefetch_map or {}
         self._prefetch_queries = prefetch_queries or {}
         self.select_related_idx = select_related_idx
+        self.populate_existing = populate_existing
         key = (self.db.connection_name, self.model._meta.schema, self.model._meta.db_table)
         if key not in EXECUTOR_CACHE:
             self.regular_columns, columns = self._prepare_insert_columns()
@@ -104,34 +117,118 @@ class BaseExecutor:
         custom_fields: list | None = None,
     ) -> list:
         _, raw_results = await self.db.execute_query(sql, values)
+        with phase("hydrate"):
+            instance_list = self._init_instances(raw_results, custom_fields)
+        if QUERY_STATS.enabled:
+            QUERY_STATS.record_hydrated(sql, len(instance_list))
+        await self._execute_prefetch_queries(instance_list)
+        return instance_list
+
+    async def execute_select_stream(
+        self,
+        sql: str,
+        values: list | None = None,
+        custom_fields: list | None = None,
+        fetch_size: int | None = None,
+    ) -> AsyncIterator[Model]:
+        """
+        Like :meth:`execute_select`, but streams the resultset from the DB and hydrates
+        (and prefetches relations for) one batch of ``fetch_size`` rows at a time.
+        """
+        has_prefetch = bool(self.prefetch_map or self._prefetch_queries)
+        if has_prefetch:
+            self._make_prefetch_queries()
+        async for raw_results in self.db.execute_query_stream(sql, values, fetch_size):
+            instance_list = self._init_instances(raw_results, custom_fields)
+            if has_prefetch:
+                await self._run_prefetch_queries(instance_list)
+            for instance in instance_list:
+                yield instance
+
+    def _init_instances(self, raw_results: Iterable, custom_fields: list | None) -> list:
         instance_list = []
+        init_instance = None
         for row in raw_results:
-            if self.select_related_idx:
-                _, current_idx, _, _, path = self.select_related_idx[0]
-                row_items = list(dict(row).items())
-                instance: Model = self.model._init_from_db(**dict(row_items[:current_idx]))
-                instances: dict[Any, Any] = {path: instance}
-                for model, index, *__, full_path in self.select_related_idx[1:]:
-                    (*path, attr) = full_path
-                    related_items = row_items[current_idx : current_idx + index]
-                    if not any((v for _, v in related_items)):
-                        obj = None
-                    else:
-                        obj = model._init_from_db(**{k.split(".")[1]: v for k, v in related_items})
-                    target = instances.get(tuple(path))
+            if init_instance is None:
+                # All rows of a resultset have the same columns
+                init_instance = self._row_hydrator(row, custom_fields, current_session())
+            instance_list.append(init_instance(row))
+        return instance_list
+
+    def _row_hydrator(
+        self, row: Any, custom_fields: list | None, session: Session | None = None
+    ) -> Callable[[Any], Model]:
+        """
+        Compiles the function that builds the model instances (and their select_related
+        instances) from rows that have the same columns as ``row``, or returns the instances
+        already in the ``session`` for them, overwritten with the rows if ``populate_existing``.
+        """
+        merge: Callable[[Model], Model] | None = None
+        if session is not None:
+            merge = partial(session.merge, populate=self.populate_existing)
+        keys = tuple(row.keys())
+        # select_related can select the same column twice, keep the first one like dict(row)
+        unique_keys = tuple(dict.fromkeys(keys))
+        dedupe = None
+        if len(unique_keys) != len(keys):
+            dedupe = operator.itemgetter(*(keys.index(key) for key in unique_keys))
+            keys = unique_keys
+        hydrate: Callable[[Sequence], Model]
+        if self.select_related_idx:
+            _, current_idx, _, _, main_path = self.select_related_idx[0]
+            hydrate_main = self.model._meta.hydrator(keys[:current_idx])
+            related = []
+            for model, index, *__, full_path in self.select_related_idx[1:]:
+                (*path, attr) = full_path
+                related_keys = keys[current_idx : current_idx + index]
+                related.append(
+                    (
+                        model._meta.hydrator(
+                            tuple(k.split(".")[1] for k in related_keys), current_idx
+                        ),
+                        current_idx,
+                        current_idx + index,
+                        tuple(path),
+                        (*path, attr),
+                        f"_{attr}",
+                    )
+                )
+                current_idx += index
+
+            def hydrate(values: Sequence) -> Model:
+                instance = hydrate_main(values)
+                if merge is not None:
+                    instance = merge(instance)
+                instances: dict[Any, Any] = {main_path: instance}
+                for hydrate_related, start, end, path, obj_path, attr in related:
+                    obj = hydrate_related(values) if any(values[start:end]) else None
+                    if merge is not None and obj is not None:
+                        obj = merge(obj)
+                    target = instances.get(path)
                     if target is not None:
-                        setattr(target, f"_{attr}", obj)
+                        setattr(target, attr, obj)
                     if obj is not None:
-                        instances[(*path, attr)] = obj
-                    current_idx += index
-            else:
-                instance = self.model._init_from_db(**row)
-            if custom_fields:
-                for field in custom_fields:
-                    setattr(instance, field, row[field])
-            instance_list.append(instance)
-        await self._execute_prefetch_queries(instance_list)
-        return instance_list
+                        instances[obj_path] = obj
+                return instance
+
+        else:
+            hydrate = self.model._meta.hydrator(keys)
+
+        is_dict = isinstance(row, dict)
+        custom_positions = [(keys.index(field), field) for field in custom_fields or ()]
+
+        def init_instance(row: Any) -> Model:
+            values = tuple(row.values()) if is_dict else row
+            if dedupe is not None:
+                values = dedupe(values)
+            instance = hydrate(values)
+            if merge is not None:
+                instance = merge(instance)
+            for position, field in custom_positions:
+                setattr(instance, field, values[position])
+            return instance
+
+        return init_instance
 
     def _prepare_insert_columns(
         self, include_generated: bool = False
@@ -159,6 +256,112 @@ class BaseExecutor:
             query = query.on_conflict().do_nothing()
         return query
 
+    def _prepare_bulk_insert_statement(
+        self, columns: Sequence[str], rows: int, ignore_conflicts: bool = False
+    ) -> QueryBuilder:
+        """
+        Builds a multi-row ``INSERT ... VALUES (...), (...)`` statement for ``rows`` rows.
+        """
+        query = self._prepare_insert_statement(
+            columns, has_generated=False, ignore_conflicts=ignore_conflicts
+        )
+        width = len(columns)
+        for row in range(1, rows):
+            query = query.insert(*[self.parameter(row * width + i) for i in range(width)])
+        return query
+
+    def _add_insert_returning(self, sql: str, column: str) -> str:
+        return f'{sql} RETURNING "{column}"'
+
+    def _bulk_insert_rows(self, columns_count: int, batch_size: int | None = None) -> int:
+        """
+        Returns how many rows of ``columns_count`` columns fit in a single INSERT statement.
+        """
+        capabilities = self.db.capabilities
+        rows = max(capabilities.max_query_params // max(columns_count, 1), 1)
+        if capabilities.max_insert_rows:
+            rows = min(rows, capabilities.max_insert_rows)
+        if batch_size:
+            rows = min(rows, batch_size)
+        return rows
+
+    def _can_return_pks(self) -> bool:
+        # The returned keys have to be matched to the rows, by position or by their order
+        capabilities = self.db.capabilities
+        return (
+            capabilities.support_returning
+            and (capabilities.ordered_returning or capabilities.ascending_generated_keys)
+            and self.model._meta.pk.generated
+        )
+
+    async def _execute_bulk_insert(
+        self,
+        make_query: Callable[[int], str],
+        columns: list[str],
+        instances: list[Model],
+        batch_size: int | None = None,
+        returning: bool = False,
+    ) -> None:
+        """
+        Inserts ``instances`` with as few multi-row INSERT statements as the DB allows.
+
+        :param make_query: Returns the INSERT statement for the given number of rows.
+        :param columns: The model fields to insert.
+        :param instances: The objects to insert.
+        :param batch_size: Max number of rows in a single statement.
+        :param returning: Assign the generated primary keys back to ``instances``.
+        """
+        fields_map = self.model._meta.fields_map
+        values_lists = [
+            [
+                fields_map[field_name].to_db_value(getattr(instance, field_name), instance)
+                for field_name in columns
+            ]
+            for instance in instances
+        ]
+        rows = self._bulk_insert_rows(len(columns), batch_size)
+        if rows == 1 or not columns:
+            # The DB can't insert multiple rows with a single statement
+            await self.db.execute_many(make_query(1), values_lists)
+            return
+        if len(values_lists) > rows:
+            async with self.db._in_transaction() as connection:
+                await self._insert_rows(
+                    connection, make_query, values_lists, instances, rows, returning
+                )
+        else:
+            await self._insert_rows(self.db, make_query, values_lists, instances, rows, returning)
+
+    async def _insert_rows(
+        self,
+        connection: BaseDBAsyncClient,
+        make_query: Callable[[int], str],
+        values_lists: list[list],
+        instances: list[Model],
+        rows: int,
+        returning: bool,
+    ) -> None:
+        meta = self.model._meta
+        queries: dict[int, str] = {}
+        for start in range(0, len(values_lists), rows):
+            values_chunk = values_lists[start : start + rows]
+            count = len(values_chunk)
+            if count not in queries:
+                query = make_query(count)
+                if returning:
+                    query = self._add_insert_returning(query, meta.db_pk_column)
+                queries[count] = query
+            values = [value for values in values_chunk for value in values]
+            _, results = await connection.execute_query(queries[count], values)
+            if returning:
+                pks = [row[meta.db_pk_column] for row in results]
+                if not self.db.capabilities.ordered_returning:
+                    # The keys are generated in the order of the rows, but returned in any order
+                    pks.sort()
+                for instance, pk in zip(instances[start : start + rows], pks):
+                    instance.pk = meta.pk.to_python_value(pk)
+                    instance._saved_in_db = True
+
     async def _process_insert_result(self, instance: Model, results: Any) -> None:
         raise NotImplementedError()  # pragma: nocoverage
 
@@ -184,39 +387,41 @@ class BaseExecutor:
                 for field_name in self.regular_columns_all
             ]
             await self.db.execute_insert(self.insert_query_all, values)
+        RESULT_CACHE.invalidate(self.model._meta.db_table, using_db=self.db)
 
     async def execute_bulk_insert(
         self,
         instances: Iterable[Model],
         batch_size: int | None = None,
     ) -> None:
+        db_projection = self.model._meta.fields_db_projection
+        columns = [db_projection[c] for c in self.regular_columns]
+        columns_all = [db_projection[c] for c in self.regular_columns_all]
         for instance_chunk in chunk(instances, batch_size):
-            values_lists_all = []
-            values_lists = []
+            instances_all = []
+            instances_generated = []
             for instance in instance_chunk:
                 if instance._custom_generated_pk:
-                    values_lists_all.append(
-                        [
-                            self.model._meta.fields_map[field_name].to_db_value(
-                                getattr(instance, field_name), instance
-                            )
-                            for field_name in self.regular_columns_all
-                        ]
-                    )
+                    instances_all.append(instance)
                 else:
-                    values_lists.append(
-                        [
-                            self.model._meta.fields_map[field_name].to_db_value(
-                                getattr(instance, field_name), instance
-                            )
-                            for field_name in self.regular_columns
-                        ]
-                    )
-
-            if values_lists_all:
-                await self.db.execute_many(self.insert_query_all, values_lists_all)
-            if values_lists:
-                await self.db.execute_many(self.insert_query, values_lists)
+                    instances_generated.append(instance)
+
+            if instances_all:
+                await self._execute_bulk_insert(
+                    lambda rows: str(self._prepare_bulk_insert_statement(columns_all, rows)),
+                    self.regular_columns_all,
+                    instances_all,
+                    batch_size,
+                )
+            if instances_generated:
+                await self._execute_bulk_insert(
+                    lambda rows: str(self._prepare_bulk_insert_statement(columns, rows)),
+                    self.regular_columns,
+                    instances_generated,
+                    batch_size,
+                    returning=self._can_return_pks(),
+                )
+        RESULT_CACHE.invalidate(self.model._meta.db_table, using_db=self.db)
 
     def get_update_sql(
         self,
@@ -282,16 +487,147 @@ class BaseExecutor:
             else:
                 values.append(field_obj.to_db_value(instance_field, instance))
         values.append(self.model._meta.pk.to_db_value(instance.pk, instance))
-        return (
+        count = (
             await self.db.execute_query(self.get_update_sql(update_fields, expressions), values)
         )[0]
+        RESULT_CACHE.invalidate(self.model._meta.db_table, using_db=self.db)
+        return count
 
-    async def execute_delete(self, instance: type[Model] | Model) -> int:
+    def get_bulk_update_sql(self, fields: Sequence[str], rows: int) -> str | None:
+        """
+        Generates the UPDATE of ``fields`` for ``rows`` objects at once, joined with their values
+        on the primary key. The parameters are the primary key and then ``fields`` of each
+        object in turn. ``None`` if the DB can't, the objects are then updated with a ``CASE``
+        per field.
+        Result is cached for performance.
+        """
+        key = f"bulk:{','.join(fields)}:{rows}"
+        if key not in self.update_cache:
+            self.update_cache[key] = self._prepare_bulk_update_sql(fields, rows) or ""
+        return self.update_cache[key] or None
+
+    def _prepare_bulk_update_sql(self, fields: Sequence[str], rows: int) -> str | None:
+        return None
+
+    def _update_from_values_sql(
+        self, fields: Sequence[str], rows: int, sql_types: Sequence[str] | None = None
+    ) -> str:
+        # UPDATE ... FROM (VALUES ...), the columns of VALUES are named column1, column2...
+        meta = self.model._meta
+        ctx = self.db.query_class.SQL_CONTEXT
+        table = meta.basetable.get_sql(ctx)
+        width = len(fields) + 1
+        values = []
+        for row in range(rows):
+            params = [self.parameter(row * width + i).get_sql(ctx) for i in range(width)]
+            if row == 0 and sql_types:
+                # The types of the other rows are resolved from the first one
+                params = [f"CAST({param} AS {type_})" for param, type_ in zip(params, sql_types)]
+            values.append(f"({','.join(params)})")
+        updates = ",".join(
+            f'{format_quotes(meta.fields_db_projection[field], ctx.quote_char)}="_v"."column{i}"'
+            for i, field in enumerate(fields, 2)
+        )
+        pk = format_quotes(meta.db_pk_column, ctx.quote_char)
         return (
+            f'UPDATE {table} SET {updates} FROM (VALUES {",".join(values)}) "_v" '
+            f'WHERE {table}.{pk}="_v"."column1"'
+        )
+
+    def _get_upsert_sql(
+        self, columns: Sequence[str], conflict_fields: Sequence[str], update_fields: Sequence[str]
+    ) -> str:
+        """
+        Generates the ``INSERT ... ON CONFLICT`` returning the inserted row, that updates
+        ``update_fields`` of the conflicting row or skips it if there are none.
+        Result is cached for performance.
+        """
+        key = f"upsert:{','.join(columns)}:{','.join(conflict_fields)}:{','.join(update_fields)}"
+        if key not in self.update_cache:
+            db_projection = self.model._meta.fields_db_projection
+            query = self._prepare_insert_statement(
+                [db_projection[field] for field in columns], has_generated=False
+            ).on_conflict(*(db_projection[field] for field in conflict_fields))
+            if update_fields:
+                for field in update_fields:
+                    query = query.do_update(db_projection[field])
+            else:
+                query = query.do_nothing()
+            self.update_cache[key] = f"{query.get_sql()} RETURNING *"
+        return self.update_cache[key]
+
+    def _get_update_where_sql(
+        self, conflict_fields: Sequence[str], update_fields: Sequence[str]
+    ) -> str:
+        """
+        Generates the UPDATE of ``update_fields`` returning the row with the values of
+        ``conflict_fields``. Result is cached for performance.
+        """
+        key = f"update:{','.join(conflict_fields)}:{','.join(update_fields)}"
+        if key not in self.update_cache:
+            db_projection = self.model._meta.fields_db_projection
+            table = self.model._meta.basetable
+            query = self.db.query_class.update(table)
+            for i, field in enumerate(update_fields):
+                query = query.set(db_projection[field], self.parameter(i))
+            for i, field in enumerate(conflict_fields, len(update_fields)):
+                query = query.where(table[db_projection[field]] == self.parameter(i))
+            self.update_cache[key] = f"{query.get_sql()} RETURNING *"
+        return self.update_cache[key]
+
+    async def execute_upsert(
+        self, instance: Model, conflict_fields: Sequence[str], update_fields: Sequence[str]
+    ) -> tuple[Model | None, bool]:
+        """
+        Inserts ``instance``, or updates the ``update_fields`` of the row that has the same
+        values for the unique key ``conflict_fields``, without a transaction.
+
+        Needs ``capabilities.support_upsert``.
+
+        :return: The row as a new instance, and whether it was inserted.
+            The instance is ``None`` when the row exists and there are no fields to update.
+        """
+        fields_map = self.model._meta.fields_map
+        columns = (
+            self.regular_columns_all if instance._custom_generated_pk else self.regular_columns
+        )
+        values = [
+            fields_map[field].to_db_value(getattr(instance, field), instance) for field in columns
+        ]
+        updates = [
+            fields_map[field].to_db_value(getattr(instance, field), instance)
+            for field in update_fields
+        ] + [
+            fields_map[field].to_db_value(getattr(instance, field), instance)
+            for field in conflict_fields
+        ]
+        insert_sql = self._get_upsert_sql(columns, conflict_fields, ())
+        update_sql = self._get_update_where_sql(conflict_fields, update_fields)
+        while True:
+            _, rows = await self.db.execute_query(insert_sql, values)
+            if rows:
+                created = True
+                break
+            if not update_fields:
+                return None, False
+            # The row may be deleted before it is updated, it's inserted again then
+            _, rows = await self.db.execute_query(update_sql, updates)
+            if rows:
+                created = False
+                break
+        RESULT_CACHE.invalidate(self.model._meta.db_table, using_db=self.db)
+        return self._row_hydrator(rows[0], None)(rows[0]), created
+
+    async def execute_delete(self, instance: type[Model] | Model) -> int:
+        count = (
             await self.db.execute_query(
                 self.delete_query, [self.model._meta.pk.to_db_value(instance.pk, instance)]
             )
         )[0]
+        RESULT_CACHE.invalidate(
+            self.model._meta.db_table, *related_tables(self.model), using_db=self.db
+        )
+        return count
 
     async def _prefetch_reverse_relation(
         self,
@@ -317,8 +653,8 @@ class BaseExecutor:
         related_query.resolve_ordering(
             related_query.model, related_query.model._meta.basetable, [], {}
         )
-        related_object_list = await related_query.filter(
-            **{f"{k}__in": v for k, v in related_objects_for_fetch.items()}
+        related_object_list = await self._filter_in_chunks(
+            related_query, relation_field, related_objects_for_fetch.get(relation_field, [])
         )
 
         related_object_map: dict[str, list] = {}
@@ -357,8 +693,8 @@ class BaseExecutor:
                 )
             )
 
-        related_object_list = await related_query.filter(
-            **{f"{k}__in": v for k, v in related_objects_for_fetch.items()}
+        related_object_list = await self._filter_in_chunks(
+            related_query, relation_field, related_objects_for_fetch.get(relation_field, [])
         )
 
         related_object_map = {}
@@ -391,41 +727,43 @@ class BaseExecutor:
         field_object: ManyToManyFieldInstance = self.model._meta.fields_map[field]  # type: ignore
 
         through_table = Table(field_object.through)
-
-        subquery = (
-            self.db.query_class.from_(through_table)
-            .select(
-                through_table[field_object.backward_key].as_("_backward_relation_key"),
-                through_table[field_object.forward_key].as_("_forward_relation_key"),
-            )
-            .where(through_table[field_object.backward_key].isin(instance_id_set))
-        )
+        in_filter = self.get_overridden_filter_func(is_in) or is_in
 
         related_query_table = related_query.model._meta.basetable
         related_pk_field = related_query.model._meta.db_pk_column
         related_query.resolve_ordering(related_query.model, related_query_table, [], {})
-        query = (
-            related_query.query.join(subquery)
-            .on(subquery._forward_relation_key == related_query_table[related_pk_field])
-            .select(
-                subquery._backward_relation_key.as_("_backward_relation_key"),
-                *[related_query_table[field].as_(field) for field in related_query.fields],
+
+        modifier = QueryModifier()
+        for node in related_query._q_objects:
+            modifier &= node.resolve(
+                ResolveContext(
+                    model=related_query.model,
+                    table=related_query_table,
+                    annotations=related_query._annotations,
+                    custom_filters=related_query._custom_filters,
+                )
             )
-        )
 
-        if related_query._q_objects:
-            joined_tables: list[Table] = []
-            modifier = QueryModifier()
-            for node in related_query._q_objects:
-                modifier &= node.resolve(
-                    ResolveContext(
-                        model=related_query.model,
-                        table=related_query_table,
-                        annotations=related_query._annotations,
-                        custom_filters=related_query._custom_filters,
-                    )
+        raw_results: list[dict] = []
+        for instance_ids in chunk_in_list(instance_id_set, self.db):
+            subquery = (
+                self.db.query_class.from_(through_table)
+                .select(
+                    through_table[field_object.backward_key].as_("_backward_relation_key"),
+                    through_table[field_object.forward_key].as_("_forward_relation_key"),
                 )
+                .where(in_filter(through_table[field_object.backward_key], list(instance_ids)))
+            )
+            query = (
+                related_query.query.join(subquery)
+                .on(subquery._forward_relation_key == related_query_table[related_pk_field])
+                .select(
+                    subquery._backward_relation_key.as_("_backward_relation_key"),
+                    *[related_query_table[field].as_(field) for field in related_query.fields],
+                )
+            )
 
+            joined_tables: list[Table] = []
             for join in modifier.joins:
                 if join[0] not in joined_tables:
                     query = query.join(join[0], how=JoinType.left_outer).on(join[1])
@@ -437,21 +775,26 @@ class BaseExecutor:
             if modifier.having_criterion:
                 query = query.having(modifier.having_criterion)
 
-        _, raw_results = await self.db.execute_query(*query.get_parameterized_sql())
+            raw_results.extend((await self.db.execute_query(*query.get_parameterized_sql()))[1])
         relations: list[tuple[Any, Any]] = []
-        related_object_list: list[Model] = []
+        related_object_map: dict[Any, Model] = {}
         model_pk, related_pk = self.model._meta.pk, field_object.related_model._meta.pk
+        session = current_session()
         for e in raw_results:
             pk_values: tuple[Any, Any] = (
                 model_pk.to_python_value(e["_backward_relation_key"]),
                 related_pk.to_python_value(e[related_pk_field]),
             )
             relations.append(pk_values)
-            related_object_list.append(related_query.model._init_from_db(**e))
+            # Objects related to many instances are built once
+            if pk_values[1] not in related_object_map:
+                related_object = related_query.model._init_from_db(**e)
+                if session is not None:
+                    related_object = session.merge(related_object)
+                related_object_map[pk_values[1]] = related_object
         await self.__class__(
             model=related_query.model, db=self.db, prefetch_map=related_query._prefetch_map
-        )._execute_prefetch_queries(related_object_list)
-        related_object_map = {e.pk: e for e in related_object_list}
+        )._execute_prefetch_queries(list(related_object_map.values()))
         relation_map: dict[str, list] = {}
 
         for object_id, related_object_id in relations:
@@ -489,14 +832,19 @@ class BaseExecutor:
                 setattr(instance, field, None)
 
         if related_objects_for_fetch:
-            conditions: dict[str, Any] = {}
-            for k, v in related_objects_for_fetch.items():
-                if len(v) == 1:
-                    v = v[0]
-                else:
-                    k += "__in"
-                conditions[k] = v
-            related_object_list = await related_queryset.filter(**conditions)
+            if len(related_objects_for_fetch) == 1 and len(related_objects_for_fetch[key]) > 1:
+                related_object_list = await self._filter_in_chunks(
+                    related_queryset, key, related_objects_for_fetch[key]
+                )
+            else:
+                conditions: dict[str, Any] = {}
+                for k, v in related_objects_for_fetch.items():
+                    if len(v) == 1:
+                        v = v[0]
+                    else:
+                        k += "__in"
+                    conditions[k] = v
+                related_object_list = await related_queryset.filter(**conditions)
             if len(model_to_field) > 1:
                 related_object_map = {
                     getattr(obj, model_to_field[obj.__class__]): obj for obj in related_object_list
@@ -510,6 +858,19 @@ class BaseExecutor:
                     setattr(instance, to_attr, obj)
         return instance_list
 
+    async def _filter_in_chunks(self, queryset: QuerySet, key: str, values: list) -> list[Model]:
+        """
+        Returns the objects of the queryset whose ``key`` is one of the ``values``,
+        with a query for every chunk of values that fits in the bind parameters of the DB,
+        or a single one if the queryset is sliced, as the slice applies to all the values.
+        """
+        if queryset._limit is not None or queryset._offset is not None:
+            return await queryset.filter(**{f"{key}__in": values})
+        objects: list[Model] = []
+        for values_chunk in chunk_in_list(values, self.db):
+            objects.extend(await queryset.filter(**{f"{key}__in": values_chunk}))
+        return objects
+
     def _make_prefetch_queries(self) -> None:
         for field_name, forwarded_prefetches in self.prefetch_map.items():
             to_attr = None
@@ -531,6 +892,15 @@ class BaseExecutor:
         instance_id_list: Iterable[Model],
         field: str,
         related_query: tuple[str | None, QuerySet],
+    ) -> Iterable[Model]:
+        with phase(f"prefetch {self.model.__name__}.{field}"):
+            return await self._prefetch(instance_id_list, field, related_query)
+
+    async def _prefetch(
+        self,
+        instance_id_list: Iterable[Model],
+        field: str,
+        related_query: tuple[str | None, QuerySet],
     ) -> Iterable[Model]:
         if field in self.model._meta.backward_fk_fields:
             return await self._prefetch_reverse_relation(instance_id_list, field, related_query)
@@ -544,15 +914,28 @@ class BaseExecutor:
 
     async def _execute_prefetch_queries(self, instance_list: Iterable[Model]) -> Iterable[Model]:
         if instance_list and (self.prefetch_map or self._prefetch_queries):
-            self._make_prefetch_queries()
-            prefetch_tasks = []
-            for field, related_queries in self._prefetch_queries.items():
-                for related_query in related_queries:
-                    prefetch_tasks.append(self._do_prefetch(instance_list, field, related_query))
-            await asyncio.gather(*prefetch_tasks)
+            with phase("prefetch"):
+                self._make_prefetch_queries()
+                await self._run_prefetch_queries(instance_list)
 
         return instance_list
 
+    async def _run_prefetch_queries(self, instance_list: Iterable[Model]) -> None:
+        if not instance_list:
+            return
+        from tortoise.backends.base.client import pipeline
+
+        prefetch_tasks = []
+        for field, related_queries in self._prefetch_queries.items():
+            for related_query in related_queries:
+                prefetch_tasks.append(self._do_prefetch(instance_list, field, related_query))
+        if len(prefetch_tasks) == 1:
+            await prefetch_tasks[0]
+            return
+        # The prefetches of the relations are sent to the DB at once
+        with pipeline():
+            await asyncio.gather(*prefetch_tasks)
+
     async def fetch_for_list(self, instance_list: Iterable[Model], *args: str) -> Iterable[Model]:
         self.prefetch_map = {}
         for relation in args:
@@ -3,7 +3,7 @@ from __future__ import annotations
 import abc
 import asyncio
 from asyncio.events import AbstractEventLoop
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Sequence
 from functools import wraps
 from typing import TYPE_CHECKING, Any, SupportsInt, TypeVar
 
@@ -14,6 +14,7 @@ from tortoise.backends.base.client import (
     Capabilities,
     ConnectionWrapper,
     PoolConnectionWrapper,
+    StatementCache,
     TransactionContext,
 )
 from tortoise.backends.base_postgres.executor import BasePostgresExecutor
@@ -45,7 +46,14 @@ class BasePostgresClient(BaseDBAsyncClient, abc.ABC):
     executor_class: type[BasePostgresExecutor] = BasePostgresExecutor
     schema_generator: type[BasePostgresSchemaGenerator] = BasePostgresSchemaGenerator
     capabilities = Capabilities(
-        "postgres", support_update_limit_order_by=False, support_for_posix_regex_queries=True
+        "postgres",
+        support_update_limit_order_by=False,
+        support_for_posix_regex_queries=True,
+        support_returning=True,
+        ordered_returning=True,
+        support_upsert=True,
+        # asyncpg can't bind more, the protocol itself allows 65535
+        max_query_params=32767,
     )
     connection_class: AsyncConnection | Connection | None = None
     loop: AbstractEventLoop | None = None
@@ -80,6 +88,7 @@ class BasePostgresClient(BaseDBAsyncClient, abc.ABC):
         self.connection_class = self.extra.pop("connection_class", self.connection_class)
         self.pool_minsize = int(self.extra.pop("minsize", 1))
         self.pool_maxsize = int(self.extra.pop("maxsize", 5))
+        self.statement_cache = StatementCache(int(self.extra.pop("statement_cache_size", 100)))
 
         self._template: dict = {}
         self._pool = None
@@ -145,8 +154,46 @@ class BasePostgresClient(BaseDBAsyncClient, abc.ABC):
     async def execute_query_dict(self, query: str, values: list | None = None) -> list[dict]:
         raise NotImplementedError("execute_query_dict is not implemented")
 
+    @staticmethod
+    def _copy_returning_queries(
+        table: str, columns: Sequence[str], returning: str, schema: str | None
+    ) -> tuple[str, list[str], list[str]]:
+        """
+        Builds the queries to load rows into ``table`` through a temporary table,
+        so that the values of the serial column ``returning`` can be fetched for them.
+
+        The rows are loaded with their position in an extra column, which the values of
+        ``returning`` are generated and returned in the order of, as the rows returned by
+        ``INSERT ... RETURNING`` aren't in any guaranteed order.
+
+        :return: The name of the temporary table, the columns to load into it, with the
+            position last, and the queries to run before loading it, to insert from it,
+            and to drop it.
+        """
+        temp_table = f"_tortoise_copy_{table}"
+        target = f'"{schema}"."{table}"' if schema else f'"{table}"'
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        ordinal = "_tortoise_ordinal"
+        sequence = f"pg_get_serial_sequence('{target}', '{returning}')"
+        return (
+            temp_table,
+            [*columns, ordinal],
+            [
+                f'CREATE TEMPORARY TABLE "{temp_table}" AS '
+                f'SELECT {column_list}, 0::BIGINT AS "{ordinal}" FROM {target} WITH NO DATA',
+                f'WITH "rows" AS (SELECT "{ordinal}", nextval({sequence}) AS "{returning}", '
+                f'{column_list} FROM "{temp_table}" ORDER BY "{ordinal}"), '
+                f'"inserted" AS (INSERT INTO {target} ("{returning}", {column_list}) '
+                f'SELECT "{returning}", {column_list} FROM "rows") '
+                f'SELECT "{returning}" FROM "rows" ORDER BY "{ordinal}"',
+                f'DROP TABLE "{temp_table}"',
+            ],
+        )
+
     @translate_exceptions
     async def execute_script(self, query: str) -> None:
         async with self.acquire_connection() as connection:
             self.log.debug(query)
             await connection.execute(query)
+        # The script may have changed the schema the cached statements were planned for
+        self.statement_cache.invalidate()
@@ -9,11 +9,15 @@ from pypika_tortoise.terms import Term
 
 from tortoise import Model
 from tortoise.backends.base.executor import BaseExecutor
+from tortoise.cache import RESULT_CACHE
 from tortoise.contrib.postgres.array_functions import (
+    ANY_TYPES,
     postgres_array_contained_by,
     postgres_array_contains,
     postgres_array_length,
     postgres_array_overlap,
+    postgres_is_in,
+    postgres_not_in,
 )
 from tortoise.contrib.postgres.json_functions import (
     postgres_json_contained_by,
@@ -31,9 +35,11 @@ from tortoise.filters import (
     array_length,
     array_overlap,
     insensitive_posix_regex,
+    is_in,
     json_contained_by,
     json_contains,
     json_filter,
+    not_in,
     posix_regex,
     search,
 )
@@ -57,7 +63,10 @@ class BasePostgresExecutor(BaseExecutor):
         posix_regex: postgres_posix_regex,
         insensitive_posix_regex: postgres_insensitive_posix_regex,
         array_length: postgres_array_length,
+        is_in: postgres_is_in,
+        not_in: postgres_not_in,
     }
+    IN_LIST_PARAM_TYPES = ANY_TYPES
 
     def _prepare_insert_statement(
         self, columns: Sequence[str], has_generated: bool = True, ignore_conflicts: bool = False
@@ -70,6 +79,34 @@ class BasePostgresExecutor(BaseExecutor):
             query = query.on_conflict().do_nothing()
         return query
 
+    def _prepare_bulk_update_sql(self, fields: Sequence[str], rows: int) -> str | None:
+        fields_map = self.model._meta.fields_map
+        sql_types = [
+            fields_map[field].get_for_dialect("postgres", "SQL_TYPE")
+            for field in (self.model._meta.pk_attr, *fields)
+        ]
+        return self._update_from_values_sql(fields, rows, sql_types)
+
+    async def execute_upsert(
+        self, instance: Model, conflict_fields: Sequence[str], update_fields: Sequence[str]
+    ) -> tuple[Model | None, bool]:
+        if not update_fields:
+            return await super().execute_upsert(instance, conflict_fields, update_fields)
+        # A single statement: xmax is only set on the row when it was updated
+        fields_map = self.model._meta.fields_map
+        columns = (
+            self.regular_columns_all if instance._custom_generated_pk else self.regular_columns
+        )
+        values = [
+            fields_map[field].to_db_value(getattr(instance, field), instance) for field in columns
+        ]
+        sql = self._get_upsert_sql(columns, conflict_fields, update_fields)
+        _, rows = await self.db.execute_query(f'{sql}, xmax = 0 AS "_inserted"', values)
+        RESULT_CACHE.invalidate(self.model._meta.db_table, using_db=self.db)
+        row = dict(rows[0])
+        created = row.pop("_inserted")
+        return self._row_hydrator(row, None)(row), created
+
     async def _process_insert_result(self, instance: Model, results: dict | None) -> None:
         if results:
             generated_fields = self.model._meta.generated_db_fields
@@ -10,6 +10,7 @@ from tortoise.backends.base.client import (
     NestedTransactionContext,
     TransactionContext,
     TransactionContextPooled,
+    instrument_query,
 )
 from tortoise.backends.mssql.executor import MSSQLExecutor
 from tortoise.backends.mssql.schema_generator import MSSQLSchemaGenerator
@@ -26,7 +27,13 @@ class MSSQLClient(ODBCClient):
     schema_generator = MSSQLSchemaGenerator
     executor_class = MSSQLExecutor
     capabilities = Capabilities(
-        "mssql", support_update_limit_order_by=False, support_for_update=False
+        "mssql",
+        support_update_limit_order_by=False,
+        support_for_update=False,
+        support_returning=True,
+        # 2100 params per request, including the ones used by the driver
+        max_query_params=2000,
+        max_insert_rows=1000,
     )
 
     def __init__(
@@ -45,6 +52,7 @@ class MSSQLClient(ODBCClient):
     def _in_transaction(self) -> TransactionContext:
         return TransactionContextPooled(TransactionWrapper(self), self._pool_init_lock)
 
+    @instrument_query
     @translate_exceptions
     async def execute_insert(self, query: str, values: list) -> int:
         async with self.acquire_connection() as connection:
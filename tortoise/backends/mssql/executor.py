@@ -9,3 +9,6 @@ from tortoise.exceptions import UnSupportedError
 class MSSQLExecutor(ODBCExecutor):
     async def execute_explain(self, sql: str) -> Any:
         raise UnSupportedError("MSSQL does not support explain")
+
+    def _add_insert_returning(self, sql: str, column: str) -> str:
+        return sql.replace(" VALUES ", f' OUTPUT INSERTED."{column}" VALUES ', 1)
@@ -29,6 +29,7 @@ from tortoise.backends.base.client import (
     TransactionalDBClient,
     TransactionContext,
     TransactionContextPooled,
+    instrument_query,
 )
 from tortoise.backends.mysql.executor import MySQLExecutor
 from tortoise.backends.mysql.schema_generator import MySQLSchemaGenerator
@@ -72,6 +73,7 @@ class MySQLClient(BaseDBAsyncClient):
         inline_comment=True,
         support_index_hint=True,
         support_for_posix_regex_queries=True,
+        max_query_params=65535,
     )
 
     def __init__(
@@ -172,9 +174,15 @@ class MySQLClient(BaseDBAsyncClient):
     def acquire_connection(self) -> ConnectionWrapper | PoolConnectionWrapper:
         return PoolConnectionWrapper(self, self._pool_init_lock)
 
+    def _pool_sizes(self) -> tuple[int, int, int]:
+        if not self._pool:
+            return 0, 0, self.pool_maxsize
+        return self._pool.size, self._pool.freesize, self.pool_maxsize
+
     def _in_transaction(self) -> TransactionContext:
         return TransactionContextPooled(TransactionWrapper(self), self._pool_init_lock)
 
+    @instrument_query
     @translate_exceptions
     async def execute_insert(self, query: str, values: list) -> int:
         async with self.acquire_connection() as connection:
@@ -183,6 +191,7 @@ class MySQLClient(BaseDBAsyncClient):
                 await cursor.execute(query, values)
                 return cursor.lastrowid  # return auto-generated id
 
+    @instrument_query
     @translate_exceptions
     async def execute_many(self, query: str, values: list) -> None:
         async with self.acquire_connection() as connection:
@@ -200,6 +209,7 @@ class MySQLClient(BaseDBAsyncClient):
                 else:
                     await cursor.executemany(query, values)
 
+    @instrument_query
     @translate_exceptions
     async def execute_query(self, query: str, values: list | None = None) -> tuple[int, list[dict]]:
         async with self.acquire_connection() as connection:
@@ -215,6 +225,30 @@ class MySQLClient(BaseDBAsyncClient):
     async def execute_query_dict(self, query: str, values: list | None = None) -> list[dict]:
         return (await self.execute_query(query, values))[1]
 
+    @translate_exceptions
+    async def _stream_open(
+        self, connection: mysql.Connection, query: str, values: list | None
+    ) -> mysql.cursors.Cursor:
+        # Unbuffered cursor, rows are read from the socket as they are fetched
+        cursor = await connection.cursor(mysql.cursors.SSCursor).__aenter__()
+        try:
+            await cursor.execute(query, values)
+        except Exception:
+            await cursor.close()
+            raise
+        return cursor
+
+    @translate_exceptions
+    async def _stream_fetch(self, cursor: mysql.cursors.Cursor, fetch_size: int) -> list[dict]:
+        rows = await cursor.fetchmany(fetch_size)
+        if rows:
+            fields = [column[0] for column in cursor.description]
+            return [dict(zip(fields, row)) for row in rows]
+        return []
+
+    async def _stream_close(self, cursor: mysql.cursors.Cursor) -> None:
+        await cursor.close()
+
     @translate_exceptions
     async def execute_script(self, query: str) -> None:
         async with self.acquire_connection() as connection:
@@ -232,6 +266,7 @@ class TransactionWrapper(MySQLClient, TransactionalDBClient):
         self.log = connection.log
         self._finalized: bool = False
         self.fetch_inserted = connection.fetch_inserted
+        self.statement_cache = connection.statement_cache
         self._parent = connection
 
     def _in_transaction(self) -> TransactionContext:
@@ -240,6 +275,7 @@ class TransactionWrapper(MySQLClient, TransactionalDBClient):
     def acquire_connection(self) -> ConnectionWrapper[mysql.Connection]:
         return ConnectionWrapper(self._lock, self)
 
+    @instrument_query
     @translate_exceptions
     async def execute_many(self, query: str, values: list) -> None:
         async with self.acquire_connection() as connection:
@@ -1,4 +1,7 @@
+from __future__ import annotations
+
 import enum
+from collections.abc import Sequence
 
 from pypika_tortoise import SqlContext, functions
 from pypika_tortoise.enums import SqlTypes
@@ -126,6 +129,21 @@ class MySQLExecutor(BaseExecutor):
     }
     EXPLAIN_PREFIX = "EXPLAIN FORMAT=JSON"
 
+    def _prepare_bulk_update_sql(self, fields: Sequence[str], rows: int) -> str | None:
+        # UPDATE ... JOIN a derived table of the values
+        meta = self.model._meta
+        table = meta.basetable.get_sql(self.db.query_class.SQL_CONTEXT)
+        width = len(fields) + 1
+        first = ",".join(f"%s AS `column{i}`" for i in range(1, width + 1))
+        other = ",".join(["%s"] * width)
+        values = " UNION ALL ".join([f"SELECT {first}"] + [f"SELECT {other}"] * (rows - 1))
+        updates = ",".join(
+            f"{table}.{format_quotes(meta.fields_db_projection[field], '`')}=`_v`.`column{i}`"
+            for i, field in enumerate(fields, 2)
+        )
+        pk = format_quotes(meta.db_pk_column, "`")
+        return f"UPDATE {table} JOIN ({values}) `_v` ON {table}.{pk}=`_v`.`column1` SET {updates}"
+
     async def _process_insert_result(self, instance: Model, results: int) -> None:
         pk_field_object = self.model._meta.pk
         if (
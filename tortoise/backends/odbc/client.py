@@ -16,6 +16,7 @@ from tortoise.backends.base.client import (
     PoolConnectionWrapper,
     TransactionalDBClient,
     TransactionContext,
+    instrument_query,
 )
 from tortoise.backends.odbc.executor import ODBCExecutor
 from tortoise.exceptions import (
@@ -120,6 +121,12 @@ class ODBCClient(BaseDBAsyncClient, ABC):
     def acquire_connection(self) -> ConnWrapperType:
         return PoolConnectionWrapper(self, self._pool_init_lock)
 
+    def _pool_sizes(self) -> tuple[int, int, int]:
+        if not self._pool:
+            return 0, 0, self.maxsize
+        return self._pool.size, self._pool.freesize, self.maxsize
+
+    @instrument_query
     @translate_exceptions
     async def execute_many(self, query: str, values: list) -> None:
         async with self.acquire_connection() as connection:
@@ -133,6 +140,7 @@ class ODBCClient(BaseDBAsyncClient, ABC):
                 else:
                     await cursor.commit()
 
+    @instrument_query
     @translate_exceptions
     async def execute_query(self, query: str, values: list | None = None) -> tuple[int, list[dict]]:
         async with self.acquire_connection() as connection:
@@ -156,6 +164,32 @@ class ODBCClient(BaseDBAsyncClient, ABC):
     async def execute_query_dict(self, query: str, values: list | None = None) -> list[dict]:
         return (await self.execute_query(query, values))[1]
 
+    @translate_exceptions
+    async def _stream_open(
+        self, connection: asyncodbc.Connection, query: str, values: list | None
+    ) -> asyncodbc.Cursor:
+        cursor = await connection.cursor()
+        try:
+            if values:
+                await cursor.execute(query, values)
+            else:
+                await cursor.execute(query)
+        except Exception:
+            await cursor.close()
+            raise
+        return cursor
+
+    @translate_exceptions
+    async def _stream_fetch(self, cursor: asyncodbc.Cursor, fetch_size: int) -> list[dict]:
+        rows = await cursor.fetchmany(fetch_size)
+        if rows:
+            fields = [c[0] for c in cursor.description]
+            return [dict(zip(fields, row)) for row in rows]
+        return []
+
+    async def _stream_close(self, cursor: asyncodbc.Cursor) -> None:
+        await cursor.close()
+
     @translate_exceptions
     async def execute_script(self, query: str) -> None:
         async with self.acquire_connection() as connection:
@@ -173,6 +207,7 @@ class ODBCTransactionWrapper(TransactionalDBClient):
         self.log = connection.log
         self._finalized: bool = False
         self.fetch_inserted = connection.fetch_inserted
+        self.statement_cache = connection.statement_cache
         self._parent = connection
 
     def _in_transaction(self) -> TransactionContext:
@@ -181,6 +216,7 @@ class ODBCTransactionWrapper(TransactionalDBClient):
     def acquire_connection(self) -> ConnWrapperType:
         return ConnectionWrapper(self._lock, self)
 
+    @instrument_query
     @translate_exceptions
     async def execute_many(self, query: str, values: list) -> None:
         async with self.acquire_connection() as connection:
@@ -21,6 +21,7 @@ from tortoise.backends.base.client import (
     PoolConnectionWrapper,
     TransactionContext,
     TransactionContextPooled,
+    instrument_query,
 )
 from tortoise.backends.odbc.client import (
     ODBCClient,
@@ -38,7 +39,8 @@ class OracleClient(ODBCClient):
     query_class = OracleQuery
     schema_generator = OracleSchemaGenerator
     executor_class = OracleExecutor
-    capabilities = Capabilities(dialect="oracle")
+    capabilities = Capabilities(dialect="oracle", max_query_params=65535, max_insert_rows=1)
+    ping_query = "SELECT 1 FROM DUAL"
 
     def __init__(
         self,
@@ -89,6 +91,7 @@ class OracleClient(ODBCClient):
                         continue
                     await cursor.execute(q)
 
+    @instrument_query
     @translate_exceptions
     async def execute_insert(self, query: str, values: list) -> int:
         async with self.acquire_connection() as connection:
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable, Sequence
 from contextlib import _AsyncGeneratorContextManager
+from itertools import count
 from ssl import SSLContext
-from typing import Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 import psycopg
 import psycopg.conninfo
 import psycopg.pq
 import psycopg.rows
+import psycopg.sql
 import psycopg_pool
 from pypika_tortoise import SqlContext
 from pypika_tortoise.dialects.postgresql import PostgreSQLQuery, PostgreSQLQueryBuilder
@@ -24,6 +26,13 @@ from tortoise.backends.psycopg.schema_generator import PsycopgSchemaGenerator
 FuncType = Callable[..., Any]
 F = TypeVar("F", bound=FuncType)
 
+if TYPE_CHECKING:  # pragma: nocoverage
+    # A server-side cursor and the transaction opened for it
+    _StreamCursor = tuple[
+        psycopg.AsyncServerCursor[dict[str, Any]],
+        _AsyncGeneratorContextManager[psycopg.AsyncTransaction] | None,
+    ]
+
 
 class AsyncConnectionPool(psycopg_pool.AsyncConnectionPool):
     # TortoiseORM has this interface hardcoded in the tests so we need to support it
@@ -60,6 +69,9 @@ class PsycopgClient(postgres_client.BasePostgresClient):
     _pool: AsyncConnectionPool | None = None
     _connection: psycopg.AsyncConnection
     default_timeout: float = 30
+    _pool_timeout_errors = (asyncio.TimeoutError, psycopg_pool.PoolTimeout)
+    # The pipeline mode needs libpq 14
+    _supports_pipeline = psycopg.AsyncPipeline.is_supported()
 
     @postgres_client.translate_exceptions
     async def create_connection(self, with_db: bool) -> None:
@@ -94,10 +106,15 @@ class PsycopgClient(postgres_client.BasePostgresClient):
             "kwargs": {
                 "autocommit": True,
                 "row_factory": psycopg.rows.dict_row,
+                # None stops psycopg from preparing statements on its own, which breaks
+                # behind poolers like pgbouncer in transaction mode
+                "prepare_threshold": 5 if self.statement_cache.enabled else None,
             },
             "connection_class": psycopg.AsyncConnection,
             **extra,
         }
+        if self.statement_cache.enabled:
+            self._template["configure"] = self._configure_connection(extra.get("configure"))
 
         try:
             self._pool = await self.create_pool(**self._template)
@@ -110,11 +127,29 @@ class PsycopgClient(postgres_client.BasePostgresClient):
                 f"Can't establish connection to database {self.database}"
             )
 
+    def _configure_connection(
+        self, configure: Callable[[psycopg.AsyncConnection], Awaitable[None]] | None
+    ) -> Callable[[psycopg.AsyncConnection], Awaitable[None]]:
+        async def configure_connection(connection: psycopg.AsyncConnection) -> None:
+            # psycopg manages the prepared statements of the connection in an LRU of its own,
+            # sized like the statement cache that mirrors it
+            connection.prepared_max = self.statement_cache.max_size
+            if configure is not None:
+                await configure(connection)
+
+        return configure_connection
+
     async def create_pool(self, **kwargs) -> AsyncConnectionPool:
         pool = AsyncConnectionPool(open=False, **kwargs)
         await pool.open()
         return pool
 
+    def _pool_sizes(self) -> tuple[int, int, int]:
+        if not self._pool:
+            return 0, 0, self.pool_maxsize
+        stats = self._pool.get_stats()
+        return stats["pool_size"], stats["pool_available"], self.pool_maxsize
+
     async def db_delete(self) -> None:
         try:
             return await super().db_delete()
@@ -128,6 +163,7 @@ class PsycopgClient(postgres_client.BasePostgresClient):
         else:
             return None
 
+    @base_client.instrument_query
     @postgres_client.translate_exceptions
     async def execute_many(self, query: str, values: list) -> None:
         connection: psycopg.AsyncConnection
@@ -136,6 +172,55 @@ class PsycopgClient(postgres_client.BasePostgresClient):
                 self.log.debug("%s: %s", query, values)
                 await cursor.executemany(query, values)
 
+    @base_client.instrument_copy
+    @postgres_client.translate_exceptions
+    async def execute_copy(
+        self,
+        table: str,
+        columns: Sequence[str],
+        values: list[list],
+        returning: str | None = None,
+        schema: str | None = None,
+    ) -> list:
+        connection: psycopg.AsyncConnection
+        async with self.acquire_connection() as connection:
+            self.log.debug("COPY %s (%s): %s", table, ", ".join(columns), values)
+            if not returning:
+                await self._copy_records(connection, table, columns, values, schema)
+                return []
+            temp_table, copy_columns, (create, insert, drop) = self._copy_returning_queries(
+                table, columns, returning, schema
+            )
+            async with connection.transaction():
+                await connection.execute(create)
+                await self._copy_records(
+                    connection,
+                    temp_table,
+                    copy_columns,
+                    [[*row, position] for position, row in enumerate(values)],
+                )
+                rows = await (await connection.execute(insert)).fetchall()
+                await connection.execute(drop)
+            return [row[returning] for row in cast(list[dict], rows)]
+
+    @staticmethod
+    async def _copy_records(
+        connection: psycopg.AsyncConnection,
+        table: str,
+        columns: Sequence[str],
+        values: list[list],
+        schema: str | None = None,
+    ) -> None:
+        query = psycopg.sql.SQL("COPY {} ({}) FROM STDIN").format(
+            psycopg.sql.Identifier(schema, table) if schema else psycopg.sql.Identifier(table),
+            psycopg.sql.SQL(", ").join(map(psycopg.sql.Identifier, columns)),
+        )
+        async with connection.cursor() as cursor:
+            async with cursor.copy(query) as copy:
+                for row in values:
+                    await copy.write_row(row)
+
+    @base_client.instrument_query
     @postgres_client.translate_exceptions
     async def execute_query(
         self,
@@ -148,7 +233,7 @@ class PsycopgClient(postgres_client.BasePostgresClient):
             cursor: psycopg.AsyncCursor | psycopg.AsyncServerCursor
             async with connection.cursor(row_factory=row_factory) as cursor:
                 self.log.debug("%s: %s", query, values)
-                await cursor.execute(query, values)
+                await self._execute_prepared(connection, cursor, query, values)
 
                 rowcount = int(cursor.rowcount or cursor.rownumber or 0)
 
@@ -160,9 +245,91 @@ class PsycopgClient(postgres_client.BasePostgresClient):
                 return rowcount, cast(list[dict], rows)
 
     async def execute_query_dict(self, query: str, values: list | None = None) -> list[dict]:
-        rowcount, rows = await self.execute_query(query, values, row_factory=psycopg.rows.dict_row)
+        rowcount, rows = await self.execute_query(query, values)
         return rows
 
+    @postgres_client.translate_exceptions
+    async def _execute_pipeline(self, statements: list[tuple[str, str, Any]]) -> list[Any]:
+        connection: psycopg.AsyncConnection
+        async with self.acquire_connection() as connection:
+            cursors = [connection.cursor(row_factory=psycopg.rows.dict_row) for _ in statements]
+            try:
+                async with connection.pipeline():
+                    for cursor, (_, query, values) in zip(cursors, statements):
+                        self.log.debug("%s: %s", query, values)
+                        await cursor.execute(query, values)
+                # All the results are received when the pipeline exits
+                results: list[Any] = []
+                for cursor in cursors:
+                    rowcount = int(cursor.rowcount or cursor.rownumber or 0)
+                    pgresult = cursor.pgresult
+                    if pgresult and pgresult.status == psycopg.pq.ExecStatus.TUPLES_OK:
+                        rows = await cursor.fetchall()
+                    else:
+                        rows = []
+                    results.append((rowcount, rows))
+                return results
+            finally:
+                for cursor in cursors:
+                    await cursor.close()
+
+    async def _execute_prepared(
+        self,
+        connection: psycopg.AsyncConnection,
+        cursor: psycopg.AsyncCursor,
+        query: str,
+        values: list | None,
+    ) -> None:
+        if not self.statement_cache.enabled:
+            await cursor.execute(query, values)
+            return
+        # The statement cache only mirrors the LRU of psycopg, to keep count of hits and
+        # evictions
+        if self.statement_cache.get(connection, query) is None:
+            self.statement_cache.put(connection, query, True)
+        try:
+            await cursor.execute(query, values, prepare=True)
+        except psycopg.errors.FeatureNotSupported:
+            # "cached plan must not change result type": the schema changed since the statement
+            # was prepared, it can only be prepared again if no transaction got aborted
+            self.statement_cache.invalidate(connection)
+            if connection.info.transaction_status != psycopg.pq.TransactionStatus.IDLE:
+                raise
+            await connection.execute("DEALLOCATE ALL")
+            await cursor.execute(query, values, prepare=True)
+
+    @postgres_client.translate_exceptions
+    async def _stream_open(
+        self, connection: psycopg.AsyncConnection, query: str, values: list | None
+    ) -> _StreamCursor:
+        # Server-side cursors can only exist inside a transaction
+        transaction = None
+        if connection.info.transaction_status == psycopg.pq.TransactionStatus.IDLE:
+            transaction = connection.transaction()
+            await transaction.__aenter__()
+        cursor = connection.cursor(_gen_cursor_name(), row_factory=psycopg.rows.dict_row)
+        try:
+            await cursor.execute(query, values)
+        except Exception as exc:
+            await cursor.close()
+            if transaction:
+                await transaction.__aexit__(type(exc), exc, exc.__traceback__)
+            raise
+        return cursor, transaction
+
+    @postgres_client.translate_exceptions
+    async def _stream_fetch(
+        self,
+        cursor: _StreamCursor,
+        fetch_size: int,
+    ) -> list[dict]:
+        return cast(list[dict], await cursor[0].fetchmany(fetch_size))
+
+    async def _stream_close(self, cursor: _StreamCursor) -> None:
+        await cursor[0].close()
+        if transaction := cursor[1]:
+            await transaction.__aexit__(None, None, None)
+
     async def _expire_connections(self) -> None:
         if self._pool:  # pragma: nobranch
             await self._pool.close()
@@ -211,6 +378,7 @@ class TransactionWrapper(PsycopgClient, base_client.TransactionalDBClient):
         self.connection_name = connection.connection_name
         self._transaction: _AsyncGeneratorContextManager[psycopg.AsyncTransaction] | None = None
         self._finalized = False
+        self.statement_cache = connection.statement_cache
         self._parent = connection
 
     def _in_transaction(self) -> base_client.TransactionContext:
@@ -252,3 +420,7 @@ class TransactionWrapper(PsycopgClient, base_client.TransactionalDBClient):
 
     async def savepoint_rollback(self) -> None:
         await self.rollback()
+
+
+def _gen_cursor_name(_c=count()) -> str:
+    return f"tortoise_cursor_{next(_c)}"
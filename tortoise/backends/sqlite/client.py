@@ -6,6 +6,7 @@ import sqlite3
 from collections.abc import Callable, Coroutine, Sequence
 from functools import wraps
 from itertools import count
+from pathlib import Path
 from typing import Any, TypeVar, cast
 
 import aiosqlite
@@ -16,9 +17,11 @@ from tortoise.backends.base.client import (
     Capabilities,
     ConnectionWrapper,
     NestedTransactionContext,
+    PoolConnectionWrapper,
     T_conn,
     TransactionalDBClient,
     TransactionContext,
+    instrument_query,
 )
 from tortoise.backends.sqlite.executor import SqliteExecutor
 from tortoise.backends.sqlite.schema_generator import SqliteSchemaGenerator
@@ -49,10 +52,58 @@ def translate_exceptions(func: FuncType) -> FuncType:
     return translate_exceptions_
 
 
+def _run_pipeline(
+    connection: sqlite3.Connection, statements: list[tuple[str, str, list | None]]
+) -> list[Any]:
+    # Runs in the thread of the aiosqlite connection
+    results: list[Any] = []
+    for method, query, values in statements:
+        try:
+            start = connection.total_changes
+            rows = connection.execute(query, values or ()).fetchall()
+        except sqlite3.OperationalError as exc:
+            results.append(OperationalError(exc))
+        except sqlite3.IntegrityError as exc:
+            results.append(IntegrityError(exc))
+        except Exception as exc:
+            results.append(exc)
+        else:
+            if method == "execute_query":
+                results.append(((connection.total_changes - start) or len(rows), rows))
+            else:
+                results.append(list(map(dict, rows)))
+    return results
+
+
+class SqliteReadPool:
+    """
+    Read-only connections to a SQLite DB, each one running on its own aiosqlite thread.
+    """
+
+    __slots__ = ("connections", "_idle")
+
+    def __init__(self, connections: list[aiosqlite.Connection]) -> None:
+        self.connections = connections
+        self._idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        for connection in connections:
+            self._idle.put_nowait(connection)
+
+    async def acquire(self) -> aiosqlite.Connection:
+        return await self._idle.get()
+
+    async def release(self, connection: aiosqlite.Connection) -> None:
+        self._idle.put_nowait(connection)
+
+    async def close(self) -> None:
+        for connection in self.connections:
+            await connection.close()
+
+
 class SqliteClient(BaseDBAsyncClient):
     executor_class = SqliteExecutor
     query_class = SQLLiteQuery
     schema_generator = SqliteSchemaGenerator
+    _supports_pipeline = True
     capabilities = Capabilities(
         "sqlite",
         daemon=False,
@@ -60,6 +111,10 @@ class SqliteClient(BaseDBAsyncClient):
         inline_comment=True,
         support_for_update=False,
         support_update_limit_order_by=False,
+        support_returning=sqlite3.sqlite_version_info >= (3, 35),
+        ascending_generated_keys=True,
+        support_upsert=sqlite3.sqlite_version_info >= (3, 35),
+        max_query_params=32766 if sqlite3.sqlite_version_info >= (3, 32) else 999,
     )
 
     def __init__(self, file_path: str, **kwargs: Any) -> None:
@@ -72,27 +127,49 @@ class SqliteClient(BaseDBAsyncClient):
         self.pragmas.setdefault("journal_mode", "WAL")
         self.pragmas.setdefault("journal_size_limit", 16384)
         self.pragmas.setdefault("foreign_keys", "ON")
+        # The connections of an in-memory DB each have their own DB
+        read_pool_size = int(self.pragmas.pop("read_pool_size", 0))
+        self.read_pool_size = 0 if ":memory:" in file_path else read_pool_size
 
         self._connection: aiosqlite.Connection | None = None
         self._lock = asyncio.Lock()
+        self._pool: SqliteReadPool | None = None
+        self._pool_init_lock = asyncio.Lock()
+
+    async def _connect(
+        self, database: str, pragmas: dict[str, Any], uri: bool = False
+    ) -> aiosqlite.Connection:
+        connection = aiosqlite.connect(database, isolation_level=None, uri=uri)
+        connection.start()
+        await connection._connect()
+        connection._conn.row_factory = sqlite3.Row
+        for pragma, val in pragmas.items():
+            cursor = await connection.execute(f"PRAGMA {pragma}={val}")
+            await cursor.close()
+        return connection
 
     async def create_connection(self, with_db: bool) -> None:
         if not self._connection:  # pragma: no branch
-            self._connection = aiosqlite.connect(self.filename, isolation_level=None)
-            self._connection.start()
-            await self._connection._connect()
-            self._connection._conn.row_factory = sqlite3.Row
-            for pragma, val in self.pragmas.items():
-                cursor = await self._connection.execute(f"PRAGMA {pragma}={val}")
-                await cursor.close()
+            self._connection = await self._connect(self.filename, self.pragmas)
             self.log.debug(
                 "Created connection %s with params: filename=%s %s",
                 self._connection,
                 self.filename,
                 " ".join(f"{k}={v}" for k, v in self.pragmas.items()),
             )
+        if self.read_pool_size and not self._pool:
+            # The journal mode is set by the writer, read-only connections can't change it
+            pragmas = {k: v for k, v in self.pragmas.items() if k != "journal_mode"}
+            uri = f"{Path(self.filename).resolve().as_uri()}?mode=ro"
+            self._pool = SqliteReadPool(
+                [await self._connect(uri, pragmas, uri=True) for _ in range(self.read_pool_size)]
+            )
+            self.log.debug("Created read pool of %s connections to %s", self.read_pool_size, uri)
 
     async def close(self) -> None:
+        if self._pool:
+            await self._pool.close()
+            self._pool = None
         if self._connection:
             await self._connection.close()
             self.log.debug(
@@ -121,15 +198,31 @@ class SqliteClient(BaseDBAsyncClient):
     def acquire_connection(self) -> ConnectionWrapper:
         return ConnectionWrapper(self._lock, self)
 
+    def _acquire_read_connection(self, query: str) -> ConnectionWrapper | PoolConnectionWrapper:
+        """
+        Acquires a connection of the read pool for a SELECT when the pool is enabled,
+        else the connection shared with the writes.
+        """
+        if self.read_pool_size and query.lstrip()[:6].upper() == "SELECT":
+            return PoolConnectionWrapper(self, self._pool_init_lock)
+        return self.acquire_connection()
+
+    def _pool_sizes(self) -> tuple[int, int, int]:
+        size = (1 if self._connection else 0) + (len(self._pool.connections) if self._pool else 0)
+        in_use = self.pool_metrics.in_use if self.pool_metrics is not None else 0
+        return size, max(size - in_use, 0), 1 + self.read_pool_size
+
     def _in_transaction(self) -> TransactionContext:
         return SqliteTransactionContext(SqliteTransactionWrapper(self), self._lock)
 
+    @instrument_query
     @translate_exceptions
     async def execute_insert(self, query: str, values: list) -> int:
         async with self.acquire_connection() as connection:
             self.log.debug("%s: %s", query, values)
             return (await connection.execute_insert(query, values))[0]
 
+    @instrument_query
     @translate_exceptions
     async def execute_many(self, query: str, values: list[list]) -> None:
         async with self.acquire_connection() as connection:
@@ -144,30 +237,56 @@ class SqliteClient(BaseDBAsyncClient):
             else:
                 await connection.commit()
 
+    @instrument_query
     @translate_exceptions
     async def execute_query(
         self, query: str, values: list | None = None
     ) -> tuple[int, Sequence[dict]]:
         query = query.replace("\x00", "'||CHAR(0)||'")
-        async with self.acquire_connection() as connection:
+        async with self._acquire_read_connection(query) as connection:
             self.log.debug("%s: %s", query, values)
             start = connection.total_changes
             rows = await connection.execute_fetchall(query, values)
             return (connection.total_changes - start) or len(rows), rows
 
+    @instrument_query
     @translate_exceptions
     async def execute_query_dict(self, query: str, values: list | None = None) -> list[dict]:
         query = query.replace("\x00", "'||CHAR(0)||'")
-        async with self.acquire_connection() as connection:
+        async with self._acquire_read_connection(query) as connection:
             self.log.debug("%s: %s", query, values)
             return list(map(dict, await connection.execute_fetchall(query, values)))
 
+    async def _execute_pipeline(self, statements: list[tuple[str, str, Any]]) -> list[Any]:
+        statements = [
+            (method, query.replace("\x00", "'||CHAR(0)||'"), values)
+            for method, query, values in statements
+        ]
+        async with self._acquire_read_connection(statements[0][1]) as connection:
+            for _, query, values in statements:
+                self.log.debug("%s: %s", query, values)
+            # All the queries in a single call to the thread of the connection
+            return await connection._execute(_run_pipeline, connection._conn, statements)
+
     @translate_exceptions
     async def execute_script(self, query: str) -> None:
         async with self.acquire_connection() as connection:
             self.log.debug(query)
             await connection.executescript(query)
 
+    @translate_exceptions
+    async def _stream_open(
+        self, connection: aiosqlite.Connection, query: str, values: list | None
+    ) -> aiosqlite.Cursor:
+        return await connection.execute(query.replace("\x00", "'||CHAR(0)||'"), values)
+
+    @translate_exceptions
+    async def _stream_fetch(self, cursor: aiosqlite.Cursor, fetch_size: int) -> Sequence[dict]:
+        return cast(Sequence[dict], await cursor.fetchmany(fetch_size))
+
+    async def _stream_close(self, cursor: aiosqlite.Cursor) -> None:
+        await cursor.close()
+
 
 class SqliteTransactionContext(TransactionContext):
     """A SQLite-specific transaction context.
@@ -209,6 +328,7 @@ class SqliteTransactionContext(TransactionContext):
         finally:
             connections.reset(self.token)
             self._trxlock.release()
+            await self.connection._transaction_ended()
 
 
 class SqliteTransactionWrapper(SqliteClient, TransactionalDBClient):
@@ -217,15 +337,20 @@ class SqliteTransactionWrapper(SqliteClient, TransactionalDBClient):
         self.connection_name = connection.connection_name
         self._connection: aiosqlite.Connection = cast(aiosqlite.Connection, connection._connection)
         self._lock = asyncio.Lock()
+        # Reads in the transaction have to see its writes
+        self.read_pool_size = 0
+        self._pool = None
         self._savepoint: str | None = None
         self.log = connection.log
         self._finalized = False
         self.fetch_inserted = connection.fetch_inserted
+        self.statement_cache = connection.statement_cache
         self._parent = connection
 
     def _in_transaction(self) -> TransactionContext:
         return NestedTransactionContext(SqliteTransactionWrapper(self))
 
+    @instrument_query
     @translate_exceptions
     async def execute_many(self, query: str, values: list[list]) -> None:
         async with self.acquire_connection() as connection:
@@ -284,9 +409,15 @@ class SqliteClientWithRegexpSupport(SqliteClient):
         inline_comment=True,
         support_for_update=False,
         support_for_posix_regex_queries=True,
+        support_returning=sqlite3.sqlite_version_info >= (3, 35),
+        ascending_generated_keys=True,
+        support_upsert=sqlite3.sqlite_version_info >= (3, 35),
+        max_query_params=32766 if sqlite3.sqlite_version_info >= (3, 32) else 999,
     )
 
-    async def create_connection(self, with_db: bool) -> None:
-        await super().create_connection(with_db)
-        if self._connection:
-            await install_regexp_functions_to_db(self._connection)
+    async def _connect(
+        self, database: str, pragmas: dict[str, Any], uri: bool = False
+    ) -> aiosqlite.Connection:
+        connection = await super()._connect(database, pragmas, uri)
+        await install_regexp_functions_to_db(connection)
+        return connection
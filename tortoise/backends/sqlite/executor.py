@@ -1,15 +1,19 @@
+from __future__ import annotations
+
 import datetime
 import sqlite3
+from collections.abc import Sequence
 from decimal import Decimal
 
 from tortoise import Model
 from tortoise.backends.base.executor import BaseExecutor
+from tortoise.contrib.sqlite.functions import JSON_EACH_TYPES, sqlite_is_in, sqlite_not_in
 from tortoise.contrib.sqlite.regex import (
     insensitive_posix_sqlite_regexp,
     posix_sqlite_regexp,
 )
 from tortoise.fields import BigIntField, IntField, SmallIntField
-from tortoise.filters import insensitive_posix_regex, posix_regex
+from tortoise.filters import insensitive_posix_regex, is_in, not_in, posix_regex
 
 # Conversion for the cases where it's hard to know the
 # related field, e.g. in raw queries, math or annotations.
@@ -25,6 +29,17 @@ class SqliteExecutor(BaseExecutor):
         posix_regex: posix_sqlite_regexp,
         insensitive_posix_regex: insensitive_posix_sqlite_regexp,
     }
+    if sqlite3.sqlite_version_info >= (3, 38):
+        # JSON functions are built in since 3.38
+        FILTER_FUNC_OVERRIDE[is_in] = sqlite_is_in
+        FILTER_FUNC_OVERRIDE[not_in] = sqlite_not_in
+        IN_LIST_PARAM_TYPES = JSON_EACH_TYPES
+
+    def _prepare_bulk_update_sql(self, fields: Sequence[str], rows: int) -> str | None:
+        if sqlite3.sqlite_version_info < (3, 33):
+            # UPDATE ... FROM is supported since 3.33
+            return None
+        return self._update_from_values_sql(fields, rows)
 
     async def _process_insert_result(self, instance: Model, results: int) -> None:
         pk_field_object = self.model._meta.pk
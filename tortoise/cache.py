@@ -0,0 +1,454 @@
+"""
+Second-level cache of model rows, keyed by primary key.
+
+Models opt in with ``Meta.cache``:
+
+.. code-block:: python3
+
+    class Currency(Model):
+        code = fields.CharField(max_length=3, primary_key=True)
+        rate = fields.DecimalField(max_digits=12, decimal_places=6)
+
+        class Meta:
+            cache = CacheConfig(ttl=300, max_entries=500)
+
+The rows of the objects looked up by primary key are then kept in the cache, which serves
+``Model.get(pk=...)``, ``get_or_none(pk=...)``, ``in_bulk()`` and the awaits of foreign keys
+until the object is saved, updated or deleted through the ORM, or the ``ttl`` expires.
+
+The results of any query can be cached as well with ``QuerySet.cache()``, see
+:class:`ResultCache`.
+"""
+
+from __future__ import annotations
+
+import pickle  # nosec
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any
+
+from tortoise.identity import current_session
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.backends.base.client import BaseDBAsyncClient
+    from tortoise.models import MetaInfo, Model
+
+
+def _on_transaction_end(
+    db: BaseDBAsyncClient | None, callback: Callable[[], Awaitable[Any]]
+) -> None:
+    # Until a transaction commits, other connections still read the rows it changed and may
+    # cache them again, so its writes are invalidated once more when it ends
+    from tortoise.backends.base.client import TransactionalDBClient
+
+    if isinstance(db, TransactionalDBClient):
+        db.on_transaction_end(callback)
+
+
+class CacheBackend:
+    """
+    Storage of a cache, e.g. an in-process LRU or a shared cache such as Redis.
+
+    Values are dicts of plain field values, which a shared backend has to serialize.
+    Subclass it and pass an instance as ``CacheConfig(backend=...)`` to replace the
+    in-memory backend.
+    """
+
+    async def get(self, namespace: str, key: Hashable) -> Any | None:
+        """
+        Returns the value stored for ``key``, ``None`` if missing or expired.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+    async def get_many(self, namespace: str, keys: Iterable[Hashable]) -> dict[Hashable, Any]:
+        """
+        Returns the values stored for the ``keys`` that are cached.
+        """
+        values = {}
+        for key in keys:
+            if (value := await self.get(namespace, key)) is not None:
+                values[key] = value
+        return values
+
+    async def set(self, namespace: str, key: Hashable, value: Any, ttl: float | None) -> None:
+        """
+        Stores the value for ``key``, for ``ttl`` seconds or until evicted if ``None``.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+    async def delete(self, namespace: str, keys: Iterable[Hashable]) -> None:
+        """
+        Drops the values of the ``keys``.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+    async def clear(self, namespace: str) -> None:
+        """
+        Drops all the values of the namespace.
+        """
+        raise NotImplementedError()  # pragma: nocoverage
+
+
+class MemoryCache(CacheBackend):
+    """
+    In-process LRU cache.
+
+    :param max_entries: Max number of values kept, over all namespaces.
+
+    .. attribute:: evictions
+
+        Number of values dropped because the cache was full
+    """
+
+    def __init__(self, max_entries: int = 1000) -> None:
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._values: OrderedDict[tuple[str, Hashable], tuple[float, Any]] = OrderedDict()
+
+    async def get(self, namespace: str, key: Hashable) -> Any | None:
+        entry = self._values.get((namespace, key))
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._values[(namespace, key)]
+            return None
+        self._values.move_to_end((namespace, key))
+        return value
+
+    async def set(self, namespace: str, key: Hashable, value: Any, ttl: float | None) -> None:
+        expires = float("inf") if ttl is None else time.monotonic() + ttl
+        self._values[(namespace, key)] = (expires, value)
+        self._values.move_to_end((namespace, key))
+        while len(self._values) > self.max_entries:
+            self._values.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, namespace: str, keys: Iterable[Hashable]) -> None:
+        for key in keys:
+            self._values.pop((namespace, key), None)
+
+    async def clear(self, namespace: str) -> None:
+        for key in [key for key in self._values if key[0] == namespace]:
+            del self._values[key]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class CacheConfig:
+    """
+    Enables the second-level cache of a model, as ``Meta.cache``.
+
+    :param ttl: Seconds a row is cached, ``None`` to keep it until evicted or invalidated.
+    :param max_entries: Max number of rows kept by the default in-memory backend.
+    :param backend: The cache backend to use instead of a :class:`MemoryCache`.
+    """
+
+    def __init__(
+        self,
+        ttl: float | None = 60.0,
+        max_entries: int = 1000,
+        backend: CacheBackend | None = None,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.backend = backend
+
+
+class ModelCache:
+    """
+    The cache of the rows of a model, available as ``Model._meta.cache``.
+
+    .. attribute:: hits
+
+        Number of objects served from the cache
+
+    .. attribute:: misses
+
+        Number of objects looked up that had to be fetched from the DB
+
+    .. attribute:: version
+
+        Number of invalidations of the cache, to be read before fetching the rows passed to
+        :meth:`put`
+    """
+
+    def __init__(self, meta: MetaInfo, config: CacheConfig) -> None:
+        self.meta = meta
+        self.ttl = config.ttl
+        self.backend = config.backend or MemoryCache(config.max_entries)
+        self.hits = 0
+        self.misses = 0
+        self.version = 0
+
+    @property
+    def namespace(self) -> str:
+        return self.meta.full_name
+
+    def _row(self, instance: Model) -> dict[str, Any]:
+        row = {field: getattr(instance, field) for field in self.meta.fields_db_projection}
+        # Mutable values, e.g. of JSON fields, must not be shared with the objects
+        return deepcopy(row) if self.meta.db_complex_fields else row
+
+    def _instance(self, row: dict[str, Any]) -> Model:
+        # Like Model._init_from_db(), with values that are already converted
+        model = self.meta._model
+        instance = model.__new__(model)
+        instance._partial = False
+        instance._saved_in_db = True
+        instance._custom_generated_pk = self.meta.db_pk_column not in self.meta.generated_db_fields
+        instance._await_when_save = {}
+        for field, value in (deepcopy(row) if self.meta.db_complex_fields else row).items():
+            setattr(instance, field, value)
+        # Loaded values of the mutable fields are what their changes are found against
+        instance._reset_changes()
+        return instance
+
+    @staticmethod
+    def _merge(instance: Model) -> Model:
+        session = current_session()
+        return session.merge(instance) if session is not None else instance
+
+    async def get(self, pk: Any) -> Model | None:
+        """
+        Returns the cached object with the primary key, ``None`` if not cached.
+        """
+        row = await self.backend.get(self.namespace, pk)
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._merge(self._instance(row))
+
+    async def get_many(self, pks: Iterable[Any]) -> dict[Any, Model]:
+        """
+        Returns the cached objects among the primary keys, by primary key.
+        """
+        pks = list(pks)
+        rows = await self.backend.get_many(self.namespace, pks)
+        self.hits += len(rows)
+        self.misses += len(pks) - len(rows)
+        return {pk: self._merge(self._instance(row)) for pk, row in rows.items()}
+
+    async def put(self, *instances: Model, version: int | None = None) -> None:
+        """
+        Caches the rows of the objects.
+
+        :param version: The :attr:`version` of the cache before the objects were fetched. If
+            it was invalidated since, the rows may predate a write and aren't cached.
+        """
+        if version is not None and version != self.version:
+            return
+        for instance in instances:
+            await self.backend.set(self.namespace, instance.pk, self._row(instance), self.ttl)
+
+    async def invalidate(self, *pks: Any, using_db: BaseDBAsyncClient | None = None) -> None:
+        """
+        Drops the rows of the primary keys from the cache.
+
+        :param using_db: The client that changed the rows. If it is a transaction, the rows
+            are dropped again when it ends.
+        """
+        self.version += 1
+        await self.backend.delete(self.namespace, pks)
+
+        async def delete() -> None:
+            self.version += 1
+            await self.backend.delete(self.namespace, pks)
+
+        _on_transaction_end(using_db, delete)
+
+    async def clear(self, using_db: BaseDBAsyncClient | None = None) -> None:
+        """
+        Drops all the rows of the model from the cache.
+
+        :param using_db: The client that changed the rows. If it is a transaction, the rows
+            are dropped again when it ends.
+        """
+        self.version += 1
+        await self.backend.clear(self.namespace)
+
+        async def clear() -> None:
+            self.version += 1
+            await self.backend.clear(self.namespace)
+
+        _on_transaction_end(using_db, clear)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns the hit and miss counters, with ``hit_rate`` the share of the objects served
+        from the cache.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+
+async def invalidate_related(model: type[Model], using_db: BaseDBAsyncClient | None = None) -> None:
+    """
+    Clears the caches of the models referencing ``model``, whose rows the DB may change when
+    rows of ``model`` are deleted (``CASCADE``, ``SET NULL`` or ``SET DEFAULT``).
+    """
+    meta = model._meta
+    for field in meta.backward_fk_fields | meta.backward_o2o_fields:
+        related_cache = meta.fields_map[field].related_model._meta.cache  # type: ignore
+        if related_cache is not None:
+            await related_cache.clear(using_db)
+
+
+_TABLE_RE = re.compile(r"\b(?:FROM|JOIN)\s+(?:[`\"\[]?\w+[`\"\]]?\.)?[`\"\[]?(\w+)", re.IGNORECASE)
+
+
+def query_tables(sql: str) -> set[str]:
+    """
+    Returns the names of the tables a SELECT query reads from, including its joins and
+    subqueries.
+    """
+    return set(_TABLE_RE.findall(sql))
+
+
+def related_tables(model: type[Model]) -> set[str]:
+    """
+    Returns the tables the DB may change when rows of ``model`` are deleted: the tables of the
+    models referencing it and of its many-to-many relations.
+    """
+    meta = model._meta
+    tables = {
+        meta.fields_map[field].related_model._meta.db_table  # type: ignore
+        for field in meta.backward_fk_fields | meta.backward_o2o_fields
+    }
+    tables.update(meta.fields_map[field].through for field in meta.m2m_fields)  # type: ignore
+    return tables
+
+
+class ResultCache:
+    """
+    Cache of query results, tagged with the tables they were read from.
+
+    Results of querysets marked with ``QuerySet.cache()`` are pickled in the backend along
+    with the version of every table they were read from, and every write made through the ORM
+    to a table bumps its version, so that the results read from it are no longer served.
+    Versions are kept per process, writes made by raw SQL or by other processes are only seen
+    once the ``ttl`` of the results expires.
+
+    :param max_entries: Max number of results kept by the default in-memory backend.
+    :param backend: The cache backend to use instead of a :class:`MemoryCache`.
+
+    .. attribute:: hits
+
+        Number of queries served from the cache
+
+    .. attribute:: misses
+
+        Number of cached queries that had to be executed
+
+    .. attribute:: invalidations
+
+        Number of writes that invalidated the results read from their tables
+    """
+
+    namespace = "results"
+
+    def __init__(self, max_entries: int = 1000, backend: CacheBackend | None = None) -> None:
+        self.backend = backend or MemoryCache(max_entries)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._versions: dict[str, int] = {}
+
+    def _is_current(self, versions: tuple[tuple[str, int], ...]) -> bool:
+        return all(self._versions.get(table, 0) == version for table, version in versions)
+
+    async def get(self, key: str) -> Any:
+        """
+        Returns the cached result of the query with the key, ``EMPTY`` if not cached or stale.
+        """
+        entry = await self.backend.get(self.namespace, key)
+        if entry is None or not self._is_current(entry[0]):
+            self.misses += 1
+            return EMPTY
+        self.hits += 1
+        return pickle.loads(entry[1])  # nosec
+
+    def versions(self, tables: Iterable[str]) -> tuple[tuple[str, int], ...]:
+        """
+        Returns the current versions of the tables, to be taken before the query reading from
+        them is executed and passed to :meth:`set`.
+        """
+        return tuple((table, self._versions.get(table, 0)) for table in sorted(tables))
+
+    async def set(
+        self, key: str, versions: tuple[tuple[str, int], ...], result: Any, ttl: float | None
+    ) -> None:
+        """
+        Caches the result of the query with the key, read from tables at the versions
+        returned by :meth:`versions` before it was executed, so that a write made while it
+        ran leaves it stale.
+        """
+        try:
+            data = pickle.dumps(result)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # e.g. objects of models defined in functions
+            return
+        await self.backend.set(self.namespace, key, (versions, data), ttl)
+
+    def invalidate(self, *tables: str, using_db: BaseDBAsyncClient | None = None) -> None:
+        """
+        Invalidates the cached results read from the tables.
+
+        :param using_db: The client that wrote to the tables. If it is a transaction, the
+            versions of the tables are bumped again when it ends.
+        """
+        self._bump(tables)
+
+        async def bump() -> None:
+            self._bump(tables)
+
+        _on_transaction_end(using_db, bump)
+
+    def _bump(self, tables: Iterable[str]) -> None:
+        for table in tables:
+            self._versions[table] = self._versions.get(table, 0) + 1
+        self.invalidations += 1
+
+    async def clear(self) -> None:
+        """
+        Drops all the cached results.
+        """
+        await self.backend.clear(self.namespace)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns the hit, miss and invalidation counters, with ``hit_rate`` the share of the
+        queries served from the cache.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+
+#: Marks a result missing from the cache, as ``None`` can be cached
+EMPTY = object()
+
+#: The global query result cache
+RESULT_CACHE = ResultCache()
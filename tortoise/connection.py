@@ -3,6 +3,8 @@ from __future__ import annotations
 import asyncio
 import contextvars
 import importlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from contextvars import ContextVar
 from copy import copy
 from typing import TYPE_CHECKING, Any
@@ -184,6 +186,36 @@ class ConnectionHandler:
         # appear in the returned list though it exists as part of the `db_config`.
         return [self.get(alias) for alias in self.db_config]
 
+    @asynccontextmanager
+    async def pinned(self) -> AsyncIterator[None]:
+        """
+        Pins a connection of the pool of each alias for the queries of the block.
+
+        The connection is acquired on the first query of the block and reused by the next
+        ones without opening a transaction, then returned to the pool when the block exits.
+        Clients without a pool and transactions are left as is.
+
+        .. code-block:: python3
+
+            async with connections.pinned():
+                user = await User.get(pk=1)
+                await user.fetch_related("groups")
+        """
+        tokens: list[contextvars.Token] = []
+        pinned: list[BaseDBAsyncClient] = []
+        try:
+            for alias in self.db_config:
+                client = self.get(alias)._pinned()
+                if client is not None:
+                    tokens.append(self.set(alias, client))
+                    pinned.append(client)
+            yield
+        finally:
+            for token in reversed(tokens):
+                self.reset(token)
+            for client in pinned:
+                await client._pool.unpin()
+
     async def close_all(self, discard: bool = True) -> None:
         """
         Closes all connections in the storage in the `current context`.
@@ -193,6 +225,10 @@ class ConnectionHandler:
         :param discard:
             If ``False``, all connection objects are closed but `retained` in the storage.
         """
+        from tortoise.router import router
+
+        # The health checks of the replicas would query the closed connections
+        router.close()
         tasks = [conn.close() for conn in self.all()]
         await asyncio.gather(*tasks)
         if discard:
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Awaitable, Callable, Iterable
 from types import ModuleType
+from typing import cast
 
 from aiohttp import web  # pylint: disable=E0401
 
 from tortoise import Tortoise, connections
 from tortoise.log import logger
 
+_Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+_Middleware = Callable[[web.Request, _Handler], Awaitable[web.StreamResponse]]
+_middleware = cast("Callable[[_Middleware], _Middleware]", web.middleware)
+
 
 def register_tortoise(
     app: web.Application,
@@ -92,3 +97,18 @@ def register_tortoise(
 
     app.on_startup.append(init_orm)
     app.on_cleanup.append(close_orm)
+
+
+@_middleware
+async def pinned_connections(request: web.Request, handler: _Handler) -> web.StreamResponse:
+    """
+    Middleware that runs each request in
+    :meth:`connections.pinned()<tortoise.connection.ConnectionHandler.pinned>`, so the queries
+    of a request share one connection of the pool instead of acquiring one each.
+
+    .. code-block:: python3
+
+        app = web.Application(middlewares=[pinned_connections])
+    """
+    async with connections.pinned():
+        return await handler(request)
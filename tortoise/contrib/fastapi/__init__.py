@@ -8,6 +8,7 @@ from types import ModuleType
 from typing import TYPE_CHECKING
 
 from tortoise import Tortoise, connections
+from tortoise.contrib.starlette import PinnedConnectionsMiddleware  # noqa: F401
 from tortoise.exceptions import DoesNotExist, IntegrityError
 from tortoise.log import logger
 
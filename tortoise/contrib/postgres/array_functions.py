@@ -1,6 +1,10 @@
 from enum import Enum
+from typing import Any
 
-from pypika_tortoise.terms import BasicCriterion, Criterion, Function, Term
+from pypika_tortoise.enums import Equality
+from pypika_tortoise.terms import BasicCriterion, Criterion, Function, Term, ValueWrapper
+
+from tortoise.filters import is_in, is_large_list, not_in
 
 
 class PostgresArrayOperators(str, Enum):
@@ -29,3 +33,21 @@ def postgres_array_overlap(field: Term, value: Term) -> Criterion:
 def postgres_array_length(field: Term, value: int) -> Criterion:
     """Returns a criterion that checks if array length equals the given value"""
     return Function("array_length", field, 1).eq(value)
+
+
+# Long lists are bound as one array, whose type is inferred from the field by the server:
+# psycopg sends lists of str with an unknown type, and integers are comparable across sizes.
+ANY_TYPES = (int, str)
+
+
+def postgres_is_in(field: Term, value: Any) -> Criterion:
+    if is_large_list(value, ANY_TYPES):
+        return BasicCriterion(Equality.eq, field, Function("ANY", ValueWrapper(list(value))))
+    return is_in(field, value)
+
+
+def postgres_not_in(field: Term, value: Any) -> Criterion:
+    if is_large_list(value, ANY_TYPES):
+        array = Function("ALL", ValueWrapper(list(value)))
+        return BasicCriterion(Equality.ne, field, array) | field.isnull()
+    return not_in(field, value)
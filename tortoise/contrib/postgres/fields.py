@@ -10,6 +10,8 @@ class TSVectorField(Field):
 
 
 class ArrayField(Field, list):  # type: ignore
+    mutable = True
+
     def __init__(self, element_type: str = "int", **kwargs: Any):
         super().__init__(**kwargs)
         self.element_type = element_type.upper()
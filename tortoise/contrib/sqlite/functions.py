@@ -1,4 +1,15 @@
-from pypika_tortoise.terms import Function
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from pypika_tortoise.context import SqlContext
+from pypika_tortoise.dialects import SQLLiteQuery
+from pypika_tortoise.queries import QueryBuilder, Table
+from pypika_tortoise.terms import Criterion, Function, Term, ValueWrapper
+from pypika_tortoise.utils import format_alias_sql
+
+from tortoise.filters import is_in, is_large_list, not_in
 
 
 class Random(Function):
@@ -10,3 +21,39 @@ class Random(Function):
 
     def __init__(self, alias=None) -> None:
         super().__init__("RANDOM", alias=alias)
+
+
+class _JsonEach(Table):
+    """
+    The ``json_each()`` table of a list, bound as a single JSON array parameter.
+    """
+
+    def __init__(self, value: list | tuple) -> None:
+        super().__init__("json_each")
+        self.value = ValueWrapper(json.dumps(list(value)))
+
+    def get_sql(self, ctx: SqlContext) -> str:
+        return format_alias_sql(f"json_each({self.value.get_sql(ctx)})", self.alias, ctx)
+
+
+def _json_each(value: list | tuple) -> QueryBuilder:
+    """
+    Selects the values of a list bound as a single JSON array parameter.
+    """
+    return SQLLiteQuery.from_(_JsonEach(value)).select("value")
+
+
+#: Types of the elements of the long lists bound as a JSON array
+JSON_EACH_TYPES = (int, str)
+
+
+def sqlite_is_in(field: Term, value: Any) -> Criterion:
+    if is_large_list(value, JSON_EACH_TYPES):
+        return field.isin(_json_each(value))
+    return is_in(field, value)
+
+
+def sqlite_not_in(field: Term, value: Any) -> Criterion:
+    if is_large_list(value, JSON_EACH_TYPES):
+        return field.notin(_json_each(value)) | field.isnull()
+    return not_in(field, value)
@@ -4,6 +4,7 @@ from collections.abc import Iterable
 from types import ModuleType
 
 from starlette.applications import Starlette  # pylint: disable=E0401
+from starlette.types import ASGIApp, Receive, Scope, Send  # pylint: disable=E0401
 
 from tortoise import Tortoise, connections
 from tortoise.log import logger
@@ -91,3 +92,26 @@ def register_tortoise(
     async def close_orm() -> None:  # pylint: disable=W0612
         await connections.close_all()
         logger.info("Tortoise-ORM shutdown")
+
+
+class PinnedConnectionsMiddleware:
+    """
+    ASGI middleware that runs each HTTP request in
+    :meth:`connections.pinned()<tortoise.connection.ConnectionHandler.pinned>`, so the queries
+    of a request share one connection of the pool instead of acquiring one each.
+
+    .. code-block:: python3
+
+        app.add_middleware(PinnedConnectionsMiddleware)
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            # Websockets would hold a connection for as long as they are open
+            await self.app(scope, receive, send)
+            return
+        async with connections.pinned():
+            await self.app(scope, receive, send)
@@ -102,6 +102,14 @@ class Field(Generic[VALUE], metaclass=_FieldMeta):
 
         Is this field able to be DB-generated?
 
+    .. attribute:: mutable
+        :annotation: Optional[bool] = None
+
+        Can the Python value of this field be changed in place, like a ``dict``?
+        Changes made this way are found by comparing the value to the one loaded from the DB.
+        ``None`` means only if the field overrides ``to_python_value()``, set it to ``False``
+        for such fields whose values are immutable to skip the comparison.
+
     .. attribute:: function_cast
         :annotation: Optional[pypika_tortoise.Term] = None
 
@@ -144,6 +152,7 @@ class Field(Generic[VALUE], metaclass=_FieldMeta):
     has_db_field: bool = True
     skip_to_python_if_native: bool = False
     allows_generated: bool = False
+    mutable: bool | None = None
     function_cast: Callable[[Term], Term] | None = None
     SQL_TYPE: str = None  # type: ignore
     GENERATED_SQL: str = None  # type: ignore
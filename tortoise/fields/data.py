@@ -277,6 +277,7 @@ class DecimalField(Field[Decimal], Decimal):
     """
 
     skip_to_python_if_native = True
+    mutable = False
 
     def __init__(self, max_digits: int, decimal_places: int, **kwargs: Any) -> None:
         if int(max_digits) < 1:
@@ -327,6 +328,7 @@ class DatetimeField(Field[datetime.datetime], datetime.datetime):
     """
 
     SQL_TYPE = "TIMESTAMP"
+    mutable = False
 
     class _db_mysql:
         SQL_TYPE = "DATETIME(6)"
@@ -404,6 +406,7 @@ class DateField(Field[datetime.date], datetime.date):
     """
 
     skip_to_python_if_native = True
+    mutable = False
     SQL_TYPE = "DATE"
 
     def to_python_value(self, value: Any) -> datetime.date | None:
@@ -426,6 +429,7 @@ class TimeField(Field[datetime.time], datetime.time):
     """
 
     skip_to_python_if_native = True
+    mutable = False
     SQL_TYPE = "TIME"
 
     class _db_oracle:
@@ -488,6 +492,7 @@ class TimeDeltaField(Field[datetime.timedelta]):
     """
 
     field_type = datetime.timedelta
+    mutable = False
     SQL_TYPE = "BIGINT"
 
     class _db_oracle:
@@ -548,6 +553,7 @@ class JSONField(Field[T], dict, list):  # type: ignore
 
     SQL_TYPE = "JSON"
     indexable = False
+    mutable = True
 
     class _db_postgres:
         SQL_TYPE = "JSONB"
@@ -632,6 +638,7 @@ class UUIDField(Field[UUID], UUID):
     """
 
     SQL_TYPE = "CHAR(36)"
+    mutable = False
 
     class _db_postgres:
         SQL_TYPE = "UUID"
@@ -672,6 +679,8 @@ class BinaryField(Field[bytes], bytes):  # type: ignore
 
 
 class IntEnumFieldInstance(SmallIntField):
+    mutable = False
+
     def __init__(
         self,
         enum_type: type[IntEnum],
@@ -740,6 +749,8 @@ def IntEnumField(
 
 
 class CharEnumFieldInstance(CharField):
+    mutable = False
+
     def __init__(
         self,
         enum_type: type[Enum],
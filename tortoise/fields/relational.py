@@ -14,6 +14,7 @@ from typing import (
 
 from pypika_tortoise import Table
 
+from tortoise.cache import RESULT_CACHE
 from tortoise.exceptions import ConfigurationError, NoValuesFetched, OperationalError
 from tortoise.fields.base import CASCADE, SET_NULL, Field, OnDelete
 
@@ -49,11 +50,13 @@ class ReverseRelation(Generic[MODEL]):
         relation_field: str,
         instance: Model,
         from_field: str,
+        field_name: str | None = None,
     ) -> None:
         self.remote_model = remote_model
         self.relation_field = relation_field
         self.instance = instance
         self.from_field = from_field
+        self.field_name = field_name
         self._fetched = False
         self._custom_query = False
         self.related_objects: list[MODEL] = []
@@ -89,14 +92,24 @@ class ReverseRelation(Generic[MODEL]):
         return self.related_objects[item]
 
     def __await__(self) -> Generator[Any, None, list[MODEL]]:
+        if self.instance._siblings is not None and self.field_name:
+            return self._load_with_siblings().__await__()
         return self._query.__await__()
 
     async def __aiter__(self) -> AsyncGenerator[Any, MODEL]:
         if not self._fetched:
-            self._set_result_for_query(await self)
+            if self.instance._siblings is not None and self.field_name:
+                await self._load_with_siblings()
+            else:
+                self._set_result_for_query(await self)
         for val in self.related_objects:
             yield val
 
+    async def _load_with_siblings(self) -> list[MODEL]:
+        if not self._fetched:
+            await self.instance._siblings.prefetch(self.field_name, self.instance)  # type: ignore
+        return list(self.related_objects)
+
     def filter(self, *args: Q, **kwargs: Any) -> QuerySet[MODEL]:
         """
         Returns a QuerySet with related elements filtered by args/kwargs.
@@ -146,7 +159,13 @@ class ManyToManyRelation(ReverseRelation[MODEL]):
     """
 
     def __init__(self, instance: Model, m2m_field: ManyToManyFieldInstance[MODEL]) -> None:
-        super().__init__(m2m_field.related_model, m2m_field.related_name, instance, "pk")
+        super().__init__(
+            m2m_field.related_model,
+            m2m_field.related_name,
+            instance,
+            "pk",
+            field_name=m2m_field.model_field_name,
+        )
         self.field = m2m_field
         self.instance = instance
 
@@ -194,6 +213,7 @@ class ManyToManyRelation(ReverseRelation[MODEL]):
             for pk_f in pks_f_to_insert:
                 query = query.insert(pk_f, pk_b)
             await db.execute_query(*query.get_parameterized_sql())
+            RESULT_CACHE.invalidate(self.field.through, using_db=db)
 
     async def clear(self, using_db: BaseDBAsyncClient | None = None) -> None:
         """
@@ -235,6 +255,7 @@ class ManyToManyRelation(ReverseRelation[MODEL]):
                 )
         query = db.query_class.from_(through_table).where(condition).delete()
         await db.execute_query(*query.get_parameterized_sql())
+        RESULT_CACHE.invalidate(self.field.through, using_db=db)
 
 
 class RelationalField(Field[MODEL]):
@@ -95,6 +95,22 @@ def array_encoder(value: Any | Sequence[Any], instance: Model, field: Field) ->
 ##############################################################################
 
 
+#: ``__in`` lists longer than this are bound as a single parameter by the dialects that can,
+#: which keeps the statement the same for any length and under the bind parameters limit
+LARGE_IN_LIST = 64
+
+
+def is_large_list(value: Any, types: tuple[type, ...]) -> bool:
+    """
+    Returns whether ``value`` is a list longer than ``LARGE_IN_LIST`` whose elements are all
+    of the same type, one of ``types``.
+    """
+    if not isinstance(value, (list, tuple)) or len(value) <= LARGE_IN_LIST:
+        return False
+    value_types = {type(element) for element in value}
+    return len(value_types) == 1 and value_types.pop() in types
+
+
 def is_in(field: Term, value: Any) -> Criterion:
     if value:
         return field.isin(value)
@@ -0,0 +1,138 @@
+"""
+Identity map of model instances, SQLAlchemy session style.
+
+Inside :func:`session`, every row is represented by a single instance: querysets, prefetches
+and ``select_related()`` return the instance already loaded in the session for a primary key
+instead of building a new one, so that changes made to it are seen through every path it is
+reached by, and objects shared by many others (e.g. tags of posts) are only built once.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+from weakref import WeakValueDictionary
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.models import Model
+
+_current_session: ContextVar[Session | None] = ContextVar("_current_session", default=None)
+
+
+class Session:
+    """
+    Maps ``(model, pk)`` to the instance loaded for it in the session.
+
+    Instances are referenced weakly, so the ones the application dropped are not kept alive.
+    Partial instances, fetched with ``.only()``, are never mapped.
+
+    .. attribute:: reused
+
+        Number of rows that were returned as the instance already in the session
+    """
+
+    def __init__(self) -> None:
+        self._identities: WeakValueDictionary[tuple[type[Model], Any], Model] = (
+            WeakValueDictionary()
+        )
+        self.reused = 0
+
+    def get(self, model: type[Model], pk: Any) -> Model | None:
+        """
+        Returns the instance of ``model`` with the primary key in the session, if any.
+        """
+        return self._identities.get((model, pk))
+
+    def merge(self, instance: Model, populate: bool = False) -> Model:
+        """
+        Returns the instance already in the session for the row of ``instance``, or adds
+        ``instance`` to the session and returns it.
+
+        :param populate: Overwrite the fields of the instance in the session with the values
+            of ``instance``, discarding its changes not saved yet. Otherwise it's kept as is.
+        """
+        if instance._partial:
+            return instance
+        key = (type(instance), instance.pk)
+        existing = self._identities.get(key)
+        if existing is None:
+            self._identities[key] = instance
+            return instance
+        if existing is not instance:
+            self.reused += 1
+            if populate:
+                existing._populate_from(instance)
+        return existing
+
+    def add(self, instance: Model) -> None:
+        """
+        Adds the instance to the session, replacing the one mapped to its row if any.
+        """
+        if not instance._partial:
+            self._identities[(type(instance), instance.pk)] = instance
+
+    def discard(self, instance: Model) -> None:
+        """
+        Removes the instance from the session.
+        """
+        key = (type(instance), instance.pk)
+        if self._identities.get(key) is instance:
+            del self._identities[key]
+
+    def clear(self) -> None:
+        """
+        Removes all the instances from the session, the next queries build new ones.
+        """
+        self._identities.clear()
+
+    def __len__(self) -> int:
+        return len(self._identities)
+
+
+def current_session() -> Session | None:
+    """
+    Returns the session of the current context, if any.
+    """
+    return _current_session.get()
+
+
+@contextmanager
+def outside_session() -> Iterator[None]:
+    """
+    Builds new instances for the rows loaded within the block, even inside a session.
+    """
+    token = _current_session.set(None)
+    try:
+        yield
+    finally:
+        _current_session.reset(token)
+
+
+@contextmanager
+def session() -> Iterator[Session]:
+    """
+    Keeps an identity map of the instances loaded within the block, so that a row loaded
+    twice, by two queries or two prefetch paths, is the same instance.
+
+    .. code-block:: python3
+
+        with tortoise.session():
+            posts = await Post.all().prefetch_related("tags")
+            # One instance per tag, however many posts it is on
+            tag = await Tag.get(pk=posts[0].tags[0].pk)
+            assert tag is posts[0].tags[0]
+
+    Objects created within the block are added to the session as well. Instances already in
+    the session are not refreshed by later queries, except by querysets with
+    ``select_for_update()`` or ``populate_existing()``, which overwrite them with the rows
+    they fetch. ``refresh_from_db()`` refreshes a single one.
+    Tasks started within the block share the session.
+    """
+    current = Session()
+    token = _current_session.set(current)
+    try:
+        yield current
+    finally:
+        _current_session.reset(token)
@@ -0,0 +1,153 @@
+"""
+Batch loading of model instances, DataLoader style.
+
+Inside :func:`batch_loading`, the lookups of related objects (``await event.tournament``)
+and the ``Model.get(pk=...)`` calls made in the same event loop tick, e.g. by concurrent
+GraphQL resolvers, are coalesced into one ``WHERE ... IN (...)`` query per model.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.backends.base.client import BaseDBAsyncClient
+    from tortoise.models import Model
+
+_LoadKey = tuple["type[Model]", str, "BaseDBAsyncClient"]
+
+_current_loader: ContextVar[BatchLoader | None] = ContextVar("_current_loader", default=None)
+
+
+class BatchLoader:
+    """
+    Coalesces the lookups of model instances by a unique field made in the same event loop
+    tick into one query per model, field and connection.
+
+    :param cache: Keep the loaded instances for the lifetime of the loader,
+        so that looking up the same value again doesn't query the DB.
+
+    .. attribute:: lookups
+
+        Number of instances looked up
+
+    .. attribute:: queries
+
+        Number of queries run to load them
+
+    .. attribute:: cache_hits
+
+        Number of lookups answered from the cache
+    """
+
+    def __init__(self, cache: bool = True) -> None:
+        self.cache = cache
+        self._pending: dict[_LoadKey, dict[Any, asyncio.Future]] = {}
+        self._loaded: dict[_LoadKey, dict[Any, Model]] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.lookups = 0
+        self.queries = 0
+        self.cache_hits = 0
+
+    def load(
+        self, model: type[Model], field: str, value: Any, db: BaseDBAsyncClient | None = None
+    ) -> asyncio.Future:
+        """
+        Returns a future of the instance of ``model`` whose ``field`` is ``value``,
+        or ``None`` if there is none.
+
+        :param db: The client to query, the one of the model by default.
+        """
+        key = (model, field, db or model._choose_db())
+        # Instances are found by the values of the DB, e.g. 5 for a pk looked up as "5"
+        value = model._meta.fields_map[field].to_python_value(value)
+        loop = asyncio.get_running_loop()
+        self.lookups += 1
+        loaded = self._loaded.get(key)
+        if loaded is not None and value in loaded:
+            self.cache_hits += 1
+            result = loop.create_future()
+            result.set_result(loaded[value])
+            return result
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = {}
+            # Runs once the tasks that are ready now had their turn to add their lookups
+            loop.call_soon(self._dispatch, key)
+        if value not in pending:
+            pending[value] = loop.create_future()
+        # The lookup is shared, so it must not be cancelled with one of its waiters
+        return asyncio.shield(pending[value])
+
+    def clear(self) -> None:
+        """
+        Drops the cached instances.
+        """
+        self._loaded.clear()
+
+    def _dispatch(self, key: _LoadKey) -> None:
+        task = asyncio.ensure_future(self._fetch(key, self._pending.pop(key)))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _fetch(self, key: _LoadKey, pending: dict[Any, asyncio.Future]) -> None:
+        model, field, db = key
+        values = list(pending)
+        batch_size = db.capabilities.max_query_params
+        found: dict[Any, Model] = {}
+        try:
+            for start in range(0, len(values), batch_size):
+                self.queries += 1
+                batch = values[start : start + batch_size]
+                for instance in await model._db_queryset(db).filter(**{f"{field}__in": batch}):
+                    found[getattr(instance, field)] = instance
+        except Exception as exc:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        if self.cache:
+            self._loaded.setdefault(key, {}).update(found)
+        for value, future in pending.items():
+            if not future.done():
+                future.set_result(found.get(value))
+
+
+def current_loader() -> BatchLoader | None:
+    """
+    Returns the batch loader of the current context, if any.
+    """
+    return _current_loader.get()
+
+
+@contextmanager
+def batch_loading(cache: bool = True) -> Iterator[BatchLoader]:
+    """
+    Coalesces the lookups of related objects and the ``Model.get(pk=...)`` calls made
+    concurrently within the block into one query per model.
+
+    .. code-block:: python3
+
+        with batch_loading() as loader:
+            events = await Event.all()
+            tournaments = await asyncio.gather(*(event.tournament for event in events))
+
+    The loaded related objects are also set on the instances, so they can be accessed
+    without awaiting afterwards.
+    ``get(pk=...)`` and ``get_or_none(pk=...)`` are coalesced unless other queryset methods
+    that change the fetched objects, like ``.only()`` or ``.prefetch_related()``, are
+    chained to them.
+
+    :param cache: Keep the loaded instances for the whole block, so that looking up the
+        same object again doesn't query the DB.
+    """
+    loader = BatchLoader(cache)
+    token = _current_loader.set(loader)
+    try:
+        yield loader
+    finally:
+        _current_loader.reset(token)
@@ -2,3 +2,4 @@ import logging
 
 logger = logging.getLogger("tortoise")
 db_client_logger = logging.getLogger("tortoise.db_client")
+slow_query_logger = logging.getLogger("tortoise.slow_query")
@@ -3,17 +3,19 @@ from __future__ import annotations
 import asyncio
 import inspect
 import re
-from collections.abc import Awaitable, Callable, Generator, Iterable
+from collections.abc import Awaitable, Callable, Generator, Iterable, Sequence
 from copy import copy, deepcopy
 from functools import partial
 from typing import Any, TypedDict, TypeVar, cast
 
 from pypika_tortoise import Order, Query, Table
 from pypika_tortoise.terms import Term
-from typing_extensions import Self
+from typing_extensions import Literal, Self
 
 from tortoise import connections
+from tortoise.auto_prefetch import SiblingGroup
 from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.cache import CacheConfig, ModelCache, invalidate_related
 from tortoise.exceptions import (
     ConfigurationError,
     DoesNotExist,
@@ -39,8 +41,11 @@ from tortoise.fields.relational import (
     ReverseRelation,
 )
 from tortoise.filters import FilterInfoDict, get_filters_for_field
+from tortoise.identity import current_session, outside_session
 from tortoise.indexes import Index
+from tortoise.loader import current_loader
 from tortoise.manager import Manager
+from tortoise.profiling import phase
 from tortoise.queryset import (
     BulkCreateQuery,
     BulkUpdateQuery,
@@ -56,6 +61,8 @@ from tortoise.transactions import in_transaction
 
 MODEL = TypeVar("MODEL", bound="Model")
 EMPTY = object()
+# Values that can be shared with the ones loaded from the DB, as they can't change in place
+_IMMUTABLE_TYPES = (type(None), str, bytes, int, float)
 
 
 def get_together(meta: Model.Meta, together: str) -> tuple[tuple[str, ...], ...]:
@@ -99,12 +106,32 @@ def _fk_getter(
     self: Model, _key: str, ftype: type[Model], relation_field: str, to_field: str
 ) -> Awaitable:
     try:
-        return getattr(self, _key)
+        related = getattr(self, _key)
     except AttributeError:
         value = getattr(self, relation_field)
         if value is not None:
+            if self._siblings is not None:
+                return self._siblings.load(self, _key[1:])
+            loader = current_loader()
+            if loader is not None:
+                return _set_when_loaded(self, _key, loader.load(ftype, to_field, value))
             return ftype.filter(**{to_field: value}).first()
         return NoneAwaitable
+    if self._siblings is not None:
+        self._siblings.read(self, _key[1:])
+    return related
+
+
+def _set_when_loaded(self: Model, _key: str, future: asyncio.Future) -> asyncio.Future:
+    def set_related(future: asyncio.Future) -> None:
+        if not future.cancelled() and future.exception() is None and future.result() is not None:
+            setattr(self, _key, future.result())
+
+    if future.done():
+        set_related(future)
+    else:
+        future.add_done_callback(set_related)
+    return future
 
 
 def _rfk_getter(
@@ -112,8 +139,10 @@ def _rfk_getter(
 ) -> ReverseRelation:
     val = getattr(self, _key, None)
     if val is None:
-        val = ReverseRelation(ftype, frelfield, self, from_field)
+        val = ReverseRelation(ftype, frelfield, self, from_field, field_name=_key[1:])
         setattr(self, _key, val)
+    elif self._siblings is not None:
+        self._siblings.read(self, _key[1:])
     return val
 
 
@@ -121,7 +150,11 @@ def _ro2o_getter(
     self: Model, _key: str, ftype: type[Model], frelfield: str, from_field: str
 ) -> QuerySetSingle[Model | None]:
     if hasattr(self, _key):
+        if self._siblings is not None:
+            self._siblings.read(self, _key[1:])
         return getattr(self, _key)
+    if self._siblings is not None:
+        return self._siblings.load(self, _key[1:])  # type: ignore
 
     val = ftype.filter(**{frelfield: getattr(self, from_field)}).first()
     setattr(self, _key, val)
@@ -135,6 +168,8 @@ def _m2m_getter(
     if val is None:
         val = ManyToManyRelation(self, field_object)
         setattr(self, _key, val)
+    elif self._siblings is not None:
+        self._siblings.read(self, _key[1:])
     return val
 
 
@@ -205,8 +240,13 @@ class MetaInfo:
         "db_native_fields",
         "db_default_fields",
         "db_complex_fields",
+        "mutable_fields",
+        "auto_now_fields",
+        "unique_keys",
         "_default_ordering",
         "_ordering_validated",
+        "_hydrators",
+        "cache",
     )
 
     def __init__(self, meta: Model.Meta) -> None:
@@ -246,6 +286,16 @@ class MetaInfo:
         self.db_native_fields: list[tuple[str, str, Field]] = []
         self.db_default_fields: list[tuple[str, str, Field]] = []
         self.db_complex_fields: list[tuple[str, str, Field]] = []
+        self.mutable_fields: list[tuple[str, str, Field]] = []
+        self.auto_now_fields: list[str] = []
+        self.unique_keys: list[frozenset[str]] = []
+        self._hydrators: dict[tuple[tuple[str, ...], int], Callable[[Sequence], Model]] = {}
+        cache_config = getattr(meta, "cache", None)
+        if cache_config is not None and not isinstance(cache_config, CacheConfig):
+            raise ConfigurationError("Meta.cache must be a CacheConfig")
+        self.cache: ModelCache | None = (
+            ModelCache(self, cache_config) if cache_config is not None else None
+        )
 
     @property
     def full_name(self) -> str:
@@ -445,9 +495,12 @@ class MetaInfo:
             )
 
     def _generate_db_fields(self) -> None:
+        self._hydrators.clear()
         self.db_default_fields.clear()
         self.db_complex_fields.clear()
         self.db_native_fields.clear()
+        self.mutable_fields.clear()
+        self.auto_now_fields.clear()
 
         for key in self.db_fields:
             model_field = self.fields_db_projection_reverse[key]
@@ -462,6 +515,126 @@ class MetaInfo:
                 self.db_default_fields.append((key, model_field, field))
             else:
                 self.db_complex_fields.append((key, model_field, field))
+            # Values built by a custom to_python_value() may be changed in place
+            if field.mutable or (field.mutable is None and not default_converter):
+                self.mutable_fields.append((key, model_field, field))
+            if getattr(field, "auto_now", False):
+                self.auto_now_fields.append(model_field)
+
+        # The sets of fields the DB finds conflicting rows on
+        self.unique_keys.clear()
+        relations = self.fk_fields | self.o2o_fields
+        for model_field, field in self.fields_map.items():
+            if not field.unique:
+                continue
+            if model_field in relations:
+                self.unique_keys.append(frozenset((cast(str, field.source_field),)))
+            elif model_field in self.fields_db_projection:
+                self.unique_keys.append(frozenset((model_field,)))
+        for together in self.unique_together:
+            self.unique_keys.append(
+                frozenset(
+                    cast(str, self.fields_map[name].source_field) if name in relations else name
+                    for name in together
+                )
+            )
+
+    def hydrator(self, keys: tuple[str, ...], offset: int = 0) -> Callable[[Sequence], Model]:
+        """
+        Returns a function that builds a model instance from the values of a DB row.
+
+        The function is compiled once per column layout, so the column positions and the
+        converters of the fields are resolved once instead of for every row.
+
+        :param keys: Names of the columns of the model in the row.
+        :param offset: Position of the first of these columns in the row.
+        """
+        try:
+            return self._hydrators[(keys, offset)]
+        except KeyError:
+            hydrator = self._hydrators[(keys, offset)] = self._compile_hydrator(keys, offset)
+            return hydrator
+
+    def _compile_hydrator(self, keys: tuple[str, ...], offset: int) -> Callable[[Sequence], Model]:
+        # Resolves the same conversions as Model._init_from_db() used to do for every row
+        positions = {key: offset + i for i, key in enumerate(keys)}
+        native: list[tuple[int, str, Field]] = []
+        default: list[tuple[int, str, Field]] = []
+        complex_: list[tuple[int, str, Field]] = []
+        partial = False
+        inited_keys: set[str] = set()
+        for fields, target in (
+            (self.db_native_fields, native),
+            (self.db_default_fields, default),
+            (self.db_complex_fields, complex_),
+        ):
+            for key, model_field, field in fields:
+                if key not in positions:
+                    partial = True
+                    break
+                target.append((positions[key], model_field, field))
+                inited_keys.add(key)
+            if partial:
+                break
+        if partial:
+            native_fields = [f for *_, f in self.db_native_fields]
+            default_fields = [f for *_, f in self.db_default_fields]
+            for key, position in positions.items():
+                if key in inited_keys or key not in self.fields_map:
+                    continue
+                field = self.fields_map[key]
+                if field in native_fields:
+                    native.append((position, key, field))
+                elif field in default_fields:
+                    default.append((position, key, field))
+                else:
+                    complex_.append((position, key, field))
+
+        model = self._model
+        custom_generated_pk = self.db_pk_column not in self.generated_db_fields
+        native_fields_ = tuple((position, attr) for position, attr, _ in native)
+        default_fields_ = tuple(
+            (position, attr, field.field_type) for position, attr, field in default
+        )
+        complex_fields_ = tuple(
+            (position, attr, field.to_python_value) for position, attr, field in complex_
+        )
+        # The DB values of mutable fields are kept to find the changes made to them in place
+        mutable_fields = {model_field for _, model_field, _ in self.mutable_fields}
+        loaded_fields_ = tuple(
+            (position, attr)
+            for position, attr, _ in native + default + complex_
+            if attr in mutable_fields
+        )
+        if any(
+            isinstance(getattr(model, attr, None), property)
+            for _, attr, _ in native + default + complex_
+        ):
+            # Properties can't be set through __dict__
+            def init_from_db(values: Sequence) -> Model:
+                return model._init_from_db(**{key: values[pos] for key, pos in positions.items()})
+
+            return init_from_db
+
+        def hydrate(values: Sequence) -> Model:
+            instance = model.__new__(model)
+            attrs = instance.__dict__
+            attrs["_partial"] = partial
+            attrs["_saved_in_db"] = True
+            attrs["_custom_generated_pk"] = custom_generated_pk
+            attrs["_await_when_save"] = {}
+            for position, attr in native_fields_:
+                attrs[attr] = values[position]
+            for position, attr, field_type in default_fields_:
+                value = values[position]
+                attrs[attr] = None if value is None else field_type(value)
+            for position, attr, to_python_value in complex_fields_:
+                attrs[attr] = to_python_value(values[position])
+            if loaded_fields_:
+                attrs["_loaded"] = {attr: values[position] for position, attr in loaded_fields_}
+            return instance
+
+        return hydrate
 
     def _generate_filters(self) -> None:
         get_overridden_filter_func = self.db.executor_class.get_overridden_filter_func
@@ -685,6 +858,8 @@ class Model(metaclass=ModelMeta):
         Signals.pre_delete: {},
         Signals.post_delete: {},
     }
+    #: The objects fetched by the same query, when auto prefetching their relations
+    _siblings: SiblingGroup | None = None
 
     def __init__(self, **kwargs: Any) -> None:
         # self._meta is a very common attribute lookup, lets cache it.
@@ -711,6 +886,13 @@ class Model(metaclass=ModelMeta):
             self._await_when_save.pop(key, None)
         if key in self._meta.fk_fields or key in self._meta.o2o_fields:
             self._validate_relation_type(key, value)
+        # Fields assigned after the object was loaded or saved are the ones save() updates
+        attrs = self.__dict__
+        if attrs.get("_saved_in_db") and key in self._meta.fields_db_projection:
+            if (changed := attrs.get("_changed")) is None:
+                attrs["_changed"] = {key}
+            else:
+                changed.add(key)
         super().__setattr__(key, value)
 
     def _set_kwargs(self, kwargs: dict) -> set[str]:
@@ -798,6 +980,13 @@ class Model(metaclass=ModelMeta):
                         value = field.to_python_value(value)
                 setattr(self, key, value)
 
+        self.__dict__.pop("_changed", None)
+        if meta.mutable_fields:
+            self._loaded = {
+                model_field: kwargs[key]
+                for key, model_field, _ in meta.mutable_fields
+                if key in kwargs
+            }
         return self
 
     def __str__(self) -> str:
@@ -820,6 +1009,12 @@ class Model(metaclass=ModelMeta):
     def __eq__(self, other: object) -> bool:
         return type(other) is type(self) and self.pk == other.pk  # type: ignore
 
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        # The result set the object was fetched with isn't part of its state
+        state.pop("_siblings", None)
+        return state
+
     def _get_pk_val(self) -> Any:
         return getattr(self, self._meta.pk_attr, None)
 
@@ -832,6 +1027,71 @@ class Model(metaclass=ModelMeta):
     Can be used as a field name when doing filtering e.g. ``.filter(pk=...)`` etc...
     """
 
+    @property
+    def changed_fields(self) -> set[str]:
+        """
+        Names of the fields changed since the object was loaded from or saved to the DB,
+        which are the ones ``save()`` updates. All the fields for an object not saved yet.
+        The primary key is never part of them.
+
+        Fields are changed by assigning them, or in place for mutable values like the ones of
+        a ``JSONField``, which are compared to the value loaded from the DB.
+        """
+        meta = self._meta
+        attrs = self.__dict__
+        if not attrs.get("_saved_in_db"):
+            return {key for key in meta.fields_db_projection if key in attrs} - {meta.pk_attr}
+        changed = set(attrs.get("_changed", ()))
+        loaded = attrs.get("_loaded", {})
+        for _, model_field, field in meta.mutable_fields:
+            if model_field in changed or model_field not in attrs:
+                continue
+            value = attrs[model_field]
+            previous = loaded.get(model_field, EMPTY)
+            # Mutable values the instance shares with the loaded one can't be compared
+            if (
+                previous is EMPTY
+                or (previous is value and not isinstance(value, _IMMUTABLE_TYPES))
+                or field.to_db_value(value, self) != previous
+            ):
+                changed.add(model_field)
+        changed.discard(meta.pk_attr)
+        return changed
+
+    def _reset_changes(self, fields: Iterable[str] | None = None) -> None:
+        # The current values of the fields become the ones changes are found against
+        attrs = self.__dict__
+        if fields is None:
+            attrs.pop("_changed", None)
+        elif (changed := attrs.get("_changed")) is not None:
+            changed.difference_update(fields)
+        mutable_fields = self._meta.mutable_fields
+        if mutable_fields:
+            loaded = attrs.setdefault("_loaded", {})
+            for _, model_field, field in mutable_fields:
+                if model_field not in attrs or (fields is not None and model_field not in fields):
+                    continue
+                if isinstance(value := attrs[model_field], Expression):
+                    loaded.pop(model_field, None)
+                else:
+                    loaded[model_field] = field.to_db_value(value, self)
+
+    def _populate_from(self, other: Model) -> None:
+        # Takes the values of the fields other was loaded with, discarding unsaved changes
+        meta = self._meta
+        attrs, values = self.__dict__, other.__dict__
+        for name in meta.fk_fields | meta.o2o_fields:
+            source_field = cast(str, meta.fields_map[name].source_field)
+            if attrs.get(source_field) != values.get(source_field):
+                # The related object was cached for another row
+                attrs.pop(f"_{name}", None)
+        for key in meta.fields_db_projection:
+            if key in values:
+                attrs[key] = values[key]
+        attrs.pop("_changed", None)
+        if "_loaded" in values:
+            attrs["_loaded"] = dict(values["_loaded"])
+
     @classmethod
     def _validate_relation_type(cls, field_key: str, value: Model | None) -> None:
         if value is None:
@@ -870,6 +1130,9 @@ class Model(metaclass=ModelMeta):
         :raises ParamsError: If pk is required but not provided.
         """
         obj = copy(self)
+        # Changes are tracked per object, the clone starts with its own
+        obj.__dict__.pop("_changed", None)
+        obj.__dict__.pop("_loaded", None)
         if pk is EMPTY:
             pk_field: Field = self._meta.pk
             if pk_field.generated is False and pk_field.default is None:
@@ -964,6 +1227,7 @@ class Model(metaclass=ModelMeta):
 
             This is the subset of fields that should be updated.
             If the object needs to be created ``update_fields`` will be ignored.
+            If not provided, the fields in :attr:`changed_fields` are updated.
         :param using_db: Specific DB connection to use instead of default bound
         :param force_create: Forces creation of the record
         :param force_update: Forces updating of the record
@@ -972,6 +1236,16 @@ class Model(metaclass=ModelMeta):
         :raises IntegrityError: If the model can't be created or updated (specifically if force_create or force_update has been set)
         :raises OperationalError: If update_fields include pk field.
         """
+        with phase(f"{self._meta.full_name}.save"):
+            await self._save(using_db, update_fields, force_create, force_update)
+
+    async def _save(
+        self,
+        using_db: BaseDBAsyncClient | None,
+        update_fields: Iterable[str] | None,
+        force_create: bool,
+        force_update: bool,
+    ) -> None:
         await self._set_async_default_field()
         db = using_db or self._choose_db(True)
         executor = db.executor_class(model=self.__class__, db=db)
@@ -992,6 +1266,8 @@ class Model(metaclass=ModelMeta):
                 )
         await self._pre_save(db, update_fields)
 
+        # Fields written by an update, all of them when None
+        written: Iterable[str] | None = update_fields or None
         if force_create:
             await executor.execute_insert(self)
             created = True
@@ -1005,15 +1281,29 @@ class Model(metaclass=ModelMeta):
                 if self.pk is None:
                     await executor.execute_insert(self)
                     created = True
-                else:
+                elif update_fields:
                     await executor.execute_update(self, update_fields)
                     created = False
+                else:
+                    # Only the changed fields are written, and nothing if none changed.
+                    # Fields with auto_now are always written, saving touches the object
+                    written = self.changed_fields
+                    written.update(self._meta.auto_now_fields)
+                    if written:
+                        # Sorted so that the same changes reuse the same SQL
+                        await executor.execute_update(self, sorted(written))
+                    created = False
             else:
                 # TODO: Do a merge/upsert operation here instead. Let the executor determine an optimal strategy for each DB engine.
                 await executor.execute_insert(self)
                 created = True
 
         self._saved_in_db = True
+        self._reset_changes(None if created else written)
+        if created and (session := current_session()) is not None:
+            session.add(self)
+        if not created and (cache := self._meta.cache) is not None:
+            await cache.invalidate(self.pk, using_db=db)
         await self._post_save(db, created, update_fields)
 
     async def delete(self, using_db: BaseDBAsyncClient | None = None) -> None:
@@ -1029,6 +1319,11 @@ class Model(metaclass=ModelMeta):
             raise OperationalError("Can't delete unpersisted record")
         await self._pre_delete(db)
         await db.executor_class(model=self.__class__, db=db).execute_delete(self)
+        if (session := current_session()) is not None:
+            session.discard(self)
+        if (cache := self._meta.cache) is not None:
+            await cache.invalidate(self.pk, using_db=db)
+        await invalidate_related(self.__class__, db)
         await self._post_delete(db)
 
     async def fetch_related(self, *args: Any, using_db: BaseDBAsyncClient | None = None) -> None:
@@ -1067,10 +1362,12 @@ class Model(metaclass=ModelMeta):
             raise OperationalError("Can't refresh unpersisted record")
         db = using_db or self._choose_db()
         qs = QuerySet(self.__class__).using_db(db).only(*(fields or []))
-        obj = await qs.get(pk=self.pk)
+        with outside_session():
+            obj = await qs.get(pk=self.pk)
 
         for field in fields or self._meta.db_fields:
             setattr(self, field, getattr(obj, field, None))
+        self._reset_changes(fields or None)
 
     @classmethod
     def _choose_db(cls, for_write: bool = False) -> BaseDBAsyncClient:
@@ -1121,6 +1418,12 @@ class Model(metaclass=ModelMeta):
             if (default_value := defaults[key]) != (query_value := kwargs[key]):
                 raise ParamsError(f"Conflict value with {key=}: {default_value=} vs {query_value=}")
         merged_defaults = {**kwargs, **defaults}
+        if (key := cls._upsert_key(db, kwargs)) is not None:
+            # A single INSERT, that skips the row if it was created meanwhile
+            instance, created = await cls._upsert(db, key, merged_defaults, [])
+            if instance is not None:
+                return instance, created
+            return await cls.filter(**kwargs).using_db(db).get(), False
         try:
             async with in_transaction(connection_name=db.connection_name) as connection:
                 return await cls.create(using_db=connection, **merged_defaults), True
@@ -1131,6 +1434,76 @@ class Model(metaclass=ModelMeta):
                 pass
             raise exc
 
+    @classmethod
+    def _upsert_key(cls, db: BaseDBAsyncClient, kwargs: dict) -> tuple[str, ...] | None:
+        """
+        Returns the fields of the query parameters if they are a unique key of the model,
+        which the DB can find the conflicting row on when inserting, ``None`` if they aren't.
+        """
+        meta = cls._meta
+        if not db.capabilities.support_upsert or any(
+            cls._listeners[signal].get(cls) for signal in (Signals.pre_save, Signals.post_save)
+        ):
+            # The listeners need the object that is saved, which isn't known beforehand
+            return None
+        if any(
+            inspect.getattr_static(cls, name) is not inspect.getattr_static(Model, name)
+            for name in ("create", "save", "_pre_save", "_post_save")
+        ):
+            # Overrides would be skipped by the upsert, which doesn't create an object to save
+            return None
+        fields = []
+        for key, value in kwargs.items():
+            if value is None or isinstance(value, Expression):
+                return None
+            if key in meta.fk_fields or key in meta.o2o_fields:
+                key = meta.fields_map[key].source_field
+            elif key not in meta.fields_db_projection:
+                return None
+            fields.append(key)
+        if frozenset(fields) not in meta.unique_keys:
+            return None
+        return tuple(fields)
+
+    @classmethod
+    def _upsert_update_fields(cls, defaults: dict, key: tuple[str, ...]) -> list[str] | None:
+        """
+        Returns the fields an upsert updates with ``defaults``, ``None`` if it can't.
+        """
+        meta = cls._meta
+        fields = set(meta.auto_now_fields)
+        for name, value in defaults.items():
+            if isinstance(value, Expression):
+                return None
+            if name in meta.fk_fields or name in meta.o2o_fields:
+                name = meta.fields_map[name].source_field
+            elif name not in meta.fields_db_projection:
+                return None
+            if name in key or name == meta.pk_attr:
+                return None
+            fields.add(name)
+        return sorted(fields)
+
+    @classmethod
+    async def _upsert(
+        cls, db: BaseDBAsyncClient, key: tuple[str, ...], kwargs: dict, update_fields: list[str]
+    ) -> tuple[Self | None, bool]:
+        """
+        Creates the object, or updates ``update_fields`` of the row with the same ``key``,
+        with a single statement. Returns ``None`` for a row that exists and isn't updated.
+        """
+        instance = cls(**kwargs)
+        await instance._set_async_default_field()
+        executor = db.executor_class(model=cls, db=db)
+        obj, created = await executor.execute_upsert(instance, key, update_fields)
+        if obj is None:
+            return None, False
+        if (session := current_session()) is not None:
+            session.add(obj)
+        if not created and (cache := cls._meta.cache) is not None:
+            await cache.invalidate(obj.pk, using_db=db)
+        return cast(Self, obj), created
+
     @classmethod
     def _db_queryset(
         cls, using_db: BaseDBAsyncClient | None = None, for_write: bool = False
@@ -1171,6 +1544,13 @@ class Model(metaclass=ModelMeta):
         if not defaults:
             defaults = {}
         db = using_db or cls._choose_db(True)
+        if (key := cls._upsert_key(db, kwargs)) is not None and (
+            update_fields := cls._upsert_update_fields(defaults, key)
+        ) is not None:
+            instance, created = await cls._upsert(db, key, {**kwargs, **defaults}, update_fields)
+            if instance is not None:
+                return instance, created
+            return await cls.filter(**kwargs).using_db(db).get(), False
         async with in_transaction(connection_name=db.connection_name) as connection:
             instance = await cls.select_for_update().using_db(connection).get_or_none(**kwargs)
             if instance:
@@ -1228,9 +1608,14 @@ class Model(metaclass=ModelMeta):
 
             await User.bulk_update(users, fields=['name'])
 
+        The objects are joined with a list of their values on the primary key, with
+        ``UPDATE ... FROM (VALUES ...)`` on PostgreSQL and SQLite 3.33+, or a derived table
+        on MySQL. Other DBs update them one by one with a single prepared query.
+
         :param objects: List of objects to bulk create
         :param fields: The fields to update
-        :param batch_size: How many objects are created in a single query
+        :param batch_size: How many objects are updated in a single query,
+            by default as many as the parameters of a query allow
         :param using_db: Specific DB connection to use instead of default bound
         """
         return cls._db_queryset(using_db, for_write=True).bulk_update(objects, fields, batch_size)
@@ -1261,6 +1646,8 @@ class Model(metaclass=ModelMeta):
         update_fields: Iterable[str] | None = None,
         on_conflict: Iterable[str] | None = None,
         using_db: BaseDBAsyncClient | None = None,
+        method: Literal["insert", "copy"] = "insert",
+        return_pks: bool = False,
     ) -> BulkCreateQuery[MODEL]:
         """
         Bulk insert operation:
@@ -1270,7 +1657,10 @@ class Model(metaclass=ModelMeta):
             created in the DB has all the defaults and generated fields set,
             but may be incomplete reference in Python.
 
-            e.g. ``IntField`` primary keys will not be populated.
+            e.g. ``IntField`` primary keys will only be populated on DBs that can return
+            them from a multi-row insert (PostgreSQL, SQLite >= 3.35 and MSSQL), and not when
+            ``ignore_conflicts`` or ``update_fields`` is used. With ``method="copy"`` they
+            are populated only if ``return_pks`` is set.
 
         This is recommended only for throw away inserts where you want to ensure optimal
         insert performance.
@@ -1288,9 +1678,13 @@ class Model(metaclass=ModelMeta):
         :param objects: List of objects to bulk create
         :param batch_size: How many objects are created in a single query
         :param using_db: Specific DB connection to use instead of default bound
+        :param method: ``"insert"`` to run ``INSERT`` statements, or ``"copy"`` to load the
+            objects with ``COPY`` on PostgreSQL, which is much faster for large amounts of rows
+            but can't handle conflicts.
+        :param return_pks: With ``method="copy"``, set the generated primary keys on the objects
         """
         return cls._db_queryset(using_db, for_write=True).bulk_create(
-            objects, batch_size, ignore_conflicts, update_fields, on_conflict
+            objects, batch_size, ignore_conflicts, update_fields, on_conflict, method, return_pks
         )
 
     @classmethod
@@ -0,0 +1,166 @@
+"""
+Profiling of the phases of ORM calls.
+
+Within :func:`profile`, the ORM records how long every phase of the queries takes as a tree:
+building the query, rendering its SQL, acquiring a connection, the round trip to the DB,
+hydrating the objects and prefetching relations, so that the time spent in the ORM can be
+told apart from the time spent in the DB.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Any
+
+_current_node: ContextVar[ProfileNode | None] = ContextVar("_current_node", default=None)
+
+
+class ProfileNode:
+    """
+    A timed phase, with the phases it ran as children.
+    """
+
+    __slots__ = ("name", "start", "duration", "children")
+
+    def __init__(self, name: str, start: float, duration: float | None = None) -> None:
+        self.name = name
+        self.start = start
+        self.duration = duration
+        self.children: list[ProfileNode] = []
+
+    def as_dict(self, origin: float) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "start": self.start - origin,
+            "duration": self.duration,
+            "children": [child.as_dict(origin) for child in self.children],
+        }
+
+    def _folded(self, stack: str, lines: list[str]) -> None:
+        stack = f"{stack};{self.name}" if stack else self.name
+        # Concurrent children, e.g. prefetches, may add up to more than their parent
+        own = (self.duration or 0.0) - sum(child.duration or 0.0 for child in self.children)
+        if own > 0:
+            lines.append(f"{stack} {round(own * 1_000_000)}")
+        for child in self.children:
+            child._folded(stack, lines)
+
+
+class Profile:
+    """
+    The timing tree recorded by :func:`profile`, times are in seconds.
+    """
+
+    def __init__(self, name: str = "profile") -> None:
+        self.root = ProfileNode(name, time.perf_counter())
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Returns the timing tree, with the start of every phase relative to the profile start.
+        """
+        return self.root.as_dict(self.root.start)
+
+    def to_json(self, **kwargs: Any) -> str:
+        """
+        Returns the timing tree as JSON, ``kwargs`` are passed to :func:`json.dumps`.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def folded(self) -> str:
+        """
+        Returns the phases as folded stacks, one ``phase;subphase;... microseconds`` line per
+        phase with its own time, the input format of ``flamegraph.pl`` and speedscope.
+        """
+        lines: list[str] = []
+        self.root._folded("", lines)
+        return "\n".join(lines)
+
+
+class _Phase:
+    __slots__ = ("name", "node", "token")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __enter__(self) -> None:
+        parent = _current_node.get()
+        if parent is None:
+            self.node = None
+            return
+        self.node = ProfileNode(self.name, time.perf_counter())
+        parent.children.append(self.node)
+        self.token: Token = _current_node.set(self.node)
+
+    def __exit__(self, *args: Any) -> None:
+        if self.node is not None:
+            self.node.duration = time.perf_counter() - self.node.start
+            _current_node.reset(self.token)
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+
+_NO_PHASE = _NoPhase()
+
+
+def profiling() -> bool:
+    """
+    Returns if a profile is being recorded in the current context.
+    """
+    return _current_node.get() is not None
+
+
+def phase(name: str) -> _Phase | _NoPhase:
+    """
+    Returns a context manager recording the time spent in the block as the phase ``name``,
+    which does nothing when no profile is being recorded.
+    """
+    if _current_node.get() is None:
+        return _NO_PHASE
+    return _Phase(name)
+
+
+def record_phase(name: str, duration: float) -> None:
+    """
+    Records the phase ``name`` that just ended after ``duration`` seconds, if profiling.
+    """
+    parent = _current_node.get()
+    if parent is not None:
+        parent.children.append(ProfileNode(name, time.perf_counter() - duration, duration))
+
+
+@contextmanager
+def profile(name: str = "profile") -> Iterator[Profile]:
+    """
+    Records a timing tree of the phases of the ORM calls made within the block.
+
+    .. code-block:: python3
+
+        with tortoise.profile() as prof:
+            await Event.filter(name__startswith="FIFA").prefetch_related("tournament")
+
+        print(prof.to_json(indent=2))
+        Path("events.folded").write_text(prof.folded())
+
+    Tasks started within the block are profiled as well.
+
+    :param name: Name of the root of the tree.
+    """
+    prof = Profile(name)
+    token = _current_node.set(prof.root)
+    try:
+        yield prof
+    finally:
+        prof.root.duration = time.perf_counter() - prof.root.start
+        _current_node.reset(token)
@@ -0,0 +1,272 @@
+"""
+Cache of compiled SELECT queries, keyed by the shape of the QuerySet.
+
+Building a query resolves the filters, joins and orderings of the QuerySet into a pypika
+query and then renders it to SQL, which is a large part of the cost of simple queries.
+Querysets that only differ in their filter values produce the same SQL with different
+parameters, so the SQL is compiled once per *shape* and the parameters are then extracted
+straight from the filter values.
+
+Only querysets whose parameters can be extracted exactly are cached: plain field lookups
+(``=``, ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``__in``, ``__not_in``, ``__range`` and
+``__isnull``), on the model or on related models, combined with ``Q`` objects, ordering,
+``.only()``, ``.select_related()``, ``.limit()`` and ``.offset()``.
+Anything else, e.g. annotations or expressions as filter values, is compiled every time.
+"""
+
+from __future__ import annotations
+
+import operator
+from collections import OrderedDict
+from collections.abc import Hashable
+from enum import Enum
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
+
+from pypika_tortoise.terms import Term
+
+from tortoise.expressions import Expression, Q
+from tortoise.fields.relational import RelationalField
+from tortoise.filters import (
+    LARGE_IN_LIST,
+    between_and,
+    is_in,
+    is_null,
+    not_equal,
+    not_in,
+    not_null,
+)
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.models import Model
+    from tortoise.queryset import QuerySet
+
+#: Lookups that bind their (encoded) value as parameter(s) without changing the SQL
+_SCALAR_OPERATORS = {operator.eq, operator.ge, operator.le, operator.gt, operator.lt, not_equal}
+_LIST_OPERATORS = {is_in, not_in}
+
+
+class CompiledQuery(NamedTuple):
+    sql: str
+    select_related_idx: list
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+class QueryCache:
+    """
+    LRU cache of compiled queries, keyed by the shape of the QuerySet.
+
+    A ``max_size`` of ``0`` disables the cache.
+
+    :param max_size: Max number of compiled queries kept.
+
+    .. attribute:: hits
+
+        Number of queries served from the cache
+
+    .. attribute:: misses
+
+        Number of cacheable queries that had to be compiled
+
+    .. attribute:: evictions
+
+        Number of queries dropped because the cache was full
+
+    .. attribute:: uncacheable
+
+        Number of queries that can't be cached, e.g. because they are annotated
+    """
+
+    def __init__(self, max_size: int = 1000) -> None:
+        self.max_size = max_size
+        self._queries: OrderedDict[Hashable, CompiledQuery | None] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.uncacheable = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0
+
+    def get(self, key: Hashable) -> CompiledQuery | None:
+        """
+        Returns the compiled query for the shape, or ``None`` if it has to be compiled.
+        """
+        if key in self._queries:
+            compiled = self._queries[key]
+            self._queries.move_to_end(key)
+            if compiled is None:
+                self.uncacheable += 1
+            else:
+                self.hits += 1
+            return compiled
+        self.misses += 1
+        return None
+
+    def put(self, key: Hashable, compiled: CompiledQuery | None) -> None:
+        """
+        Stores the compiled query for the shape, ``None`` marks the shape as uncacheable.
+        """
+        self._queries[key] = compiled
+        self._queries.move_to_end(key)
+        while len(self._queries) > self.max_size:
+            self._queries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Drops all compiled queries, e.g. after the models have been re-initialised.
+        """
+        self._queries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns the size and counters of the cache, with ``hit_rate`` the share of
+        cacheable queries served from the cache.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._queries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "uncacheable": self.uncacheable,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def reset_stats(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.uncacheable = 0
+
+
+#: The compiled query cache shared by all querysets
+QUERY_CACHE = QueryCache()
+
+
+def _check_param(value: Any) -> Any:
+    # pypika inlines these instead of binding them, so they change the SQL
+    if value is None or isinstance(value, (Enum, Term, list, tuple, set, dict)):
+        raise _Uncacheable
+    if isinstance(value, str) and value == "*":
+        raise _Uncacheable
+    return value
+
+
+def _leaf_shape(model: type[Model], key: str, value: Any, params: list) -> Hashable:
+    # Mirrors Q._resolve_kwargs() for a single filter, appending its parameters
+    meta = model._meta
+    if key in meta.fk_fields or key in meta.o2o_fields:
+        key = cast(str, meta.fields_map[key].source_field)
+        value = getattr(value, "pk", value)
+    elif key in meta.m2m_fields:
+        value = getattr(value, "pk", value)
+    elif not (key.split("__")[0] in meta.fetch_fields or key in meta.filters):
+        raise _Uncacheable
+    if isinstance(value, (Expression, Term)):
+        raise _Uncacheable
+
+    if key not in meta.filters:
+        related_field_name, __, forwarded_fields = key.partition("__")
+        related_field = cast(RelationalField, meta.fields_map[related_field_name])
+        return related_field_name, _leaf_shape(
+            related_field.related_model, forwarded_fields, value, params
+        )
+
+    if value is None and f"{key}__isnull" in meta.filters:
+        return key, None
+    filter_info = meta.get_filter(key)
+    # The operator before the dialect's override, which renders the same SQL for short lists
+    op = meta._filters.get(key, filter_info)["operator"]
+    if "table" in filter_info:
+        if "value_encoder" in filter_info:
+            value = filter_info["value_encoder"](value, model)
+    else:
+        field_object = meta.fields_map[filter_info["field"]]
+        value = (
+            filter_info["value_encoder"](value, model, field_object)
+            if "value_encoder" in filter_info
+            else field_object.to_db_value(value, model)
+        )
+
+    if op is is_null or op is not_null:
+        # Renders IS NULL or IS NOT NULL depending on the value, without parameters
+        return key, bool(value)
+    if op in _SCALAR_OPERATORS:
+        params.append(_check_param(value))
+        return key, type(value)
+    if op in _LIST_OPERATORS and isinstance(value, (list, tuple)):
+        if len(value) > LARGE_IN_LIST:
+            # Might be bound as a single parameter
+            raise _Uncacheable
+        params.extend(_check_param(v) for v in value)
+        return key, len(value)
+    if op is between_and and isinstance(value, (list, tuple)) and len(value) == 2:
+        params.extend(_check_param(v) for v in value)
+        return key, 2
+    raise _Uncacheable
+
+
+def _q_shape(model: type[Model], q: Q, params: list) -> Hashable:
+    if q.filters:
+        nodes = tuple(_leaf_shape(model, k, v, params) for k, v in q.filters.items())
+    else:
+        nodes = tuple(_q_shape(model, child, params) for child in q.children)
+    return q.join_type, q._is_negated, nodes
+
+
+def query_shape(queryset: QuerySet) -> tuple[Hashable, list] | None:
+    """
+    Returns the cache key of the QuerySet and the parameters of its query,
+    or ``None`` if it can't be cached.
+    """
+    if queryset._annotations or queryset._custom_filters or queryset._group_bys:
+        return None
+    model = queryset.model
+    db = queryset._db
+    params: list = []
+    try:
+        filters = tuple(_q_shape(model, q, params) for q in queryset._q_objects)
+    except _Uncacheable:
+        return None
+    if queryset._limit is not None:
+        params.append(queryset._limit)
+    if queryset._offset is not None:
+        params.append(queryset._offset)
+    key = (
+        model,
+        model._meta.db_table,
+        model._meta.schema,
+        db.query_class,
+        db.executor_class,
+        filters,
+        tuple(queryset._orderings),
+        queryset._fields_for_select,
+        queryset._limit is not None,
+        queryset._offset is not None,
+        queryset._distinct,
+        queryset._select_for_update,
+        queryset._select_for_update_nowait,
+        queryset._select_for_update_skip_locked,
+        tuple(sorted(queryset._select_for_update_of)),
+        tuple(sorted(queryset._select_related)),
+        tuple(sorted(queryset._force_indexes)),
+        tuple(sorted(queryset._use_indexes)),
+    )
+    return key, params
+
+
+def unique_params(params: list) -> bool:
+    """
+    Checks that no parameter value repeats, as repeated values could hide parameters
+    extracted in the wrong order when comparing them with the compiled query.
+    """
+    try:
+        return len(set(params)) == len(params)
+    except TypeError:
+        return False
@@ -0,0 +1,186 @@
+"""
+In-process statistics of the executed queries, aggregated by shape.
+
+Every query is fingerprinted by normalizing its SQL: literals and bind parameters are replaced
+by ``?``, the lists of parameters of ``IN (...)`` and of multi-row ``VALUES`` are collapsed and
+the whitespace is squeezed. The calls, time, rows and hydrated objects of the queries are then
+aggregated per fingerprint, much like ``pg_stat_statements`` does in the DB.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: nocoverage
+    from tortoise.backends.base.client import QueryEvent
+
+_LITERAL_RE = re.compile(
+    r"'(?:[^']|'')*'"  # strings
+    r"|(?<![\w\"`\]])-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b"  # numbers, not within identifiers
+    r"|\$\d+|%s|\?"  # bind parameters
+)
+_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_ROWS_RE = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def fingerprint(sql: str) -> str:
+    """
+    Returns the normalized SQL of the query, which is the same for all the queries that
+    only differ by their literals, parameters or number of values in a list.
+    """
+    sql = _LITERAL_RE.sub("?", sql)
+    sql = _LIST_RE.sub("(...)", sql)
+    sql = _ROWS_RE.sub("(...), ...", sql)
+    return _SPACE_RE.sub(" ", sql).strip()
+
+
+def _percentile(samples: list[float], percent: int) -> float:
+    if not samples:
+        return 0.0
+    return samples[min(len(samples) - 1, len(samples) * percent // 100)]
+
+
+class QueryShapeStats:
+    """
+    Aggregated statistics of the queries with the same fingerprint.
+    """
+
+    __slots__ = ("query", "calls", "errors", "total_time", "rows", "hydrated", "_samples")
+
+    def __init__(self, query: str) -> None:
+        self.query = query
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.rows = 0
+        self.hydrated = 0
+        self._samples: list[float] = []
+
+    def as_dict(self) -> dict[str, Any]:
+        samples = sorted(self._samples)
+        return {
+            "query": self.query,
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_time": self.total_time,
+            "mean_time": self.total_time / self.calls if self.calls else 0.0,
+            "p95_time": _percentile(samples, 95),
+            "p99_time": _percentile(samples, 99),
+            "rows": self.rows,
+            "hydrated": self.hydrated,
+        }
+
+
+class QueryStats:
+    """
+    Collects the statistics of the queries of all DB clients, by fingerprint, as a
+    :class:`~tortoise.backends.base.client.QueryListener`.
+
+    It only collects once enabled, and then adds a little overhead to every query.
+
+    :param sample_size: Max number of durations kept per fingerprint to estimate the
+        percentiles, a random sample of them once there were more calls.
+    :param max_shapes: Max number of fingerprints tracked, the queries of new ones are only
+        counted in ``dropped`` afterwards.
+
+    .. attribute:: dropped
+
+        Number of queries not tracked because ``max_shapes`` was reached
+    """
+
+    def __init__(self, sample_size: int = 1000, max_shapes: int = 5000) -> None:
+        self.sample_size = sample_size
+        self.max_shapes = max_shapes
+        self.enabled = False
+        self.dropped = 0
+        self._shapes: dict[str, QueryShapeStats] = {}
+        self._fingerprints: dict[str, str] = {}
+
+    def enable(self) -> None:
+        """
+        Starts collecting the statistics of the queries.
+        """
+        # Imported here as the client imports the executor, which imports this module
+        from tortoise.backends.base.client import add_query_listener
+
+        self.enabled = True
+        add_query_listener(self)  # type: ignore[arg-type]
+
+    def disable(self) -> None:
+        """
+        Stops collecting, the statistics collected so far are kept.
+        """
+        from tortoise.backends.base.client import remove_query_listener
+
+        self.enabled = False
+        remove_query_listener(self)  # type: ignore[arg-type]
+
+    def _fingerprint(self, sql: str) -> str:
+        query = self._fingerprints.get(sql)
+        if query is None:
+            if len(self._fingerprints) >= self.max_shapes * 10:
+                self._fingerprints.clear()
+            query = self._fingerprints[sql] = fingerprint(sql)
+        return query
+
+    def _shape(self, sql: str) -> QueryShapeStats | None:
+        query = self._fingerprint(sql)
+        shape = self._shapes.get(query)
+        if shape is None:
+            if len(self._shapes) >= self.max_shapes:
+                self.dropped += 1
+                return None
+            shape = self._shapes[query] = QueryShapeStats(query)
+        return shape
+
+    def before_query(self, event: QueryEvent) -> None:
+        pass
+
+    def after_query(self, event: QueryEvent) -> None:
+        shape = self._shape(event.sql)
+        if shape is None:
+            return
+        shape.calls += 1
+        if event.error is not None:
+            shape.errors += 1
+        duration = event.duration or 0.0
+        shape.total_time += duration
+        shape.rows += event.rowcount or 0
+        samples = shape._samples
+        if len(samples) < self.sample_size:
+            samples.append(duration)
+        else:
+            # Reservoir sampling keeps a uniform sample of all the calls
+            index = random.randrange(shape.calls)  # nosec
+            if index < self.sample_size:
+                samples[index] = duration
+
+    def record_hydrated(self, sql: str, count: int) -> None:
+        """
+        Counts the objects built from the result of the query.
+        """
+        if self.enabled and (shape := self._shapes.get(self._fingerprint(sql))) is not None:
+            shape.hydrated += count
+
+    def stats(self) -> list[dict[str, Any]]:
+        """
+        Returns the statistics of every fingerprint, by decreasing total time.
+        Times are in seconds, ``rows`` are the rows returned or affected and ``hydrated`` the
+        model objects built from them.
+        """
+        shapes = sorted(self._shapes.values(), key=lambda s: s.total_time, reverse=True)
+        return [shape.as_dict() for shape in shapes]
+
+    def reset_stats(self) -> None:
+        """
+        Drops the statistics collected so far.
+        """
+        self._shapes.clear()
+        self.dropped = 0
+
+
+#: The global query statistics collector
+QUERY_STATS = QueryStats()
@@ -1,7 +1,15 @@
 from __future__ import annotations
 
 import types
-from collections.abc import AsyncIterator, Callable, Collection, Generator, Iterable
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Collection,
+    Generator,
+    Iterable,
+    Sequence,
+)
 from copy import copy
 from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar, cast, overload
 
@@ -12,7 +20,21 @@ from pypika_tortoise.queries import QueryBuilder
 from pypika_tortoise.terms import Case, Field, Star, Term, ValueWrapper
 from typing_extensions import Literal, Protocol
 
-from tortoise.backends.base.client import BaseDBAsyncClient, Capabilities
+from tortoise.auto_prefetch import AUTO_PREFETCH, SiblingGroup
+from tortoise.backends.base.client import (
+    SINGLE_FLIGHT,
+    BaseDBAsyncClient,
+    Capabilities,
+    TransactionalDBClient,
+)
+from tortoise.cache import (
+    EMPTY,
+    RESULT_CACHE,
+    ModelCache,
+    invalidate_related,
+    query_tables,
+    related_tables,
+)
 from tortoise.exceptions import (
     DoesNotExist,
     FieldError,
@@ -27,6 +49,9 @@ from tortoise.fields.relational import (
     RelationalField,
 )
 from tortoise.filters import FilterInfoDict
+from tortoise.loader import BatchLoader, current_loader
+from tortoise.profiling import phase, profiling
+from tortoise.query_cache import QUERY_CACHE, CompiledQuery, query_shape, unique_params
 from tortoise.query_utils import (
     Prefetch,
     QueryModifier,
@@ -34,7 +59,7 @@ from tortoise.query_utils import (
     get_joins_for_related_field,
 )
 from tortoise.router import router
-from tortoise.utils import chunk
+from tortoise.utils import chunk, chunk_in_list
 
 # Empty placeholder - Should never be edited.
 
@@ -46,6 +71,57 @@ if TYPE_CHECKING:  # pragma: nocoverage
 MODEL = TypeVar("MODEL", bound="Model")
 T_co = TypeVar("T_co", covariant=True)
 SINGLE = TypeVar("SINGLE", bound=bool)
+ResultCacheOptions = tuple[Optional[float], Optional[str]]
+
+
+def _path_tables(model: type[Model], relation: str) -> set[str]:
+    tables = set()
+    for name in relation.split("__"):
+        field = model._meta.fields_map.get(name)
+        if not isinstance(field, RelationalField):
+            break
+        model = field.related_model
+        tables.add(model._meta.db_table)
+        if through := getattr(field, "through", None):
+            tables.add(through)
+    return tables
+
+
+def _prefetch_keys(
+    model: type[Model],
+    prefetch_map: dict[str, set[str | Prefetch]],
+    prefetch_queries: dict[str, list[tuple[str | None, QuerySet]]],
+    tables: set[str],
+) -> list[str]:
+    """
+    Returns the descriptions of the relations prefetched by a queryset for the key of its
+    cached result, and adds the tables they are read from to ``tables``.
+    """
+
+    def custom_sql(queryset: QuerySet) -> str:
+        queryset._make_query()
+        sql = queryset.query.get_sql()
+        tables.update(query_tables(sql))
+        return sql
+
+    keys = []
+    for field in prefetch_map.keys() | prefetch_queries.keys():
+        keys.append(field)
+        tables.update(_path_tables(model, field))
+    for field, relations in prefetch_map.items():
+        related_model = model._meta.fields_map[field].related_model  # type: ignore[attr-defined]
+        for relation in relations:
+            if isinstance(relation, Prefetch):
+                tables.update(_path_tables(related_model, relation.relation))
+                sql = custom_sql(relation.queryset)
+                keys.append(f"{field}__{relation.relation}>{relation.to_attr}:{sql}")
+            else:
+                tables.update(_path_tables(related_model, relation))
+                keys.append(f"{field}__{relation}")
+    for field, queries in prefetch_queries.items():
+        for to_attr, queryset in queries:
+            keys.append(f"{field}>{to_attr}:{custom_sql(queryset)}")
+    return sorted(keys)
 
 
 class QuerySetSingle(Protocol[T_co]):
@@ -68,6 +144,12 @@ class QuerySetSingle(Protocol[T_co]):
 
     def only(self, *fields_for_select: str) -> QuerySetSingle[T_co]: ...  # pragma: nocoverage
 
+    def populate_existing(self) -> QuerySetSingle[T_co]: ...  # pragma: nocoverage
+
+    def cache(
+        self, ttl: float | None = 60.0, key: str | None = None
+    ) -> QuerySetSingle[T_co]: ...  # pragma: nocoverage
+
     def values_list(
         self, *fields_: str, flat: bool = False
     ) -> ValuesListQuery[Literal[True]]: ...  # pragma: nocoverage
@@ -87,6 +169,7 @@ class AwaitableQuery(Generic[MODEL]):
         "_annotations",
         "_custom_filters",
         "_q_objects",
+        "_result_cache",
     )
 
     def __init__(self, model: type[MODEL]) -> None:
@@ -98,6 +181,7 @@ class AwaitableQuery(Generic[MODEL]):
         self._annotations: dict[str, Expression | Term] = {}
         self._custom_filters: dict[str, FilterInfoDict] = {}
         self._q_objects: list[Q] = []
+        self._result_cache: ResultCacheOptions | None = None
 
     def _choose_db(self, for_write: bool = False) -> BaseDBAsyncClient:
         """
@@ -303,6 +387,35 @@ class AwaitableQuery(Generic[MODEL]):
     async def _execute(self) -> Any:
         raise NotImplementedError()  # pragma: nocoverage
 
+    def _use_result_cache(self) -> bool:
+        # Transactions may read rows they changed and didn't commit yet
+        return self._result_cache is not None and not isinstance(self._db, TransactionalDBClient)
+
+    async def _execute_result_cached(
+        self,
+        execute: Callable[[], Awaitable[Any]],
+        sql: str,
+        params: Sequence[Any],
+        extra: tuple = (),
+        tables: set[str] | None = None,
+    ) -> Any:
+        """
+        Returns the result of the query from the result cache, executing it on a miss.
+
+        :param extra: Options of the query changing its result but not its SQL.
+        :param tables: Tables read by the query in addition to the ones of its SQL.
+        """
+        ttl, key = cast(ResultCacheOptions, self._result_cache)
+        if key is None:
+            name = self._db.connection_name
+            key = repr((name, type(self).__name__, sql, list(params), *extra))
+        result = await RESULT_CACHE.get(key)
+        if result is EMPTY:
+            versions = RESULT_CACHE.versions(query_tables(sql) | (tables or set()))
+            result = await execute()
+            await RESULT_CACHE.set(key, versions, result, ttl)
+        return result
+
 
 class QuerySet(AwaitableQuery[MODEL]):
     __slots__ = (
@@ -328,6 +441,9 @@ class QuerySet(AwaitableQuery[MODEL]):
         "_select_related_idx",
         "_use_indexes",
         "_force_indexes",
+        "_auto_prefetch",
+        "_shared",
+        "_populate_existing",
     )
 
     def __init__(self, model: type[MODEL]) -> None:
@@ -355,6 +471,9 @@ class QuerySet(AwaitableQuery[MODEL]):
         ] = []  # format with: model,idx,model_name,parent_model
         self._force_indexes: set[str] = set()
         self._use_indexes: set[str] = set()
+        self._auto_prefetch: bool | None = None
+        self._shared: bool | None = None
+        self._populate_existing: bool = False
 
     def _clone(self) -> QuerySet[MODEL]:
         queryset = self.__class__.__new__(self.__class__)
@@ -387,6 +506,10 @@ class QuerySet(AwaitableQuery[MODEL]):
         queryset._select_related_idx = self._select_related_idx
         queryset._force_indexes = self._force_indexes
         queryset._use_indexes = self._use_indexes
+        queryset._auto_prefetch = self._auto_prefetch
+        queryset._shared = self._shared
+        queryset._populate_existing = self._populate_existing
+        queryset._result_cache = self._result_cache
         return queryset
 
     def _filter_or_exclude(self, *args: Q, negate: bool, **kwargs: Any) -> QuerySet[MODEL]:
@@ -525,6 +648,58 @@ class QuerySet(AwaitableQuery[MODEL]):
             queryset._limit = 1000000
         return queryset
 
+    def paginate_after(self, cursor: Sequence[Any] | Any) -> QuerySet[MODEL]:
+        """
+        Keyset (seek) pagination: filters the QuerySet to the rows that come after ``cursor``
+        in its ordering.
+
+        Unlike ``.offset()``, the DB does not have to scan and discard the skipped rows, so
+        deep pages are as fast as the first one when the ordering columns are indexed.
+
+        .. code-block:: python3
+
+            page = await Event.all().order_by("-modified", "id").limit(50)
+            next_page = await (
+                Event.all()
+                .order_by("-modified", "id")
+                .paginate_after((page[-1].modified, page[-1].id))
+                .limit(50)
+            )
+
+        Mixed ascending and descending orderings are supported. The ordering should be unique
+        (e.g. end with the primary key), otherwise rows that tie with the cursor are skipped,
+        and the ordered fields should not be nullable.
+
+        :param cursor: Values of the ordering fields of the last row of the previous page,
+            a single value may be passed if the QuerySet is ordered by one field.
+
+        :raises ParamsError: If the QuerySet is not ordered or cursor does not match the ordering.
+        """
+        orderings = self._orderings or list(self.model._meta.ordering)
+        if not orderings:
+            raise ParamsError("paginate_after() requires an ordering, use .order_by()")
+        if not isinstance(cursor, (tuple, list)):
+            cursor = (cursor,)
+        if len(cursor) != len(orderings):
+            raise ParamsError(
+                f"Cursor has {len(cursor)} values, but QuerySet is ordered by {len(orderings)} fields"
+            )
+
+        # (a, b) > (x, y) expands to a > x OR (a = x AND b > y), which also works for mixed
+        # directions and on DBs without row value comparison
+        keyset_filter: Q | None = None
+        for (field_name, order), value in reversed(list(zip(orderings, cursor))):
+            lookup = "lt" if order == Order.desc else "gt"
+            condition = Q(**{f"{field_name}__{lookup}": value})
+            if keyset_filter is not None:
+                condition |= Q(Q(**{field_name: value}), keyset_filter)
+            keyset_filter = condition
+
+        queryset = self._clone()
+        queryset._orderings = list(orderings)
+        queryset._q_objects.append(cast(Q, keyset_filter))
+        return queryset
+
     def __getitem__(self, key: slice) -> QuerySet[MODEL]:
         """
         Query offset and limit for Queryset.
@@ -644,6 +819,7 @@ class QuerySet(AwaitableQuery[MODEL]):
             group_bys=self._group_bys,
             force_indexes=self._force_indexes,
             use_indexes=self._use_indexes,
+            result_cache=self._result_cache,
         )
 
     def values(self, *args: str, **kwargs: str) -> ValuesQuery[Literal[False]]:
@@ -694,6 +870,7 @@ class QuerySet(AwaitableQuery[MODEL]):
             group_bys=self._group_bys,
             force_indexes=self._force_indexes,
             use_indexes=self._use_indexes,
+            result_cache=self._result_cache,
         )
 
     def delete(self) -> DeleteQuery:
@@ -747,6 +924,7 @@ class QuerySet(AwaitableQuery[MODEL]):
             offset=self._offset,
             force_indexes=self._force_indexes,
             use_indexes=self._use_indexes,
+            result_cache=self._result_cache,
         )
 
     def exists(self) -> ExistsQuery:
@@ -761,6 +939,7 @@ class QuerySet(AwaitableQuery[MODEL]):
             custom_filters=self._custom_filters,
             force_indexes=self._force_indexes,
             use_indexes=self._use_indexes,
+            result_cache=self._result_cache,
         )
 
     def all(self) -> QuerySet[MODEL]:
@@ -821,9 +1000,37 @@ class QuerySet(AwaitableQuery[MODEL]):
         :param id_list: A list of field values
         :param field_name: Must be a unique field
         """
-        objs = await self.filter(**{f"{field_name}__in": id_list})
+        cache = self.model._meta.cache
+        if (
+            cache is not None
+            and field_name in ("pk", self.model._meta.pk_attr)
+            and not self._q_objects
+            and self._limit is None
+            and self._can_use_cache()
+        ):
+            to_python = self.model._meta.pk.to_python_value
+            pks = {to_python(pk) for pk in id_list}
+            cached = cast("dict[Any, MODEL]", await cache.get_many(pks))
+            missing = [pk for pk in pks if pk not in cached]
+            if not missing:
+                return cached
+            version = cache.version
+            objs = await self._in_bulk(missing, "pk")
+            await cache.put(*objs, version=version)
+            return {**cached, **{obj.pk: obj for obj in objs}}
+        objs = await self._in_bulk(id_list, field_name)
         return {getattr(obj, field_name): obj for obj in objs}
 
+    async def _in_bulk(self, id_list: Iterable[str | int], field_name: str) -> list[MODEL]:
+        if self._limit is not None or self._offset is not None:
+            # The slice applies to the objects of all the IDs, so a single query selects them
+            return await self.filter(**{f"{field_name}__in": list(id_list)})
+        # A query for every chunk of IDs that fits in the bind parameters of the DB
+        objs: list[MODEL] = []
+        for ids in chunk_in_list(id_list, self._choose_db()):
+            objs.extend(await self.filter(**{f"{field_name}__in": ids}))
+        return objs
+
     def bulk_create(
         self,
         objects: Iterable[MODEL],
@@ -831,6 +1038,8 @@ class QuerySet(AwaitableQuery[MODEL]):
         ignore_conflicts: bool = False,
         update_fields: Iterable[str] | None = None,
         on_conflict: Iterable[str] | None = None,
+        method: Literal["insert", "copy"] = "insert",
+        return_pks: bool = False,
     ) -> BulkCreateQuery[MODEL]:
         """
         This method inserts the provided list of objects into the database in an efficient manner
@@ -841,6 +1050,12 @@ class QuerySet(AwaitableQuery[MODEL]):
         :param ignore_conflicts: Ignore conflicts when inserting
         :param objects: List of objects to bulk create
         :param batch_size: How many objects are created in a single query
+        :param method: ``"insert"`` to run ``INSERT`` statements, or ``"copy"`` to load the
+            objects with the bulk load protocol of the DB (``COPY`` on PostgreSQL),
+            which can't handle conflicts.
+        :param return_pks: With ``method="copy"``, also fetch the generated primary keys
+            and set them on the objects. The objects are then loaded into a temporary
+            table first.
 
         :raises ValueError: If params do not meet specifications
         """
@@ -851,6 +1066,10 @@ class QuerySet(AwaitableQuery[MODEL]):
         if not ignore_conflicts:
             if (update_fields and not on_conflict) or (on_conflict and not update_fields):
                 raise ValueError("update_fields and on_conflict need set in same time.")
+        if method not in ("insert", "copy"):
+            raise ValueError(f"Unknown bulk create method {method}")
+        if method == "copy" and (ignore_conflicts or update_fields):
+            raise ValueError("method copy can't be used with ignore_conflicts or update_fields.")
         return BulkCreateQuery(
             db=self._db,
             model=self.model,
@@ -859,6 +1078,8 @@ class QuerySet(AwaitableQuery[MODEL]):
             ignore_conflicts=ignore_conflicts,
             update_fields=update_fields,
             on_conflict=on_conflict,
+            method=method,
+            return_pks=return_pks,
         )
 
     def bulk_update(
@@ -872,7 +1093,8 @@ class QuerySet(AwaitableQuery[MODEL]):
 
         :param objects: List of objects to bulk create
         :param fields: The fields to update
-        :param batch_size: How many objects are created in a single query
+        :param batch_size: How many objects are updated in a single query,
+            by default as many as the parameters of a query allow
 
         :raises ValueError: If objects have no primary key set
         """
@@ -987,6 +1209,90 @@ class QuerySet(AwaitableQuery[MODEL]):
                 queryset._prefetch_map[first_level_field].add(forwarded_prefetch)
         return queryset
 
+    def auto_prefetch(self, enabled: bool = True) -> QuerySet[MODEL]:
+        """
+        Prefetches the relations of the returned objects on demand: the first time a relation
+        is lazily loaded for one of them, it is prefetched for all of them, as if it was passed
+        to ``.prefetch_related()``.
+
+        .. code-block:: python3
+
+            for event in await Event.all().auto_prefetch():
+                tournament = await event.tournament  # 1 query for all the events
+
+        :param enabled: ``False`` disables it for this queryset even if
+            ``AUTO_PREFETCH.enabled`` is set globally.
+        """
+        queryset = self._clone()
+        queryset._auto_prefetch = enabled
+        return queryset
+
+    def cache(self, ttl: float | None = 60.0, key: str | None = None) -> QuerySet[MODEL]:
+        """
+        Caches the result of the query in ``RESULT_CACHE``, along with the tables it reads from,
+        including the joined and prefetched ones. It is served from the cache until it expires
+        or a table is written to through the ORM.
+        ``.values()``, ``.values_list()``, ``.count()`` and ``.exists()`` called afterwards are
+        cached as well.
+
+        .. code-block:: python3
+
+            stats = await (
+                Event.filter(tournament=tournament)
+                .cache(ttl=10)
+                .annotate(count=Count("event_id"))
+                .group_by("reporter_id")
+                .values("reporter_id", "count")
+            )
+
+        Queries within transactions always read from the DB.
+
+        :param ttl: Seconds the result is cached, ``None`` to keep it until invalidated.
+        :param key: Key of the result in the cache, which defaults to the SQL and parameters
+            of the query.
+        """
+        queryset = self._clone()
+        queryset._result_cache = (ttl, key)
+        return queryset
+
+    def shared(self, enabled: bool = True) -> QuerySet[MODEL]:
+        """
+        Shares the queries of the queryset and of its prefetches with the identical queries
+        already running: instead of running again, they wait for the result of the running query.
+        Queries within transactions always run.
+
+        .. code-block:: python3
+
+            # 1 query for all the concurrent requests
+            events = await Event.filter(tournament_id=tournament_id).shared()
+
+        :param enabled: ``False`` disables it for this queryset even if
+            ``SINGLE_FLIGHT.enabled`` is set globally.
+        """
+        queryset = self._clone()
+        queryset._shared = enabled
+        return queryset
+
+    def populate_existing(self) -> QuerySet[MODEL]:
+        """
+        Overwrites the objects already in the :func:`~tortoise.session` with the rows
+        fetched by the queryset, discarding their changes not saved yet, instead of
+        returning them as they are.
+        Querysets with ``select_for_update()`` always do.
+
+        .. code-block:: python3
+
+            with tortoise.session():
+                event = await Event.get(pk=pk)
+                ...
+                async with in_transaction():
+                    # event has the values stored in the DB now
+                    await Event.filter(pk=pk).populate_existing()
+        """
+        queryset = self._clone()
+        queryset._populate_existing = True
+        return queryset
+
     async def explain(self) -> Any:
         """Fetch and return information about the query execution plan.
 
@@ -1126,27 +1432,256 @@ class QuerySet(AwaitableQuery[MODEL]):
             self.query._use_indexes = []
             self.query = self.query.use_index(*self._use_indexes)
 
+    def _compile(self) -> tuple[str, list]:
+        """
+        Returns the SQL and parameters of the query, from the compiled query cache
+        if a QuerySet of the same shape has been compiled already.
+        """
+        shape = query_shape(self) if QUERY_CACHE.enabled else None
+        if shape is None:
+            with phase("make_query"):
+                self._make_query()
+            with phase("render_sql"):
+                return self.query.get_parameterized_sql()
+        key, params = shape
+        compiled = QUERY_CACHE.get(key)
+        if compiled is not None:
+            self._select_related_idx = list(compiled.select_related_idx)
+            return compiled.sql, params
+        with phase("make_query"):
+            self._make_query()
+        with phase("render_sql"):
+            sql, query_params = self.query.get_parameterized_sql()
+        if params != query_params:
+            QUERY_CACHE.put(key, None)
+        elif unique_params(params):
+            QUERY_CACHE.put(key, CompiledQuery(sql, list(self._select_related_idx)))
+        return sql, query_params
+
+    def _is_plain(self) -> bool:
+        """
+        Returns if the queryset fetches plain objects of the model, which can be loaded by
+        primary key from elsewhere than the DB.
+        """
+        return not (
+            self._annotations
+            or self._custom_filters
+            or self._fields_for_select
+            or self._select_related
+            or self._prefetch_map
+            or self._prefetch_queries
+            or self._select_for_update
+            or self._offset
+            or self._group_bys
+        )
+
+    def _can_use_cache(self) -> bool:
+        """
+        Returns if the objects fetched by the queryset can come from the model cache.
+        """
+        return self._is_plain() and not isinstance(self._choose_db(), TransactionalDBClient)
+
+    def _populates_existing(self) -> bool:
+        """
+        Returns if the objects fetched by the queryset overwrite the ones in the session.
+        """
+        # The rows locked for update are the ones the changes should be made on
+        return self._populate_existing or self._select_for_update
+
+    def _single_pk(self) -> Any:
+        """
+        Returns the primary key looked up by a plain single object queryset, ``EMPTY``
+        otherwise.
+        """
+        if not self._single or len(self._q_objects) != 1 or not self._is_plain():
+            return EMPTY
+        q = self._q_objects[0]
+        if q.children or q._is_negated or len(q.filters) != 1:
+            return EMPTY
+        ((key, value),) = cast("dict[str, Any]", q.filters).items()
+        if key not in ("pk", self.model._meta.pk_attr) or value is None:
+            return EMPTY
+        if isinstance(value, (Term, Expression)):
+            return EMPTY
+        try:
+            return self.model._meta.pk.to_python_value(value)
+        except Exception:
+            # The DB query raises the error
+            return EMPTY
+
+    async def _execute_cached(self, pk: Any) -> MODEL | None:
+        cache = cast(ModelCache, self.model._meta.cache)
+        instance = cast("MODEL | None", await cache.get(pk))
+        if instance is None:
+            version = cache.version
+            instance = cast("MODEL | None", await self._execute())
+            if instance is not None:
+                await cache.put(instance, version=version)
+        return instance
+
+    async def _execute_loaded(self, loader: BatchLoader, pk: Any) -> MODEL | None:
+        instance = await loader.load(self.model, self.model._meta.pk_attr, pk, self._db)
+        if instance is None and self._raise_does_not_exist:
+            raise DoesNotExist(self.model)
+        return cast("MODEL | None", instance)
+
     def __await__(self) -> Generator[Any, None, list[MODEL]]:
         if self._db is None:
             self._db = self._choose_db(self._select_for_update)  # type: ignore
-        self._make_query()
+        if self._use_result_cache():
+            return self._execute_queryset_cached().__await__()
+        if (
+            self.model._meta.cache is not None
+            and self._can_use_cache()
+            and (pk := self._single_pk()) is not EMPTY
+        ):
+            return self._execute_cached(pk).__await__()  # type: ignore[return-value]
+        if (loader := current_loader()) is not None and (pk := self._single_pk()) is not EMPTY:
+            # Coalesced with the other lookups of the tick, see batch_loading()
+            return self._execute_loaded(loader, pk).__await__()  # type: ignore[return-value]
+        if profiling():
+            return self._execute_profiled().__await__()
         return self._execute().__await__()
 
+    async def _execute_queryset_cached(self) -> list[MODEL]:
+        sql, params = self._compile()
+        tables: set[str] = set()
+        prefetch = _prefetch_keys(self.model, self._prefetch_map, self._prefetch_queries, tables)
+        return await self._execute_result_cached(
+            lambda: self._execute_compiled(sql, params),
+            sql,
+            params,
+            (self._single, self._raise_does_not_exist, prefetch),
+            tables,
+        )
+
+    async def _execute_profiled(self) -> list[MODEL]:
+        with phase(f"{self.model.__name__} query"):
+            with phase("compile"):
+                sql, params = self._compile()
+            return await self._execute_compiled(sql, params)
+
     async def __aiter__(self) -> AsyncIterator[MODEL]:
         for val in await self:
             yield val
 
-    async def _execute(self) -> list[MODEL]:
-        instance_list = await self._db.executor_class(
+    async def iterator(self, fetch_size: int | None = None) -> AsyncIterator[MODEL]:
+        """
+        Streams the objects of the QuerySet from the DB instead of loading them all at once.
+
+        Rows are fetched through a server-side cursor and hydrated in batches of ``fetch_size``,
+        so memory use is bounded regardless of the size of the resultset.
+        ``.prefetch_related()`` is applied to every batch.
+
+        .. code-block:: python3
+
+            async for event in Event.all().iterator(fetch_size=500):
+                ...
+
+        Unlike ``async for event in Event.all()``, which loads the objects before the loop,
+        the cursor keeps a connection of the pool busy for the whole loop, so queries run in
+        the loop need another one. In a transaction, the loop shouldn't run queries on MySQL,
+        which can't run them while the cursor is open.
+
+        :param fetch_size: Number of rows fetched from the DB per batch, the default fetch size
+            of the DB client if ``None``.
+        """
+        if self._db is None:
+            self._db = self._choose_db(self._select_for_update)  # type: ignore
+        sql, params = self._compile()
+        executor = self._db.executor_class(
             model=self.model,
             db=self._db,
             prefetch_map=self._prefetch_map,
             prefetch_queries=self._prefetch_queries,
             select_related_idx=self._select_related_idx,  # type: ignore
-        ).execute_select(
-            *self.query.get_parameterized_sql(),
-            custom_fields=list(self._annotations.keys()),
+            populate_existing=self._populates_existing(),
         )
+        async for instance in executor.execute_select_stream(
+            sql,
+            params,
+            custom_fields=list(self._annotations.keys()),
+            fetch_size=fetch_size,
+        ):
+            yield cast(MODEL, instance)
+
+    async def iterate_by_key(
+        self, batch_size: int = 1000, key: str | Sequence[str] = "pk"
+    ) -> AsyncIterator[list[MODEL]]:
+        """
+        Iterates over the QuerySet in batches of objects, using keyset pagination
+        (see :meth:`paginate_after`) instead of ``OFFSET``.
+
+        .. code-block:: python3
+
+            async for events in Event.filter(tournament=tournament).iterate_by_key(500):
+                ...
+
+        Every batch is a separate query, so no transaction or cursor is kept open in between.
+        An ``.offset()`` of the QuerySet skips the rows before the first batch, and a
+        ``.limit()`` caps the total number of objects.
+
+        :param batch_size: Max number of objects per batch.
+        :param key: Field or fields of the model to paginate on, in the same format as
+            ``.order_by()``. The primary key is appended if missing, to make the ordering unique.
+
+        :raises ParamsError: If batch_size is not positive or key refers to a related model.
+        """
+        if batch_size <= 0:
+            raise ParamsError("Batch size should be a positive number")
+        pk_attr = self.model._meta.pk_attr
+        keys = []
+        for ordering in [key] if isinstance(key, str) else key:
+            field_name, order = self._resolve_ordering_string(ordering)
+            if "__" in field_name:
+                raise ParamsError(
+                    f"Can't iterate by related field {field_name}, use paginate_after() instead"
+                )
+            if field_name == "pk":
+                field_name = pk_attr
+            keys.append(f"-{field_name}" if order == Order.desc else field_name)
+        if pk_attr not in (k.lstrip("-") for k in keys):
+            keys.append(pk_attr)
+
+        queryset = self.order_by(*keys)
+        attrs = [field_name for field_name, _ in queryset._orderings]
+        remaining = self._limit
+        page = queryset.limit(batch_size if remaining is None else min(batch_size, remaining))
+        # The next pages start after the last row of the previous one
+        queryset._offset = None
+        while True:
+            batch = await page
+            if batch:
+                yield batch
+            if remaining is not None:
+                remaining -= len(batch)
+            if len(batch) < batch_size or remaining == 0:
+                break
+            page = queryset.paginate_after([getattr(batch[-1], attr) for attr in attrs]).limit(
+                batch_size if remaining is None else min(batch_size, remaining)
+            )
+
+    async def _execute(self) -> list[MODEL]:
+        return await self._execute_compiled(*self._compile())
+
+    async def _execute_compiled(self, sql: str, params: list) -> list[MODEL]:
+        with SINGLE_FLIGHT.override(self._shared):
+            instance_list = await self._db.executor_class(
+                model=self.model,
+                db=self._db,
+                prefetch_map=self._prefetch_map,
+                prefetch_queries=self._prefetch_queries,
+                select_related_idx=self._select_related_idx,  # type: ignore
+                populate_existing=self._populates_existing(),
+            ).execute_select(
+                sql,
+                params,
+                custom_fields=list(self._annotations.keys()),
+            )
+        if len(instance_list) > 1 and (
+            AUTO_PREFETCH.enabled if self._auto_prefetch is None else self._auto_prefetch
+        ):
+            SiblingGroup.attach(instance_list)
         if self._single:
             if len(instance_list) == 1:
                 return instance_list[0]
@@ -1234,7 +1769,11 @@ class UpdateQuery(AwaitableQuery):
         return self._execute().__await__()
 
     async def _execute(self) -> int:
-        return (await self._db.execute_query(*self.query.get_parameterized_sql()))[0]
+        count = (await self._db.execute_query(*self.query.get_parameterized_sql()))[0]
+        RESULT_CACHE.invalidate(self.model._meta.db_table, using_db=self._db)
+        if (cache := self.model._meta.cache) is not None:
+            await cache.clear(self._db)
+        return count
 
 
 class DeleteQuery(AwaitableQuery):
@@ -1283,7 +1822,14 @@ class DeleteQuery(AwaitableQuery):
         return self._execute().__await__()
 
     async def _execute(self) -> int:
-        return (await self._db.execute_query(*self.query.get_parameterized_sql()))[0]
+        count = (await self._db.execute_query(*self.query.get_parameterized_sql()))[0]
+        RESULT_CACHE.invalidate(
+            self.model._meta.db_table, *related_tables(self.model), using_db=self._db
+        )
+        if (cache := self.model._meta.cache) is not None:
+            await cache.clear(self._db)
+        await invalidate_related(self.model, self._db)
+        return count
 
 
 class ExistsQuery(AwaitableQuery):
@@ -1301,6 +1847,7 @@ class ExistsQuery(AwaitableQuery):
         custom_filters: dict[str, FilterInfoDict],
         force_indexes: set[str],
         use_indexes: set[str],
+        result_cache: ResultCacheOptions | None = None,
     ) -> None:
         super().__init__(model)
         self._q_objects = q_objects
@@ -1309,6 +1856,7 @@ class ExistsQuery(AwaitableQuery):
         self._custom_filters = custom_filters
         self._force_indexes = force_indexes
         self._use_indexes = use_indexes
+        self._result_cache = result_cache
 
     def _make_query(self) -> None:
         self.query = copy(self.model._meta.basequery)
@@ -1326,6 +1874,10 @@ class ExistsQuery(AwaitableQuery):
     def __await__(self) -> Generator[Any, None, bool]:
         self._choose_db_if_not_chosen()
         self._make_query()
+        if self._use_result_cache():
+            return self._execute_result_cached(
+                self._execute, *self.query.get_parameterized_sql()
+            ).__await__()
         return self._execute().__await__()
 
     async def _execute(
@@ -1354,6 +1906,7 @@ class CountQuery(AwaitableQuery):
         offset: int | None,
         force_indexes: set[str],
         use_indexes: set[str],
+        result_cache: ResultCacheOptions | None = None,
     ) -> None:
         super().__init__(model)
         self._q_objects = q_objects
@@ -1364,6 +1917,7 @@ class CountQuery(AwaitableQuery):
         self._db = db
         self._force_indexes = force_indexes
         self._use_indexes = use_indexes
+        self._result_cache = result_cache
 
     def _make_query(self) -> None:
         self.query = copy(self.model._meta.basequery)
@@ -1386,6 +1940,10 @@ class CountQuery(AwaitableQuery):
     def __await__(self) -> Generator[Any, None, int]:
         self._choose_db_if_not_chosen()
         self._make_query()
+        if self._use_result_cache():
+            return self._execute_result_cached(
+                self._execute, *self.query.get_parameterized_sql(), (self._limit, self._offset)
+            ).__await__()
         return self._execute().__await__()
 
     async def _execute(self) -> int:
@@ -1544,6 +2102,7 @@ class ValuesListQuery(FieldSelectQuery, Generic[SINGLE]):
         group_bys: tuple[str, ...],
         force_indexes: set[str],
         use_indexes: set[str],
+        result_cache: ResultCacheOptions | None = None,
     ) -> None:
         super().__init__(model, annotations)
         if flat and (len(fields_for_select_list) != 1):
@@ -1565,6 +2124,7 @@ class ValuesListQuery(FieldSelectQuery, Generic[SINGLE]):
         self._group_bys = group_bys
         self._force_indexes = force_indexes
         self._use_indexes = use_indexes
+        self._result_cache = result_cache
 
     def _make_query(self) -> None:
         self._joined_tables = []
@@ -1610,25 +2170,47 @@ class ValuesListQuery(FieldSelectQuery, Generic[SINGLE]):
     def __await__(self) -> Generator[Any, None, list[Any] | tuple[Any, ...]]:
         self._choose_db_if_not_chosen()
         self._make_query()
+        if self._use_result_cache():
+            return self._execute_result_cached(
+                self._execute,
+                *self.query.get_parameterized_sql(),
+                (self._single, self._raise_does_not_exist, self._flat),
+            ).__await__()
         return self._execute().__await__()  # pylint: disable=E1101
 
     async def __aiter__(self: ValuesListQuery[Any]) -> AsyncIterator[Any]:
         for val in await self:
             yield val
 
-    async def _execute(self) -> list[Any] | tuple:
-        _, result = await self._db.execute_query(*self.query.get_parameterized_sql())
+    async def iterator(self, fetch_size: int | None = None) -> AsyncIterator[Any]:
+        """
+        Streams the values from the DB in batches of ``fetch_size`` rows instead of
+        loading them all at once.
+
+        :param fetch_size: Number of rows fetched from the DB per batch.
+        """
+        self._choose_db_if_not_chosen()
+        self._make_query()
+        convert = self._make_row_converter()
+        async for result in self._db.execute_query_stream(
+            *self.query.get_parameterized_sql(), fetch_size=fetch_size
+        ):
+            for entry in result:
+                yield convert(entry)
+
+    def _make_row_converter(self) -> Callable[[Any], Any]:
         columns = [
             (key, self.resolve_to_python_value(self.model, name))
             for key, name in self.fields.items()
         ]
         if self._flat:
             func = columns[0][1]
-            flatmap = lambda entry: func(entry["0"])  # noqa
-            lst_values = list(map(flatmap, result))
-        else:
-            listmap = lambda entry: tuple(func(entry[column]) for column, func in columns)  # noqa
-            lst_values = list(map(listmap, result))
+            return lambda entry: func(entry["0"])
+        return lambda entry: tuple(func(entry[column]) for column, func in columns)
+
+    async def _execute(self) -> list[Any] | tuple:
+        _, result = await self._db.execute_query(*self.query.get_parameterized_sql())
+        lst_values = list(map(self._make_row_converter(), result))
 
         if self._single:
             if len(lst_values) == 1:
@@ -1672,6 +2254,7 @@ class ValuesQuery(FieldSelectQuery, Generic[SINGLE]):
         group_bys: tuple[str, ...],
         force_indexes: set[str],
         use_indexes: set[str],
+        result_cache: ResultCacheOptions | None = None,
     ) -> None:
         super().__init__(model, annotations)
         self._fields_for_select = fields_for_select
@@ -1687,6 +2270,7 @@ class ValuesQuery(FieldSelectQuery, Generic[SINGLE]):
         self._group_bys = group_bys
         self._force_indexes = force_indexes
         self._use_indexes = use_indexes
+        self._result_cache = result_cache
 
     def _make_query(self) -> None:
         self._joined_tables = []
@@ -1740,15 +2324,39 @@ class ValuesQuery(FieldSelectQuery, Generic[SINGLE]):
     ) -> Generator[Any, None, list[dict[str, Any]] | dict[str, Any]]:
         self._choose_db_if_not_chosen()
         self._make_query()
+        if self._use_result_cache():
+            return self._execute_result_cached(
+                self._execute,
+                *self.query.get_parameterized_sql(),
+                (self._single, self._raise_does_not_exist),
+            ).__await__()
         return self._execute().__await__()  # pylint: disable=E1101
 
     async def __aiter__(self: ValuesQuery[Any]) -> AsyncIterator[dict[str, Any]]:
         for val in await self:
             yield val
 
-    async def _execute(self) -> list[dict] | dict:
-        result = await self._db.execute_query_dict(*self.query.get_parameterized_sql())
-        columns = [
+    async def iterator(self, fetch_size: int | None = None) -> AsyncIterator[dict[str, Any]]:
+        """
+        Streams the dicts from the DB in batches of ``fetch_size`` rows instead of
+        loading them all at once.
+
+        :param fetch_size: Number of rows fetched from the DB per batch.
+        """
+        self._choose_db_if_not_chosen()
+        self._make_query()
+        columns = self._get_converted_columns()
+        async for result in self._db.execute_query_stream(
+            *self.query.get_parameterized_sql(), fetch_size=fetch_size
+        ):
+            for entry in result:
+                row = dict(entry)
+                for col, func in columns:
+                    row[col] = func(row[col])
+                yield row
+
+    def _get_converted_columns(self) -> list[tuple[str, Callable]]:
+        return [
             val
             for val in [
                 (alias, self.resolve_to_python_value(self.model, field_name))
@@ -1757,6 +2365,10 @@ class ValuesQuery(FieldSelectQuery, Generic[SINGLE]):
             if not isinstance(val[1], types.LambdaType)
         ]
 
+    async def _execute(self) -> list[dict] | dict:
+        result = await self._db.execute_query_dict(*self.query.get_parameterized_sql())
+        columns = self._get_converted_columns()
+
         if columns:
             for row in result:
                 for col, func in columns:
@@ -1825,6 +2437,42 @@ class BulkUpdateQuery(UpdateQuery, Generic[MODEL]):
         self._queries: list[QueryBuilder] = []
 
     def _make_queries(self) -> list[tuple[str, list[Any]]]:
+        if self._q_objects or self._limit:
+            # Only the CASE form can filter or limit the updated rows
+            return self._make_case_queries()
+        meta = self.model._meta
+        fields = [
+            (
+                meta.fields_map[field].source_field
+                if field in meta.fk_fields or field in meta.o2o_fields
+                else field
+            )
+            for field in self.fields
+        ]
+        fields_map = meta.fields_map
+        values_lists = [
+            [meta.pk.to_db_value(obj.pk, obj)]
+            + [fields_map[field].to_db_value(getattr(obj, field), obj) for field in fields]
+            for obj in self._objects
+        ]
+        executor = self._db.executor_class(model=self.model, db=self._db)
+        # As many objects as the parameters of a query allow
+        rows = max(self._db.capabilities.max_query_params // (len(fields) + 1), 1)
+        if self._batch_size:
+            rows = min(rows, self._batch_size)
+        if executor.get_bulk_update_sql(fields, rows) is None:
+            # A CASE per field, with the parameters of a WHEN for every field and object
+            # and of the primary keys
+            rows = max(self._db.capabilities.max_query_params // (len(fields) * 2 + 1), 1)
+            return self._make_case_queries(min(rows, self._batch_size or rows))
+        queries = []
+        for start in range(0, len(values_lists), rows):
+            values_chunk = values_lists[start : start + rows]
+            sql = cast(str, executor.get_bulk_update_sql(fields, len(values_chunk)))
+            queries.append((sql, [value for values in values_chunk for value in values]))
+        return queries
+
+    def _make_case_queries(self, batch_size: int | None = None) -> list[tuple[str, list[Any]]]:
         table = self.model._meta.basetable
         self.query = self._db.query_class.update(table)
         if self.capabilities.support_update_limit_order_by and self._limit:
@@ -1837,10 +2485,12 @@ class BulkUpdateQuery(UpdateQuery, Generic[MODEL]):
             )
 
         self.resolve_filters()
+        # sql() may have built them already
+        self._queries = []
         pk_attr = self.model._meta.pk_attr
         source_pk_attr = self.model._meta.fields_map[pk_attr].source_field or pk_attr
         pk = Field(source_pk_attr)
-        for objects_item in chunk(self._objects, self._batch_size):
+        for objects_item in chunk(self._objects, batch_size or self._batch_size):
             query = copy(self.query)
             for field in self.fields:
                 case = Case()
@@ -1872,12 +2522,20 @@ class BulkUpdateQuery(UpdateQuery, Generic[MODEL]):
         count = 0
         for sql, values in queries_with_params:
             count += (await self._db.execute_query(sql, values))[0]
+        RESULT_CACHE.invalidate(self.model._meta.db_table, using_db=self._db)
+        if (cache := self.model._meta.cache) is not None:
+            await cache.invalidate(*(obj.pk for obj in self._objects), using_db=self._db)
         return count
 
+    async def _execute_bulk(self) -> int:
+        with phase(f"{self.model.__name__} bulk_update"):
+            with phase("compile"):
+                queries = self._make_queries()
+            return await self._execute_many(queries)
+
     def __await__(self) -> Generator[Any, Any, int]:
         self._choose_db_if_not_chosen(True)
-        queries = self._make_queries()
-        return self._execute_many(queries).__await__()
+        return self._execute_bulk().__await__()
 
     def sql(self, params_inline=False) -> str:
         self._choose_db_if_not_chosen()
@@ -1894,6 +2552,8 @@ class BulkCreateQuery(AwaitableQuery, Generic[MODEL]):
         "_executor",
         "_update_fields",
         "_on_conflict",
+        "_method",
+        "_return_pks",
     )
 
     def __init__(
@@ -1905,6 +2565,8 @@ class BulkCreateQuery(AwaitableQuery, Generic[MODEL]):
         ignore_conflicts: bool = False,
         update_fields: Iterable[str] | None = None,
         on_conflict: Iterable[str] | None = None,
+        method: str = "insert",
+        return_pks: bool = False,
     ):
         super().__init__(model)
         self._objects = objects
@@ -1913,77 +2575,130 @@ class BulkCreateQuery(AwaitableQuery, Generic[MODEL]):
         self._db = db
         self._update_fields = update_fields
         self._on_conflict = on_conflict
+        self._method = method
+        self._return_pks = return_pks
 
-    def _make_queries(self) -> tuple[str, str]:
-        self._executor = self._db.executor_class(model=self.model, db=self._db)
-        if self._ignore_conflicts or self._update_fields:
-            _, columns = self._executor._prepare_insert_columns()
-            insert_query = self._executor._prepare_insert_statement(
-                columns, ignore_conflicts=self._ignore_conflicts
-            )
-            insert_query_all = insert_query
-            if self.model._meta.generated_db_fields:
-                _, columns_all = self._executor._prepare_insert_columns(include_generated=True)
-                insert_query_all = self._executor._prepare_insert_statement(
-                    columns_all,
-                    has_generated=False,
-                    ignore_conflicts=self._ignore_conflicts,
-                )
-            if self._update_fields:
-                alias = f"new_{self.model._meta.db_table}"
-                insert_query_all = insert_query_all.as_(alias).on_conflict(
-                    *(self._on_conflict or [])
-                )
-                insert_query = insert_query.as_(alias).on_conflict(*(self._on_conflict or []))
-                for update_field in self._update_fields:
-                    insert_query_all = insert_query_all.do_update(update_field)
-                    insert_query = insert_query.do_update(update_field)
-            return insert_query.get_sql(), insert_query_all.get_sql()
-        else:
-            return self._executor.insert_query, self._executor.insert_query_all
+    def _make_insert_query(self, columns: list[str], rows: int = 1) -> str:
+        query = self._executor._prepare_bulk_insert_statement(
+            columns, rows, ignore_conflicts=self._ignore_conflicts
+        )
+        if self._update_fields:
+            alias = f"new_{self.model._meta.db_table}"
+            query = query.as_(alias).on_conflict(*(self._on_conflict or []))
+            for update_field in self._update_fields:
+                query = query.do_update(update_field)
+        return query.get_sql()
+
+    def _returns_pks(self) -> bool:
+        # With conflicts handling some rows may be skipped or updated,
+        # so the returned keys can't be matched to the objects
+        return (
+            not self._ignore_conflicts
+            and not self._update_fields
+            and self._executor._can_return_pks()
+        )
 
-    async def _execute_many(self, insert_sql: str, insert_sql_all: str) -> None:
-        fields_map = self.model._meta.fields_map
+    def _sql_for(self, regular_columns: list[str], count: int, returning: bool) -> str:
+        columns = [self.model._meta.fields_db_projection[c] for c in regular_columns]
+        rows = self._executor._bulk_insert_rows(len(columns), self._batch_size)
+        if rows == 1 or not columns:
+            return self._make_insert_query(columns)
+        sql = self._make_insert_query(columns, min(rows, count))
+        if returning:
+            sql = self._executor._add_insert_returning(sql, self.model._meta.db_pk_column)
+        return sql
+
+    async def _execute_many(self) -> None:
+        executor = self._executor
+        db_projection = self.model._meta.fields_db_projection
+        columns = [db_projection[c] for c in executor.regular_columns]
+        columns_all = [db_projection[c] for c in executor.regular_columns_all]
+        returning = self._returns_pks()
         for instance_chunk in chunk(self._objects, self._batch_size):
-            values_lists_all = []
-            values_lists = []
+            instances_all = []
+            instances = []
             for instance in instance_chunk:
                 if instance._custom_generated_pk:
-                    values_lists_all.append(
-                        [
-                            fields_map[field_name].to_db_value(
-                                getattr(instance, field_name), instance
-                            )
-                            for field_name in self._executor.regular_columns_all
-                        ]
-                    )
+                    instances_all.append(instance)
                 else:
-                    values_lists.append(
-                        [
-                            fields_map[field_name].to_db_value(
-                                getattr(instance, field_name), instance
-                            )
-                            for field_name in self._executor.regular_columns
-                        ]
-                    )
-            if values_lists_all:
-                await self._db.execute_many(insert_sql_all, values_lists_all)
-            if values_lists:
-                await self._db.execute_many(insert_sql, values_lists)
+                    instances.append(instance)
+            if self._method == "copy":
+                await self._execute_copy(instances, instances_all)
+                continue
+            if instances_all:
+                await executor._execute_bulk_insert(
+                    lambda rows: self._make_insert_query(columns_all, rows),
+                    executor.regular_columns_all,
+                    instances_all,
+                    self._batch_size,
+                )
+            if instances:
+                await executor._execute_bulk_insert(
+                    lambda rows: self._make_insert_query(columns, rows),
+                    executor.regular_columns,
+                    instances,
+                    self._batch_size,
+                    returning=returning,
+                )
+
+    async def _execute_copy(self, instances: list[MODEL], instances_all: list[MODEL]) -> None:
+        meta = self.model._meta
+        if instances_all:
+            await self._db.execute_copy(
+                meta.db_table,
+                [meta.fields_db_projection[c] for c in self._executor.regular_columns_all],
+                self._values_lists(self._executor.regular_columns_all, instances_all),
+                schema=meta.schema,
+            )
+        if instances:
+            pks = await self._db.execute_copy(
+                meta.db_table,
+                [meta.fields_db_projection[c] for c in self._executor.regular_columns],
+                self._values_lists(self._executor.regular_columns, instances),
+                returning=meta.db_pk_column if self._return_pks else None,
+                schema=meta.schema,
+            )
+            for instance, pk in zip(instances, pks):
+                instance.pk = meta.pk.to_python_value(pk)
+                instance._saved_in_db = True
+
+    def _values_lists(self, regular_columns: list[str], instances: list[MODEL]) -> list[list]:
+        fields_map = self.model._meta.fields_map
+        return [
+            [
+                fields_map[field_name].to_db_value(getattr(instance, field_name), instance)
+                for field_name in regular_columns
+            ]
+            for instance in instances
+        ]
 
     def __await__(self) -> Generator[Any, None, None]:
         self._choose_db_if_not_chosen(True)
-        insert_sql, insert_sql_all = self._make_queries()
-        return self._execute_many(insert_sql, insert_sql_all).__await__()
+        self._executor = self._db.executor_class(model=self.model, db=self._db)
+        return self._execute_bulk().__await__()
+
+    async def _execute_bulk(self) -> None:
+        with phase(f"{self.model.__name__} bulk_create"):
+            await self._execute_many()
+        RESULT_CACHE.invalidate(self.model._meta.db_table, using_db=self._db)
+        if self._update_fields and (cache := self.model._meta.cache) is not None:
+            # Conflicting rows were updated
+            await cache.clear(self._db)
 
     def sql(self, params_inline=False) -> str:
         self._choose_db_if_not_chosen()
-        insert_sql, insert_sql_all = self._make_queries()
+        self._executor = self._db.executor_class(model=self.model, db=self._db)
+        custom_pk_count = sum(1 for o in self._objects if o._custom_generated_pk)
+        generated_pk_count = sum(1 for o in self._objects if not o._custom_generated_pk)
+        insert_sql_all = self._sql_for(self._executor.regular_columns_all, custom_pk_count, False)
+        insert_sql = self._sql_for(
+            self._executor.regular_columns, generated_pk_count, self._returns_pks()
+        )
 
-        if all(o._custom_generated_pk for o in self._objects):
+        if not generated_pk_count:
             return insert_sql_all
 
-        if all(not o._custom_generated_pk for o in self._objects):
+        if not custom_pk_count:
             return insert_sql
 
         return ";".join([insert_sql, insert_sql_all])
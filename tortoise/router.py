@@ -1,22 +1,259 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
+import random
+import time
 from collections.abc import Callable
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 
+from tortoise.backends.base.client import TransactionalDBClient
 from tortoise.connection import connections
 from tortoise.exceptions import ConfigurationError
+from tortoise.log import logger
 
 if TYPE_CHECKING:
     from tortoise import BaseDBAsyncClient, Model
 
+#: Weight of the latest health-check round trip in the smoothed latency of a replica
+LATENCY_SMOOTHING = 0.3
+
+
+class ReplicaState:
+    """
+    Health of a replica as seen by the last health checks.
+
+    .. attribute:: healthy
+
+        If reads are routed to the replica
+
+    .. attribute:: latency
+
+        Smoothed round trip of the health-check query in seconds, ``None`` until checked
+
+    .. attribute:: failures
+
+        Number of consecutive failed health checks
+    """
+
+    __slots__ = ("alias", "healthy", "latency", "failures")
+
+    def __init__(self, alias: str) -> None:
+        self.alias = alias
+        self.healthy = True
+        self.latency: float | None = None
+        self.failures = 0
+
+
+class ReplicaSet:
+    """
+    A primary connection with read replicas.
+
+    Reads of the models stored on the primary are spread over the healthy replicas,
+    according to ``balancing``:
+
+    * ``"round_robin"``: the replicas take turns.
+    * ``"least_outstanding"``: the replica with the fewest queries in flight.
+    * ``"latency"``: a random replica, weighted by the inverse of its health-check latency.
+
+    Reads go to the primary instead inside a transaction on the primary, for
+    ``read_after_write`` seconds after a write in the same context, and when no replica
+    is healthy.
+
+    :param primary: Connection alias of the primary.
+    :param replicas: Connection aliases of the replicas.
+    :param balancing: The strategy to spread reads over the replicas.
+    :param health_check_interval: Seconds between health checks of the replicas,
+        ``0`` disables the checks.
+    :param health_check_timeout: Seconds after which a replica that didn't answer the
+        health check is ejected.
+    :param read_after_write: Seconds during which reads stay on the primary after a write.
+    :raises ConfigurationError: If the options are invalid.
+    """
+
+    strategies = ("round_robin", "least_outstanding", "latency")
+
+    def __init__(
+        self,
+        primary: str,
+        replicas: list[str],
+        balancing: str = "round_robin",
+        health_check_interval: float = 30.0,
+        health_check_timeout: float = 5.0,
+        read_after_write: float = 0.0,
+    ) -> None:
+        if not replicas:
+            raise ConfigurationError(f"Replica set of '{primary}' must define replicas")
+        if primary in replicas:
+            raise ConfigurationError(f"Connection '{primary}' can't be its own replica")
+        if balancing not in self.strategies:
+            raise ConfigurationError(
+                f"Unknown balancing '{balancing}', must be one of {', '.join(self.strategies)}"
+            )
+        self.primary = primary
+        self.replicas = [ReplicaState(alias) for alias in replicas]
+        self.balancing = balancing
+        self.health_check_interval = health_check_interval
+        self.health_check_timeout = health_check_timeout
+        self.read_after_write = read_after_write
+        self._last_write: ContextVar[float] = ContextVar(
+            f"_last_write_{primary}", default=float("-inf")
+        )
+        self._turn = itertools.count()
+        self._checked_at = float("-inf")
+        self._check_task: asyncio.Task | None = None
+
+    @classmethod
+    def from_config(cls, primary: str, config: list[str] | dict[str, Any]) -> ReplicaSet:
+        """
+        Creates the replica set from its config, either the list of replica aliases or a
+        dict with the ``replicas`` and the other options.
+        """
+        if isinstance(config, (list, tuple)):
+            return cls(primary, list(config))
+        if not isinstance(config, dict) or "replicas" not in config:
+            raise ConfigurationError(f"Replica set of '{primary}' must define replicas")
+        try:
+            return cls(primary, **config)
+        except TypeError as e:
+            raise ConfigurationError(f"Invalid replica set of '{primary}': {e}")
+
+    def _pinned_to_primary(self) -> bool:
+        if isinstance(connections._get_storage().get(self.primary), TransactionalDBClient):
+            return True
+        return time.monotonic() - self._last_write.get() < self.read_after_write
+
+    def db_for_read(self) -> str:
+        """
+        Returns the alias of the connection to read from.
+        """
+        if self._pinned_to_primary():
+            return self.primary
+        self._schedule_check()
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy:
+            return self.primary
+        turn = next(self._turn) % len(healthy)
+        if self.balancing == "round_robin" or len(healthy) == 1:
+            return healthy[turn].alias
+        if self.balancing == "least_outstanding":
+            # Starting from the replica whose turn it is spreads the ties
+            candidates = healthy[turn:] + healthy[:turn]
+            return min(candidates, key=lambda r: connections.get(r.alias).outstanding).alias
+        latencies = [r.latency for r in healthy if r.latency is not None]
+        default = sum(latencies) / len(latencies) if latencies else 1.0
+        weights = [1 / max(default if r.latency is None else r.latency, 1e-6) for r in healthy]
+        return random.choices(healthy, weights)[0].alias  # nosec
+
+    def db_for_write(self) -> str:
+        """
+        Returns the alias of the primary, and pins the reads of the current context to it
+        for ``read_after_write`` seconds.
+        """
+        if self.read_after_write:
+            self._last_write.set(time.monotonic())
+        return self.primary
+
+    def _schedule_check(self) -> None:
+        if not self.health_check_interval or (
+            self._check_task is not None and not self._check_task.done()
+        ):
+            return
+        if time.monotonic() - self._checked_at < self.health_check_interval:
+            return
+        try:
+            self._check_task = asyncio.get_running_loop().create_task(self.check())
+        except RuntimeError:
+            # No running event loop, the next read will check
+            pass
+
+    async def _check_replica(self, replica: ReplicaState) -> None:
+        start = time.monotonic()
+        try:
+            client = connections.get(replica.alias)
+            await asyncio.wait_for(
+                client.execute_query(client.ping_query), self.health_check_timeout
+            )
+        except Exception as e:
+            replica.failures += 1
+            if replica.healthy:
+                logger.warning("Replica '%s' ejected: %r", replica.alias, e)
+            replica.healthy = False
+            return
+        rtt = time.monotonic() - start
+        replica.latency = (
+            rtt
+            if replica.latency is None
+            else LATENCY_SMOOTHING * rtt + (1 - LATENCY_SMOOTHING) * replica.latency
+        )
+        replica.failures = 0
+        if not replica.healthy:
+            logger.info("Replica '%s' restored", replica.alias)
+        replica.healthy = True
+
+    async def check(self) -> None:
+        """
+        Runs the health check query on every replica, ejecting the ones that fail
+        and restoring the ones that answer again.
+        """
+        self._checked_at = time.monotonic()
+        await asyncio.gather(*(self._check_replica(replica) for replica in self.replicas))
+
+    def close(self) -> None:
+        """
+        Cancels the running health check, if any.
+        """
+        if self._check_task is not None:
+            self._check_task.cancel()
+            self._check_task = None
+
+    def status(self) -> dict[str, dict[str, Any]]:
+        """
+        Returns the health, latency and outstanding queries of every replica.
+        """
+        return {
+            replica.alias: {
+                "healthy": replica.healthy,
+                "latency": replica.latency,
+                "failures": replica.failures,
+                "outstanding": connections.get(replica.alias).outstanding,
+            }
+            for replica in self.replicas
+        }
+
 
 class ConnectionRouter:
     def __init__(self) -> None:
         self._routers: list[type] = None  # type: ignore
+        self.replica_sets: dict[str, ReplicaSet] = {}
 
     def init_routers(self, routers: list[Callable]) -> None:
         self._routers = [r() for r in routers]
 
+    def init_replicas(self, replicas: dict[str, list[str] | dict[str, Any]] | None) -> None:
+        """
+        Sets up the replica sets, keyed by the alias of their primary connection.
+
+        :raises ConfigurationError: If a replica set is invalid or uses an unknown connection.
+        """
+        self.close()
+        replica_sets = {
+            primary: ReplicaSet.from_config(primary, config)
+            for primary, config in (replicas or {}).items()
+        }
+        for replica_set in replica_sets.values():
+            for alias in [replica_set.primary, *(r.alias for r in replica_set.replicas)]:
+                connections._get_db_info(alias)
+        self.replica_sets = replica_sets
+
+    def close(self) -> None:
+        """
+        Cancels the running health checks of the replica sets.
+        """
+        for replica_set in self.replica_sets.values():
+            replica_set.close()
+
     def _router_func(self, model: type[Model], action: str) -> Any:
         for r in self._routers:
             try:
@@ -30,8 +267,20 @@ class ConnectionRouter:
                     return chosen_db
 
     def _db_route(self, model: type[Model], action: str) -> BaseDBAsyncClient | None:
+        chosen_db: str | None = self._router_func(model, action)
+        alias = chosen_db or model._meta.default_connection
+        if self.replica_sets and alias is not None:
+            replica_set = self.replica_sets.get(alias)
+            if replica_set is not None:
+                chosen_db = (
+                    replica_set.db_for_write()
+                    if action == "db_for_write"
+                    else replica_set.db_for_read()
+                )
+        if chosen_db is None:
+            return None
         try:
-            return connections.get(self._router_func(model, action))
+            return connections.get(chosen_db)
         except ConfigurationError:
             return None
 
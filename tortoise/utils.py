@@ -4,6 +4,7 @@ import sys
 from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
+from tortoise.filters import is_large_list
 from tortoise.log import logger
 
 if sys.version_info >= (3, 12):
@@ -55,3 +56,15 @@ def chunk(instances: Iterable[Any], batch_size: int | None = None) -> Iterable[I
         yield instances
     else:
         yield from batched(instances, batch_size)
+
+
+def chunk_in_list(values: Iterable[Any], db: BaseDBAsyncClient) -> Iterable[Iterable[Any]]:
+    """
+    Generate the chunks of the values of an ``__in`` filter that fit in a query,
+    leaving half of the bind parameters to the other filters of the query,
+    or all the values at once if the dialect binds them as a single parameter
+    """
+    values = list(values)
+    if is_large_list(values, db.executor_class.IN_LIST_PARAM_TYPES):
+        return [values]
+    return chunk(values, max(db.capabilities.max_query_params // 2, 1))